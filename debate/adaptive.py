@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import itertools
+import json
+import random
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from debate.deps import digest
+from debate_runner import (
+    DebateConfig,
+    DebateResult,
+    build_facts,
+    build_graph,
+    collect_result,
+    compile_summary,
+    run_debate,
+    select_configs,
+    write_atomic,
+)
+
+
+STATE_FILENAME = "adaptive.json"
+AGENT_MODES = ("two_agent", "full")  # cheapest first
+
+
+@dataclass(frozen=True)
+class Arm:
+    """One topology: the ``DebateConfig`` toggles the router may change for a job."""
+
+    agent_mode: str
+    include_synthesizer: bool
+    include_devil: bool
+    rounds: int
+
+    @classmethod
+    def of(cls, config: DebateConfig) -> "Arm":
+        return cls(config.agent_mode, config.include_synthesizer, config.include_devil, config.rounds)
+
+    @property
+    def label(self) -> str:
+        return f"{self.agent_mode}/syn{int(self.include_synthesizer)}/dev{int(self.include_devil)}/r{self.rounds}"
+
+    def turns(self) -> int:
+        # Researcher, critic and revision every round, the optional agents, then the verdict.
+        return self.rounds * (3 + self.include_synthesizer + self.include_devil) + 1
+
+    def personas(self) -> int:
+        # In two_agent mode the critic also delivers the verdict.
+        return (2 if self.agent_mode == "two_agent" else 3) + self.include_synthesizer + self.include_devil
+
+    def cost(self) -> Tuple[int, int]:
+        return self.turns(), self.personas()
+
+    def apply(self, config: DebateConfig) -> DebateConfig:
+        return dataclasses.replace(config, **dataclasses.asdict(self))
+
+
+def candidate_arms(reference: Arm) -> List[Arm]:
+    """Every topology that drops agents or rounds from ``reference``, cheapest first (``reference`` last)."""
+    modes = AGENT_MODES[: AGENT_MODES.index(reference.agent_mode) + 1]
+    arms = [
+        Arm(mode, synth, devil, rounds)
+        for mode, synth, devil, rounds in itertools.product(
+            modes,
+            sorted({False, reference.include_synthesizer}),
+            sorted({False, reference.include_devil}),
+            range(1, reference.rounds + 1),
+        )
+    ]
+    return sorted(arms, key=lambda arm: (arm.cost(), arm == reference))
+
+
+def agrees(candidate: DebateResult, reference: DebateResult, tolerance: int) -> bool:
+    if candidate.decision != reference.decision or candidate.consensus_reached != reference.consensus_reached:
+        return False
+    return all(abs(candidate.scores.get(key, 0) - value) <= tolerance for key, value in reference.scores.items())
+
+
+def scenario_key(config: DebateConfig) -> str:
+    # Arms are learned per scenario and per reference topology they stand in for.
+    return f"{digest([config.scenario, config.acceptance_criteria])}:{Arm.of(config).label}"
+
+
+@dataclass
+class Route:
+    arm: Arm
+    audit: bool
+
+
+@dataclass
+class TopologyBandit:
+    """Thompson sampling over topologies, constrained to arms that agree with the full debate.
+
+    Each arm keeps a Beta posterior over P(agrees with the reference run). A job goes to the cheapest
+    arm whose sampled agreement clears ``target``; the reference itself always qualifies. Audited jobs
+    also run the reference, deliver its result and update the arm, so exploration never changes an
+    answer; arms with fewer than ``min_audits`` observations are always audited.
+    """
+
+    target: float = 0.9
+    tolerance: int = 0
+    audit_rate: float = 0.1
+    min_audits: int = 3
+    seed: int = 0
+    stats: Dict[str, Dict[str, List[int]]] = field(default_factory=dict)  # scenario -> arm label -> [agreed, audits]
+
+    def __post_init__(self) -> None:
+        self.random = random.Random(self.seed)
+
+    def choose(self, config: DebateConfig) -> Route:
+        reference = Arm.of(config)
+        arms = self.stats.get(scenario_key(config), {})
+        for arm in candidate_arms(reference):
+            if arm == reference:
+                return Route(arm, audit=False)
+            agreed, audits = arms.get(arm.label, [0, 0])
+            if self.random.betavariate(1 + agreed, 1 + audits - agreed) >= self.target:
+                audit = audits < self.min_audits or self.random.random() < self.audit_rate
+                return Route(arm, audit)
+        raise AssertionError("candidate_arms always ends with the reference arm")
+
+    def update(self, config: DebateConfig, arm: Arm, agreed: bool) -> None:
+        counts = self.stats.setdefault(scenario_key(config), {}).setdefault(arm.label, [0, 0])
+        counts[0] += int(agreed)
+        counts[1] += 1
+
+    def trusted(self, config: DebateConfig) -> Optional[Arm]:
+        """Cheapest arm whose posterior mean clears ``target``, for reporting."""
+        arms = self.stats.get(scenario_key(config), {})
+        for arm in candidate_arms(Arm.of(config)):
+            agreed, audits = arms.get(arm.label, [0, 0])
+            if arm == Arm.of(config) or (audits and (1 + agreed) / (2 + audits) >= self.target):
+                return arm
+        return None
+
+    def save(self, path: Path) -> None:
+        write_atomic(path, json.dumps({"stats": self.stats}, indent=2, sort_keys=True))
+
+    def load(self, path: Path) -> None:
+        if path.exists():
+            self.stats = json.loads(path.read_text(encoding="utf-8"))["stats"]
+
+
+def simulate(config: DebateConfig, facts: Dict[str, Any]) -> DebateResult:
+    graph, initial_state, _ = build_graph(config, facts)
+    final_state = graph.compile(checkpointer=None).invoke(initial_state, {"recursion_limit": config.recursion_limit()})
+    return collect_result(config, final_state)
+
+
+@dataclass
+class RoutingReport:
+    jobs: int = 0
+    audits: int = 0
+    turns: int = 0
+    reference_turns: int = 0
+    routes: Dict[str, int] = field(default_factory=dict)
+    checked: int = 0
+    mismatches: int = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        saved = self.reference_turns - self.turns
+        return {
+            "jobs": self.jobs,
+            "audits": self.audits,
+            "turns": self.turns,
+            "reference_turns": self.reference_turns,
+            "turns_saved": saved,
+            "saved_pct": round(100.0 * saved / self.reference_turns, 1) if self.reference_turns else 0.0,
+            "routes": dict(sorted(self.routes.items())),
+            "checked": self.checked,
+            "delivered_mismatches": self.mismatches,
+        }
+
+
+def route_job(
+    bandit: TopologyBandit,
+    config: DebateConfig,
+    output_dir: Path,
+    facts: Dict[str, Any],
+    report: RoutingReport,
+    check: bool = False,
+) -> DebateResult:
+    """Run ``config`` on the arm the bandit picks and persist the delivered result under the job's key."""
+    route = bandit.choose(config)
+    reference = Arm.of(config)
+    delivered_arm = reference if route.audit else route.arm
+    report.jobs += 1
+    report.reference_turns += reference.turns()
+    report.routes[delivered_arm.label] = report.routes.get(delivered_arm.label, 0) + 1
+
+    if route.audit:
+        probe = simulate(route.arm.apply(config), facts)
+        delivered = run_debate(config, output_dir=output_dir)
+        bandit.update(config, route.arm, agrees(probe, delivered, bandit.tolerance))
+        report.audits += 1
+        report.turns += len(probe.transcript) + len(delivered.transcript)
+        return delivered
+
+    delivered = run_debate(delivered_arm.apply(config), output_dir=output_dir)
+    report.turns += len(delivered.transcript)
+    if check and delivered_arm != reference:
+        # Offline evaluation only: not counted as spend and not fed back to the bandit.
+        report.checked += 1
+        report.mismatches += not agrees(delivered, simulate(config, facts), bandit.tolerance)
+    return delivered
+
+
+def job_stream(preset_names: Optional[List[str]], seeds: int, rounds: int) -> List[DebateConfig]:
+    jobs = []
+    for seed in range(seeds):
+        for base in select_configs(preset_names):
+            base = dataclasses.replace(base, rounds=rounds) if rounds else base
+            jobs.append(dataclasses.replace(base, key=f"{base.key}_seed{seed}", seed=base.seed + seed))
+    return jobs
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Route debate jobs to the cheapest topology that agrees with the full run.")
+    parser.add_argument("--configs", nargs="*", default=None, help="Reference presets (default: all presets).")
+    parser.add_argument("--seeds", type=int, default=50, help="Jobs per preset, interleaved.")
+    parser.add_argument("--rounds", type=int, default=0, help="Override the reference round count (0 keeps the preset's).")
+    parser.add_argument("--output", default="/tmp/debate_adaptive", help="Where delivered runs and the bandit state go.")
+    parser.add_argument("--tolerance", type=int, default=0, help="Largest per-rubric score difference that still agrees.")
+    parser.add_argument("--target", type=float, default=0.9, help="Required agreement probability for a cheaper arm.")
+    parser.add_argument("--audit-rate", type=float, default=0.1, help="Share of routed jobs that also run the reference.")
+    parser.add_argument("--min-audits", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0, help="Seed for posterior sampling and audits.")
+    parser.add_argument("--fresh", action="store_true", help="Ignore bandit state saved by earlier sweeps.")
+    parser.add_argument("--check", action="store_true", help="Also run the reference for unaudited jobs to measure mismatches.")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    output_dir = Path(args.output)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    state_path = output_dir / STATE_FILENAME
+    bandit = TopologyBandit(args.target, args.tolerance, args.audit_rate, args.min_audits, args.seed)
+    if not args.fresh:
+        bandit.load(state_path)
+
+    facts = build_facts()
+    jobs = job_stream(args.configs, args.seeds, args.rounds)
+    report = RoutingReport()
+    results = [route_job(bandit, config, output_dir, facts, report, check=args.check) for config in jobs]
+    bandit.save(state_path)
+    compile_summary(results, output_dir)
+
+    references = {scenario_key(config): config for config in jobs}
+    trusted = {config.key.rsplit("_seed", 1)[0]: bandit.trusted(config) for config in references.values()}
+    print(json.dumps({
+        **report.as_dict(),
+        "trusted": {name: arm.label if arm else None for name, arm in trusted.items()},
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+"""Lockstep batching: advance many same-topology debates through one graph invocation.
+
+Batching is library-only. ``debate_runner`` cannot import this module (it imports ``debate_runner``),
+so sweeps opt in from Python with ``run_batched(configs, output_dir, lanes, pack=..., writer=...)``,
+or benchmark it with ``python -m debate.batch``. Results and artifacts match solo ``run_debate`` runs.
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import json
+import time
+from concurrent.futures import Executor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypedDict
+
+from langgraph.graph import StateGraph
+
+from debate.packs import PackWriter
+from debate.stepping import GraphTables, graph_tables
+from debate.writeback import WritePipeline
+from debate_runner import (
+    DebateConfig,
+    DebateResult,
+    DebateState,
+    LocalDebateModel,
+    attach_spill,
+    build_facts,
+    build_graph,
+    finish_run,
+    prepare_configs,
+    record_run,
+    run_debate,
+    topology_key,
+    transcript_payload,
+)
+
+
+class BatchState(TypedDict):
+    lanes: List[DebateState]
+
+
+def build_batch_graph(
+    lane_tables: List[GraphTables],
+    executor: Optional[Executor] = None,
+) -> StateGraph:
+    """Mirror one lane's topology with nodes that advance every lane per step.
+
+    With ``executor`` set, a step issues all lanes' calls at once so a batching backend can coalesce them.
+    """
+    template = lane_tables[0]
+
+    def batched_node(name: str) -> Callable[[BatchState], BatchState]:
+        fns = [tables.nodes[name] for tables in lane_tables]
+
+        def node(state: BatchState) -> BatchState:
+            lanes = state["lanes"]
+            if executor is None:
+                updates = [fn(lane) for fn, lane in zip(fns, lanes)]
+            else:
+                updates = list(executor.map(lambda fn, lane: fn(lane), fns, lanes))
+            return {"lanes": [{**lane, **update} for lane, update in zip(lanes, updates)]}
+
+        return node
+
+    def batched_route(name: str) -> Callable[[BatchState], str]:
+        routes = [tables.routers[name][0] for tables in lane_tables]
+
+        def route(state: BatchState) -> str:
+            targets = {route(lane) for route, lane in zip(routes, state["lanes"])}
+            if len(targets) != 1:
+                raise RuntimeError(f"Lanes disagree on the step after {name}: {sorted(targets)}")
+            return targets.pop()
+
+        return route
+
+    graph: StateGraph = StateGraph(BatchState)
+    for name in template.nodes:
+        graph.add_node(name, batched_node(name))
+    graph.set_entry_point(template.entry)
+    for src, dst in template.edges.items():
+        graph.add_edge(src, dst)
+    for src, (_, ends) in template.routers.items():
+        graph.add_conditional_edges(src, batched_route(src), ends)
+    return graph
+
+
+def run_batch(
+    configs: List[DebateConfig],
+    output_dir: Path,
+    pack: Optional[PackWriter] = None,
+    executor: Optional[Executor] = None,
+    model_factory: Optional[Callable[[DebateConfig, Dict[str, Any]], LocalDebateModel]] = None,
+    writer: Optional[WritePipeline] = None,
+) -> List[DebateResult]:
+    """Run same-topology debates as lanes of a single graph invocation; results match solo runs."""
+    if not configs:
+        return []
+    keys = {topology_key(config) for config in configs}
+    if len(keys) != 1:
+        raise ValueError("Lockstep lanes must share agent_mode, toggles, rounds, history_window and parallel_review.")
+    if configs[0].parallel_review and configs[0].include_devil:
+        raise ValueError("Lockstep batching needs a single-path topology; run parallel_review configs solo.")
+
+    started = time.perf_counter()
+    facts = build_facts()
+    lane_tables: List[GraphTables] = []
+    lane_specs = []
+    initial_lanes: List[DebateState] = []
+    spill_paths = []
+    models = []
+    for config in configs:
+        model = model_factory(config, facts) if model_factory else LocalDebateModel(config, facts)
+        models.append(model)
+        graph, initial_state, specs = build_graph(config, facts, model)
+        tables = graph_tables(graph)
+        if tables is None:
+            raise ValueError(f"Could not read the node tables of {config.key}'s graph.")
+        lane_tables.append(tables)
+        lane_specs.append(specs)
+        spill_paths.append(attach_spill(config, output_dir, initial_state))
+        initial_lanes.append(initial_state)
+
+    compiled = build_batch_graph(lane_tables, executor).compile(checkpointer=None)
+    final: BatchState = compiled.invoke({"lanes": initial_lanes}, {"recursion_limit": configs[0].recursion_limit()})
+
+    results = [
+        finish_run(config, lane, specs, output_dir, pack, spill_path, model, writer=writer)
+        for config, lane, specs, spill_path, model in zip(configs, final["lanes"], lane_specs, spill_paths, models)
+    ]
+    share = (time.perf_counter() - started) / len(results)
+    for result in results:
+        record_run(result, share)
+    return results
+
+
+def lockstep_groups(configs: List[DebateConfig], lanes: int) -> List[List[DebateConfig]]:
+    groups: Dict[Tuple[Any, ...], List[List[DebateConfig]]] = {}
+    for config in configs:
+        chunks = groups.setdefault(topology_key(config), [[]])
+        if len(chunks[-1]) >= lanes:
+            chunks.append([])
+        chunks[-1].append(config)
+    return [chunk for chunks in groups.values() for chunk in chunks]
+
+
+def run_batched(
+    configs: List[DebateConfig],
+    output_dir: Path,
+    lanes: int,
+    pack: Optional[PackWriter] = None,
+    writer: Optional[WritePipeline] = None,
+) -> List[DebateResult]:
+    """Group a sweep by topology into batches of ``lanes`` and return results in input order.
+
+    With ``writer``, artifacts are written on its threads; the caller flushes or closes it as usual.
+    """
+    by_key: Dict[str, DebateResult] = {}
+    for group in lockstep_groups(configs, lanes):
+        if group[0].parallel_review and group[0].include_devil:
+            batch = [run_debate(config, output_dir=output_dir, pack=pack, writer=writer) for config in group]
+        else:
+            batch = run_batch(group, output_dir, pack=pack, writer=writer)
+        by_key.update((result.config.key, result) for result in batch)
+    return [by_key[config.key] for config in configs]
+
+
+def seed_sweep(preset: str, seeds: int, rounds: int) -> List[DebateConfig]:
+    base = prepare_configs()[preset]
+    return [
+        dataclasses.replace(base, key=f"{base.key}_seed{seed}", seed=seed, rounds=rounds, rng="counter")
+        for seed in range(seeds)
+    ]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run a homogeneous seed sweep as lockstep lanes and compare to solo runs.")
+    parser.add_argument("--preset", default="baseline_full_lowtemp", help="Preset whose topology the sweep uses.")
+    parser.add_argument("--seeds", type=int, default=256, help="Debates in the sweep.")
+    parser.add_argument("--rounds", type=int, default=2)
+    parser.add_argument("--lanes", type=int, default=32, help="Debates advanced per graph invocation.")
+    parser.add_argument("--output", default="/tmp/debate_batch", help="Scratch directory for both sweeps.")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    configs = seed_sweep(args.preset, args.seeds, args.rounds)
+    output_dir = Path(args.output)
+
+    started = time.perf_counter()
+    solo = [run_debate(config, output_dir=output_dir / "solo") for config in configs]
+    solo_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    batched = run_batched(configs, output_dir / "batched", args.lanes)
+    batched_s = time.perf_counter() - started
+
+    report = {
+        "debates": len(configs),
+        "lanes": args.lanes,
+        "solo_s": round(solo_s, 2),
+        "batched_s": round(batched_s, 2),
+        "speedup": round(solo_s / batched_s, 2),
+        "identical_results": [transcript_payload(r) for r in solo] == [transcript_payload(r) for r in batched],
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
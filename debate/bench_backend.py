@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from debate.simbackend import (
+    DISTRIBUTIONS,
+    BackendStats,
+    LatencyProfile,
+    RetryPolicy,
+    SimulatedModel,
+    TokenBucket,
+)
+from debate.stats import percentile
+from debate_runner import DebateConfig, build_facts, build_graph, collect_result, select_configs
+
+
+def sweep_configs(preset_names: Optional[List[str]], seeds: int, parallel_review: bool) -> List[DebateConfig]:
+    configs = []
+    for base in select_configs(preset_names):
+        for seed in range(seeds):
+            config = dataclasses.replace(base, key=f"{base.key}_seed{seed}", seed=base.seed + seed)
+            if parallel_review:
+                config = dataclasses.replace(config, rng="counter", parallel_review=True)
+            configs.append(config)
+    return configs
+
+
+def run_simulated(
+    config: DebateConfig,
+    facts: Dict[str, Any],
+    profile: LatencyProfile,
+    stats: BackendStats,
+    retry: RetryPolicy,
+    bucket: Optional[TokenBucket],
+) -> Tuple[float, Optional[List[Dict[str, Any]]], str]:
+    model = SimulatedModel(config, facts, profile, stats=stats, retry=retry, bucket=bucket)
+    graph, initial_state, _ = build_graph(config, facts, model)
+    started = time.perf_counter()
+    try:
+        final_state = graph.compile(checkpointer=None).invoke(initial_state, {"recursion_limit": config.recursion_limit()})
+    except Exception as exc:
+        return time.perf_counter() - started, None, f"{type(exc).__name__}: {exc}"
+    return time.perf_counter() - started, collect_result(config, final_state).transcript, ""
+
+
+def reference_transcript(config: DebateConfig, facts: Dict[str, Any]) -> List[Dict[str, Any]]:
+    graph, initial_state, _ = build_graph(config, facts)
+    final_state = graph.compile(checkpointer=None).invoke(initial_state, {"recursion_limit": config.recursion_limit()})
+    return collect_result(config, final_state).transcript
+
+
+def run_level(
+    configs: List[DebateConfig],
+    workers: int,
+    profile: LatencyProfile,
+    retry: RetryPolicy,
+) -> Dict[str, Any]:
+    facts = build_facts()
+    stats = BackendStats()
+    bucket = TokenBucket(profile.tokens_per_minute) if profile.tokens_per_minute > 0 else None
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        outcomes = list(executor.map(lambda config: run_simulated(config, facts, profile, stats, retry, bucket), configs))
+    wall = time.perf_counter() - started
+
+    latencies = [latency for latency, transcript, _ in outcomes if transcript is not None]
+    failures = [error for _, transcript, error in outcomes if transcript is None]
+    identical = all(
+        transcript == reference_transcript(config, facts)
+        for config, (_, transcript, _) in zip(configs, outcomes)
+        if transcript is not None
+    )
+    return {
+        "workers": workers,
+        "debates": len(configs),
+        "completed": len(latencies),
+        "failed": len(failures),
+        "wall_s": round(wall, 2),
+        "throughput_per_s": round(len(latencies) / wall, 2) if wall else 0.0,
+        "debate_p50_s": round(percentile(latencies, 50), 3),
+        "debate_p95_s": round(percentile(latencies, 95), 3),
+        "debate_p99_s": round(percentile(latencies, 99), 3),
+        "identical_transcripts": identical,
+        "backend": stats.snapshot(),
+        "first_failure": failures[0] if failures else "",
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Drive debate sweeps against a simulated LLM backend.")
+    parser.add_argument("--configs", nargs="*", default=None, help="Preset keys to sweep (default: all presets).")
+    parser.add_argument("--seeds", type=int, default=8, help="Seed variants per preset.")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 16], help="Concurrency levels to measure.")
+    parser.add_argument("--parallel-review", action="store_true", help="Fan critic and devil out (switches rng to counter).")
+    parser.add_argument("--distribution", choices=DISTRIBUTIONS, default="lognormal")
+    parser.add_argument("--base-ms", type=float, default=40.0, help="Typical per-call latency.")
+    parser.add_argument("--spread", type=float, default=0.5, help="Lognormal sigma / uniform half-width fraction.")
+    parser.add_argument("--prompt-ms-per-1k", type=float, default=5.0, help="Prefill cost per 1k prompt tokens.")
+    parser.add_argument("--tokens-per-s", type=float, default=2000.0, help="Output decode rate (0 = free).")
+    parser.add_argument("--error-rate", type=float, default=0.02)
+    parser.add_argument("--timeout-rate", type=float, default=0.005)
+    parser.add_argument("--timeout-s", type=float, default=0.5, help="Time a timed-out attempt burns before retrying.")
+    parser.add_argument("--tpm", type=float, default=0.0, help="Shared prompt-token rate limit per minute (0 = off).")
+    parser.add_argument("--max-attempts", type=int, default=3)
+    parser.add_argument("--backoff-ms", type=float, default=20.0)
+    parser.add_argument("--seed", type=int, default=0, help="Seed for latency and fault sampling.")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    profile = LatencyProfile(
+        distribution=args.distribution,
+        base_ms=args.base_ms,
+        spread=args.spread,
+        prompt_ms_per_1k_tokens=args.prompt_ms_per_1k,
+        output_tokens_per_s=args.tokens_per_s,
+        error_rate=args.error_rate,
+        timeout_rate=args.timeout_rate,
+        timeout_s=args.timeout_s,
+        tokens_per_minute=args.tpm,
+        seed=args.seed,
+    )
+    retry = RetryPolicy(max_attempts=args.max_attempts, backoff_s=args.backoff_ms / 1000.0)
+    configs = sweep_configs(args.configs, args.seeds, args.parallel_review)
+    report = {
+        "profile": dataclasses.asdict(profile),
+        "retry": dataclasses.asdict(retry),
+        "levels": [run_level(configs, workers, profile, retry) for workers in args.workers],
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import json
+import time
+from typing import Any, Dict, List
+
+from debate.simbackend import LatencyProfile, SimulatedModel
+from debate_runner import (
+    DebateConfig,
+    build_facts,
+    build_graph,
+    collect_result,
+    prepare_configs,
+)
+
+
+def timed_run(config: DebateConfig, delay: float, repeats: int) -> Dict[str, Any]:
+    facts = build_facts()
+    timings: List[float] = []
+    transcript: List[Dict[str, Any]] = []
+    profile = LatencyProfile(distribution="constant", base_ms=delay * 1000)
+    for _ in range(repeats):
+        model = SimulatedModel(config, facts, profile)
+        graph, initial_state, _ = build_graph(config, facts, model)
+        compiled = graph.compile(checkpointer=None)
+        started = time.perf_counter()
+        final_state = compiled.invoke(initial_state, {"recursion_limit": config.recursion_limit()})
+        timings.append(time.perf_counter() - started)
+        transcript = collect_result(config, final_state).transcript
+    best = min(timings)
+    return {
+        "total_s": round(best, 3),
+        "per_round_ms": round(best / config.rounds * 1000, 1),
+        "transcript": transcript,
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Measure critic/devil fan-out against a simulated-latency backend.")
+    parser.add_argument("--delay", type=float, default=0.05, help="Seconds of simulated latency per agent turn.")
+    parser.add_argument("--rounds", type=int, default=4)
+    parser.add_argument("--repeats", type=int, default=3, help="Runs per mode; the fastest is reported.")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    base = dataclasses.replace(
+        prepare_configs()["toggle_high_temp_devil"],
+        rounds=args.rounds,
+        rng="counter",
+    )
+    sequential = timed_run(dataclasses.replace(base, parallel_review=False), args.delay, args.repeats)
+    parallel = timed_run(dataclasses.replace(base, parallel_review=True), args.delay, args.repeats)
+    report = {
+        "delay_per_turn_ms": args.delay * 1000,
+        "rounds": args.rounds,
+        "sequential": {key: value for key, value in sequential.items() if key != "transcript"},
+        "parallel": {key: value for key, value in parallel.items() if key != "transcript"},
+        "speedup": round(sequential["total_s"] / parallel["total_s"], 2),
+        "identical_transcripts": sequential["transcript"] == parallel["transcript"],
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
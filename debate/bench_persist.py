@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import hashlib
+import json
+import shutil
+import time
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Union
+
+import debate_runner
+from debate.writeback import WritePipeline
+from debate_runner import DebateConfig, compile_summary, run_debate, select_configs
+
+
+def sweep_configs(seeds: int, rounds: int) -> List[DebateConfig]:
+    return [
+        dataclasses.replace(base, key=f"{base.key}_seed{seed}", seed=base.seed + seed, rounds=rounds)
+        for seed in range(seeds)
+        for base in select_configs(None)
+    ]
+
+
+@contextmanager
+def slow_disk(delay: float) -> Iterator[None]:
+    """Add ``delay`` seconds to every artifact write, like a network volume or a disk syncing each file."""
+    original = debate_runner.write_atomic
+
+    def delayed(path: Path, content: Union[str, bytes]) -> int:
+        time.sleep(delay)
+        return original(path, content)
+
+    debate_runner.write_atomic = delayed
+    try:
+        yield
+    finally:
+        debate_runner.write_atomic = original
+
+
+def tree_digest(root: Path) -> Dict[str, str]:
+    return {
+        str(path.relative_to(root)): hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+        for path in sorted(root.rglob("*"))
+        if path.is_file()
+    }
+
+
+def timed_sweep(configs: List[DebateConfig], output_dir: Path, workers: int, queue_size: int) -> Dict[str, Any]:
+    shutil.rmtree(output_dir, ignore_errors=True)
+    output_dir.mkdir(parents=True)
+    stalled = 0.0
+    started = time.perf_counter()
+    with WritePipeline(workers, queue_size) if workers else nullcontext() as writer:
+        results = [run_debate(config, output_dir=output_dir, writer=writer) for config in configs]
+    compile_summary(results, output_dir)
+    wall = time.perf_counter() - started
+    if writer is not None:
+        stalled = writer.stalled_s
+    return {
+        "io_workers": workers,
+        "wall_s": round(wall, 2),
+        "runs_per_s": round(len(configs) / wall, 1),
+        "stalled_s": round(stalled, 2),
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare inline artifact writes with the background write pipeline.")
+    parser.add_argument("--seeds", type=int, default=40, help="Seed variants per preset.")
+    parser.add_argument("--rounds", type=int, default=4)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4], help="Pipeline writer threads to try.")
+    parser.add_argument("--queue", type=int, default=8, help="Pipeline queue bound.")
+    parser.add_argument("--slow-ms", type=float, default=5.0, help="Simulated latency per file on the slow disk.")
+    parser.add_argument("--output", default="/tmp/debate_bench_persist", help="Scratch directory (fast disk).")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    configs = sweep_configs(args.seeds, args.rounds)
+    root = Path(args.output)
+    disks = {"fast": nullcontext(), "slow": slow_disk(args.slow_ms / 1000.0)}
+
+    report: Dict[str, Any] = {"debates": len(configs), "rounds": args.rounds, "slow_ms_per_file": args.slow_ms}
+    for disk, context in disks.items():
+        with context:
+            inline = timed_sweep(configs, root / disk / "inline", 0, args.queue)
+            expected = tree_digest(root / disk / "inline")
+            levels = []
+            for workers in args.workers:
+                level = timed_sweep(configs, root / disk / f"pipeline{workers}", workers, args.queue)
+                level["speedup"] = round(inline["wall_s"] / level["wall_s"], 2)
+                level["identical_output"] = tree_digest(root / disk / f"pipeline{workers}") == expected
+                levels.append(level)
+        report[disk] = {"inline": inline, "pipeline": levels}
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import json
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from debate.transcript_reader import TranscriptReader
+from debate_runner import prepare_configs, run_debate
+
+
+def best_of(repeats: int, fn: Callable[[], Any]) -> float:
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def full_excerpt(run_dir: Path, round_number: int) -> Dict[str, Any]:
+    data = json.loads((run_dir / "transcript.json").read_text(encoding="utf-8"))
+    turns = [entry for entry in data["transcript"] if entry["round"] == round_number]
+    return {"scores": data["scores"], "decision": data["decision"], "turns": turns}
+
+
+def indexed_excerpt(run_dir: Path, round_number: int) -> Dict[str, Any]:
+    with TranscriptReader(run_dir) as reader:
+        return {
+            "scores": reader.field("scores"),
+            "decision": reader.field("decision"),
+            "turns": reader.turns(rounds=[round_number]),
+        }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark offset-indexed transcript reads against full JSON loads.")
+    parser.add_argument("--rounds", type=int, default=10_000, help="Rounds in the generated transcript.")
+    parser.add_argument("--output", default="/tmp/debate_bench_reader", help="Where the long run is written.")
+    parser.add_argument("--repeats", type=int, default=5)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    output_dir = Path(args.output)
+    config = dataclasses.replace(
+        prepare_configs()["toggle_high_temp_devil"],
+        key=f"long_{args.rounds}_rounds",
+        rounds=args.rounds,
+        rng="counter",
+        history_window=16,
+    )
+    started = time.perf_counter()
+    run_debate(config, output_dir=output_dir)
+    generate_s = time.perf_counter() - started
+    run_dir = output_dir / config.key
+
+    probes: List[int] = [1, args.rounds // 2, args.rounds]
+    for probe in probes:
+        if full_excerpt(run_dir, probe) != indexed_excerpt(run_dir, probe):
+            raise AssertionError(f"Indexed read disagrees with full load for round {probe}")
+
+    report: Dict[str, Any] = {
+        "rounds": args.rounds,
+        "transcript_bytes": (run_dir / "transcript.json").stat().st_size,
+        "generate_s": round(generate_s, 2),
+        "probes": {},
+    }
+    for probe in probes:
+        full_s = best_of(args.repeats, lambda: full_excerpt(run_dir, probe))
+        indexed_s = best_of(args.repeats, lambda: indexed_excerpt(run_dir, probe))
+        report["probes"][f"round_{probe}"] = {
+            "full_load_ms": round(full_s * 1000, 2),
+            "indexed_ms": round(indexed_s * 1000, 2),
+            "speedup": round(full_s / indexed_s, 1),
+        }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
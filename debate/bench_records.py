@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+from debate.records import Issue, Turn, issues_to_json, turns_to_json
+
+
+def load_samples(results_dir: Path) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    turns: List[Dict[str, Any]] = []
+    issues: List[Dict[str, Any]] = []
+    for transcript_path in sorted(results_dir.glob("*/transcript.json")):
+        data = json.loads(transcript_path.read_text(encoding="utf-8"))
+        turns.extend(data["transcript"])
+        issues.extend(data["open_issues"])
+    if not turns or not issues:
+        raise FileNotFoundError(f"No transcripts with turns and issues under {results_dir}")
+    return turns, issues
+
+
+def measure(build: Callable[[], List[Any]]) -> Tuple[List[Any], int, float]:
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    started = time.perf_counter()
+    items = build()
+    elapsed = time.perf_counter() - started
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    return items, retained, elapsed
+
+
+def bench_turns(samples: List[Dict[str, Any]], count: int) -> Dict[str, Any]:
+    # Content bodies are shared by both layouts, so only per-entry overhead is compared.
+    contents = [sample["content"] for sample in samples]
+    encoded = [
+        json.dumps({key: value for key, value in sample.items() if key != "content"})
+        for sample in samples
+    ]
+
+    def decode(idx: int) -> Dict[str, Any]:
+        entry = json.loads(encoded[idx % len(encoded)])
+        entry["round"] = idx % 10_000 + 1
+        entry["content"] = contents[idx % len(contents)]
+        return entry
+
+    dicts, dict_bytes, dict_time = measure(lambda: [decode(idx) for idx in range(count)])
+    reference = dicts[:1000]
+    del dicts
+
+    turns, turn_bytes, turn_time = measure(lambda: [Turn.from_dict(decode(idx)) for idx in range(count)])
+    lossless = turns_to_json(turns[:1000]) == reference
+    del turns
+
+    return {
+        "entries": count,
+        "dict_bytes_per_entry": round(dict_bytes / count, 1),
+        "slotted_bytes_per_entry": round(turn_bytes / count, 1),
+        "reduction": round(1 - turn_bytes / dict_bytes, 3),
+        "dict_build_s": round(dict_time, 2),
+        "slotted_build_s": round(turn_time, 2),
+        "lossless": lossless,
+    }
+
+
+def bench_issues(samples: List[Dict[str, Any]], count: int) -> Dict[str, Any]:
+    encoded = [json.dumps(sample) for sample in samples]
+
+    def decode(idx: int) -> Dict[str, Any]:
+        record = json.loads(encoded[idx % len(encoded)])
+        record["raised_round"] = idx % 10_000 + 1
+        return record
+
+    dicts, dict_bytes, _ = measure(lambda: [decode(idx) for idx in range(count)])
+    reference = dicts[:1000]
+    del dicts
+
+    issues, issue_bytes, _ = measure(lambda: [Issue.from_dict(decode(idx)) for idx in range(count)])
+    lossless = issues_to_json(issues[:1000]) == reference
+    del issues
+
+    return {
+        "entries": count,
+        "dict_bytes_per_entry": round(dict_bytes / count, 1),
+        "slotted_bytes_per_entry": round(issue_bytes / count, 1),
+        "reduction": round(1 - issue_bytes / dict_bytes, 3),
+        "lossless": lossless,
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare memory of dict vs slotted transcript records.")
+    parser.add_argument("--results", default="results", help="Directory with run transcripts to sample from.")
+    parser.add_argument("--entries", type=int, default=1_000_000, help="Records materialized per layout.")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    turn_samples, issue_samples = load_samples(Path(args.results))
+    report = {
+        "turns": bench_turns(turn_samples, args.entries),
+        "issues": bench_issues(issue_samples, args.entries),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+# Lists trimmed alongside the history; each keeps at least this many tail items in state because
+# the synthesizer quotes the last two resolved actions.
+MIN_TAIL = 2
+SPILLED_FIELDS = ("history", "resolved_actions", "convergence_notes", "round_snapshots")
+
+
+def empty_summary() -> Dict[str, Any]:
+    return {
+        "rounds_compacted": 0,
+        "turns_compacted": 0,
+        "open_issues": [],
+        "resolved_issues": {},
+        "resolved_actions_compacted": 0,
+        "convergence_counts": {},
+        "last_feedback": "",
+    }
+
+
+def fold_summary(
+    summary: Dict[str, Any],
+    folded_turns: List[Dict[str, Any]],
+    folded_actions: List[str],
+    folded_notes: List[str],
+    open_issues: List[Dict[str, Any]],
+) -> Dict[str, Any]:
+    updated = dict(summary) if summary else empty_summary()
+    updated["turns_compacted"] += len(folded_turns)
+    if folded_turns:
+        updated["rounds_compacted"] = max(updated["rounds_compacted"], max(turn["round"] for turn in folded_turns))
+    for turn in folded_turns:
+        if turn["stage"] in ("critique", "devil"):
+            updated["last_feedback"] = turn["content"]
+
+    updated["open_issues"] = sorted(issue["key"] for issue in open_issues if issue["status"] == "open")
+    resolved = dict(updated["resolved_issues"])
+    for issue in open_issues:
+        if issue["status"] == "resolved":
+            resolved[issue["key"]] = issue["resolved_round"]
+    updated["resolved_issues"] = resolved
+
+    updated["resolved_actions_compacted"] += len(folded_actions)
+    counts = dict(updated["convergence_counts"])
+    for note in folded_notes:
+        counts[note] = counts.get(note, 0) + 1
+    updated["convergence_counts"] = counts
+    return updated
+
+
+def compact_state(state: Dict[str, Any], window: int) -> Dict[str, Any]:
+    """Fold everything but the last ``window`` turns into the rolling summary.
+
+    Folded turns, actions and notes are appended to ``state["spill_path"]`` (JSON lines) when set,
+    so ``restore_state`` can rebuild the full lists; without a spill path they are summarized only.
+    """
+    history = state["history"]
+    actions = state["resolved_actions"]
+    notes = state["convergence_notes"]
+    snapshots = state.get("round_snapshots", [])
+    tail = max(window, MIN_TAIL)
+
+    turn_cut = max(0, len(history) - window)
+    action_cut = max(0, len(actions) - tail)
+    note_cut = max(0, len(notes) - tail)
+    snapshot_cut = max(0, len(snapshots) - tail)
+    if not (turn_cut or action_cut or note_cut or snapshot_cut):
+        return {}
+
+    folded = {
+        "history": history[:turn_cut],
+        "resolved_actions": actions[:action_cut],
+        "convergence_notes": notes[:note_cut],
+        "round_snapshots": snapshots[:snapshot_cut],
+    }
+    spill_path = state.get("spill_path")
+    if spill_path:
+        with open(spill_path, "a", encoding="utf-8") as handle:
+            handle.write(json.dumps(folded) + "\n")
+
+    return {
+        "history": history[turn_cut:],
+        "resolved_actions": actions[action_cut:],
+        "convergence_notes": notes[note_cut:],
+        "round_snapshots": snapshots[snapshot_cut:],
+        "history_summary": fold_summary(
+            state.get("history_summary") or empty_summary(),
+            folded["history"],
+            folded["resolved_actions"],
+            folded["convergence_notes"],
+            state["open_issues"],
+        ),
+    }
+
+
+def latest_feedback(state: Dict[str, Any]) -> Optional[str]:
+    for entry in reversed(state["history"]):
+        if entry["stage"] in ("critique", "devil"):
+            return entry["content"]
+    summary = state.get("history_summary") or {}
+    return summary.get("last_feedback") or None
+
+
+def read_spill(spill_path: Path) -> Dict[str, List[Any]]:
+    restored: Dict[str, List[Any]] = {field: [] for field in SPILLED_FIELDS}
+    if not spill_path.exists():
+        return restored
+    with open(spill_path, encoding="utf-8") as handle:
+        for line in handle:
+            record = json.loads(line)
+            for field in SPILLED_FIELDS:
+                restored[field].extend(record.get(field, []))
+    return restored
+
+
+def restore_state(state: Dict[str, Any]) -> Dict[str, Any]:
+    spill_path = state.get("spill_path")
+    if not spill_path:
+        return state
+    restored = read_spill(Path(spill_path))
+    full = dict(state)
+    for field in SPILLED_FIELDS:
+        full[field] = restored[field] + state.get(field, [])
+    return full
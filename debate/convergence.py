@@ -0,0 +1,335 @@
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from debate.packs import PACK_DIRNAME, PackReader
+from debate.snapshots import SNAPSHOT_FIELDS, SNAPSHOTS_FILENAME
+from debate.transcript_reader import TranscriptReader
+from debate_runner import RUBRIC_KEYS
+
+
+CONVERGENCE_FILENAME = "convergence.npz"
+# Per-run config fields kept next to the rows; "consensus" is the judge's final verdict.
+META_FIELDS = ("agent_mode", "include_synthesizer", "include_devil", "rounds", "temperature", "history_window", "seed")
+DEFAULT_GROUP = ("agent_mode", "include_synthesizer", "include_devil", "rounds", "temperature")
+COLUMN_DTYPES = {"round": np.int32, "open": np.int32, "resolved": np.int32, "signals": np.uint8, "agreement": np.int8}
+NEVER = 0  # first_round() value for runs where the condition never held
+
+Label = Tuple[Any, ...]
+
+
+@dataclass
+class ConvergenceSet:
+    """Per-round snapshots of many runs as flat columns; run ``i`` owns rows ``offsets[i]:offsets[i + 1]``."""
+
+    keys: np.ndarray
+    offsets: np.ndarray
+    columns: Dict[str, np.ndarray]
+    meta: Dict[str, np.ndarray]
+    signal_keys: List[str]
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def lengths(self) -> np.ndarray:
+        return np.diff(self.offsets)
+
+    def run_of_row(self) -> np.ndarray:
+        return np.repeat(np.arange(len(self), dtype=np.int64), self.lengths())
+
+    def final(self, column: str) -> np.ndarray:
+        return self.columns[column][self.offsets[1:] - 1]
+
+    def signal(self, name: str) -> np.ndarray:
+        return (self.columns["signals"] >> self.signal_keys.index(name)) & 1 == 1
+
+    def first_round(self, mask: np.ndarray) -> np.ndarray:
+        """Per run, the first round whose row satisfies ``mask`` (``NEVER`` if none does)."""
+        sentinel = np.iinfo(np.int32).max
+        rounds = np.where(mask, self.columns["round"], sentinel)
+        first = np.full(len(self), sentinel, dtype=np.int32)
+        filled = self.lengths() > 0
+        first[filled] = np.minimum.reduceat(rounds, self.offsets[:-1][filled])
+        first[first == sentinel] = NEVER
+        return first
+
+    def time_to_consensus(self) -> np.ndarray:
+        return self.first_round(self.columns["agreement"] == 1)
+
+    def time_to_clear(self) -> np.ndarray:
+        # Topology-independent: the first round that ends with no open issue.
+        return self.first_round(self.columns["open"] == 0)
+
+    def group(self, by: Sequence[str] = DEFAULT_GROUP) -> Tuple[List[Label], np.ndarray]:
+        """Distinct label tuples over the ``by`` meta fields and each run's label index."""
+        uniques = []
+        codes = []
+        for name in by:
+            values, inverse = np.unique(self.meta[name], return_inverse=True)
+            uniques.append(values)
+            codes.append(inverse.ravel())
+        if not by:
+            return [()], np.zeros(len(self), dtype=np.int64)
+        combined = np.ravel_multi_index(codes, [len(values) for values in uniques])
+        present, inverse = np.unique(combined, return_inverse=True)
+        labels = [
+            tuple(values[idx].item() for values, idx in zip(uniques, parts))
+            for parts in zip(*np.unravel_index(present, [len(values) for values in uniques]))
+        ]
+        return labels, inverse.ravel()
+
+    def curve(self, column: str = "open", by: Sequence[str] = DEFAULT_GROUP) -> Dict[Label, np.ndarray]:
+        """Mean of ``column`` per round for each group; entry ``r - 1`` is round ``r`` (NaN past every run's end)."""
+        labels, inverse = self.group(by)
+        if not self.columns["round"].size:
+            return {label: np.zeros(0) for label in labels}
+        width = int(self.columns["round"].max())
+        cells = inverse[self.run_of_row()] * width + self.columns["round"] - 1
+        size = len(labels) * width
+        sums = np.bincount(cells, weights=self.columns[column], minlength=size)
+        counts = np.bincount(cells, minlength=size)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = (sums / counts).reshape(len(labels), width)
+        return dict(zip(labels, means))
+
+    def consensus_distribution(self, by: Sequence[str] = DEFAULT_GROUP) -> Dict[Label, np.ndarray]:
+        """Run counts by time to consensus; index 0 counts runs that never reached agreement."""
+        labels, inverse = self.group(by)
+        reached = self.time_to_consensus()
+        width = int(reached.max(initial=0)) + 1
+        counts = np.bincount(inverse * width + reached, minlength=len(labels) * width)
+        return dict(zip(labels, counts.reshape(len(labels), width)))
+
+    def aggregate(self, by: Sequence[str] = DEFAULT_GROUP) -> List[Dict[str, Any]]:
+        labels, inverse = self.group(by)
+        order = np.argsort(inverse, kind="stable")
+        bounds = np.cumsum(np.bincount(inverse, minlength=len(labels)))[:-1]
+        finals = {column: self.final(column)[order] for column in ("open", "resolved", "agreement")}
+        lengths = self.lengths()[order]
+        consensus = self.meta["consensus"][order]
+        reached = self.time_to_consensus()[order]
+        cleared = self.time_to_clear()[order]
+        signal_sets = {name: self.first_round(self.signal(name))[order] for name in self.signal_keys}
+
+        def split(values: np.ndarray) -> List[np.ndarray]:
+            return np.split(values, bounds)
+
+        rows = []
+        parts = zip(
+            labels,
+            split(lengths),
+            split(consensus),
+            split(finals["open"]),
+            split(finals["resolved"]),
+            split(finals["agreement"]),
+            split(reached),
+            split(cleared),
+            *(split(values) for values in signal_sets.values()),
+        )
+        for label, run_lengths, verdicts, final_open, final_resolved, agreement, ttc, ttclear, *signals in parts:
+            synthesized = agreement >= 0
+            hit = ttc[ttc != NEVER]
+            clear = ttclear[ttclear != NEVER]
+            rows.append({
+                **dict(zip(by, label)),
+                "runs": int(run_lengths.size),
+                "mean_rounds": round(float(run_lengths.mean()), 3),
+                "judge_consensus_rate": round(float(verdicts.mean()), 4),
+                "synth_agreement_rate": round(float((agreement[synthesized] == 1).mean()), 4) if synthesized.any() else None,
+                "consensus_reached_rate": round(hit.size / run_lengths.size, 4) if synthesized.any() else None,
+                "ttc_mean": round(float(hit.mean()), 3) if hit.size else None,
+                "ttc_median": float(np.median(hit)) if hit.size else None,
+                "clear_rate": round(clear.size / run_lengths.size, 4),
+                "clear_median": float(np.median(clear)) if clear.size else None,
+                "final_open_mean": round(float(final_open.mean()), 3),
+                "final_resolved_mean": round(float(final_resolved.mean()), 3),
+                "signal_rates": {
+                    name: round(float((first != NEVER).mean()), 4) for name, first in zip(self.signal_keys, signals)
+                },
+            })
+        return rows
+
+    def save(self, path: Path) -> None:
+        arrays = {f"col_{name}": values for name, values in self.columns.items()}
+        arrays.update({f"meta_{name}": values for name, values in self.meta.items()})
+        tmp_path = Path(path).with_name(f".{Path(path).name}.tmp.npz")
+        np.savez(tmp_path, keys=self.keys, offsets=self.offsets, signal_keys=np.array(self.signal_keys), **arrays)
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> "ConvergenceSet":
+        with np.load(path, allow_pickle=False) as data:
+            return cls(
+                keys=data["keys"],
+                offsets=data["offsets"],
+                columns={name[4:]: data[name] for name in data.files if name.startswith("col_")},
+                meta={name[5:]: data[name] for name in data.files if name.startswith("meta_")},
+                signal_keys=data["signal_keys"].tolist(),
+            )
+
+
+def from_runs(
+    keys: List[str],
+    rows: List[np.ndarray],
+    metas: List[Dict[str, Any]],
+    signal_keys: Optional[List[str]] = None,
+) -> ConvergenceSet:
+    width = len(SNAPSHOT_FIELDS)
+    flat = np.concatenate(rows) if rows else np.zeros(0, dtype=np.int32)
+    table = flat.reshape(-1, width)
+    offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+    np.cumsum([row.size // width for row in rows], out=offsets[1:])
+    return ConvergenceSet(
+        keys=np.array(keys, dtype=str),
+        offsets=offsets,
+        columns={name: table[:, idx].astype(COLUMN_DTYPES[name]) for idx, name in enumerate(SNAPSHOT_FIELDS)},
+        meta={name: np.array([meta[name] for meta in metas]) for name in (*META_FIELDS, "consensus")},
+        signal_keys=list(signal_keys or RUBRIC_KEYS),
+    )
+
+
+def collect(output_dir: Path) -> ConvergenceSet:
+    """Gather every stored run's snapshots (run directories first, then packs); older runs without them are skipped."""
+    keys: List[str] = []
+    rows: List[np.ndarray] = []
+    metas: List[Dict[str, Any]] = []
+    for path in sorted(output_dir.glob(f"*/{SNAPSHOTS_FILENAME}")):
+        with TranscriptReader(path.parent) as reader:
+            config = reader.field("config")
+            consensus = reader.field("consensus_reached")
+        keys.append(path.parent.name)
+        rows.append(np.frombuffer(path.read_bytes(), dtype="<i4"))
+        metas.append({**{name: config.get(name, 0) for name in META_FIELDS}, "consensus": consensus})
+
+    pack_dir = output_dir / PACK_DIRNAME
+    if pack_dir.is_dir():
+        reader = PackReader(pack_dir)
+        seen = set(keys)
+        for key in reader.keys():
+            if key in seen:
+                continue
+            data = reader.load_json(key)
+            if not data.get("round_snapshots"):
+                continue
+            keys.append(key)
+            rows.append(np.asarray(data["round_snapshots"], dtype="<i4").ravel())
+            metas.append({**{name: data["config"].get(name, 0) for name in META_FIELDS}, "consensus": data["consensus_reached"]})
+    return from_runs(keys, rows, metas)
+
+
+def build(output_dir: Path) -> ConvergenceSet:
+    dataset = collect(output_dir)
+    dataset.save(output_dir / CONVERGENCE_FILENAME)
+    return dataset
+
+
+def load(output_dir: Path, rebuild: bool = False) -> ConvergenceSet:
+    path = output_dir / CONVERGENCE_FILENAME
+    if rebuild or not path.exists():
+        return build(output_dir)
+    return ConvergenceSet.load(path)
+
+
+def tile(dataset: ConvergenceSet, runs: int) -> ConvergenceSet:
+    """Repeat a set up to ``runs`` runs (benchmarking only)."""
+    reps = -(-runs // max(len(dataset), 1))
+    lengths = np.tile(dataset.lengths(), reps)[:runs]
+    offsets = np.zeros(runs + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    rows = int(offsets[-1])
+    return ConvergenceSet(
+        keys=np.char.add(np.tile(dataset.keys, reps)[:runs], np.arange(runs).astype(str)),
+        offsets=offsets,
+        columns={name: np.tile(values, reps)[:rows] for name, values in dataset.columns.items()},
+        meta={name: np.tile(values, reps)[:runs] for name, values in dataset.meta.items()},
+        signal_keys=dataset.signal_keys,
+    )
+
+
+def label_text(by: Sequence[str], label: Label) -> str:
+    return ",".join(f"{name}={value}" for name, value in zip(by, label)) or "all"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Per-round convergence analytics over stored debate runs.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    build_cmd = sub.add_parser("build", help=f"Gather snapshots into <output>/{CONVERGENCE_FILENAME}.")
+    build_cmd.add_argument("output", nargs="?", default="results")
+
+    report = sub.add_parser("report", help="Print convergence curves, time-to-consensus and per-config aggregates.")
+    report.add_argument("output", nargs="?", default="results")
+    report.add_argument("--by", nargs="*", default=list(DEFAULT_GROUP), help="Meta fields to group runs by.")
+    report.add_argument("--rebuild", action="store_true", help="Re-gather snapshots before reporting.")
+
+    bench = sub.add_parser("bench", help="Time the API on the stored runs repeated to --runs.")
+    bench.add_argument("output", nargs="?", default="results")
+    bench.add_argument("--runs", type=int, default=500_000)
+    bench.add_argument("--by", nargs="*", default=list(DEFAULT_GROUP))
+    bench.add_argument("--rebuild", action="store_true")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    output_dir = Path(args.output)
+    if args.command == "build":
+        started = time.perf_counter()
+        dataset = build(output_dir)
+        print(json.dumps({
+            "runs": len(dataset),
+            "rows": int(dataset.offsets[-1]),
+            "path": str(output_dir / CONVERGENCE_FILENAME),
+            "seconds": round(time.perf_counter() - started, 2),
+        }))
+        return
+
+    dataset = load(output_dir, rebuild=args.rebuild)
+    if not len(dataset):
+        raise SystemExit(f"No runs with round snapshots under {output_dir}")
+    by = tuple(args.by)
+
+    if args.command == "report":
+        curves = {column: dataset.curve(column, by) for column in ("open", "resolved")}
+        print(json.dumps({
+            "runs": len(dataset),
+            "groups": dataset.aggregate(by),
+            "curves": {
+                label_text(by, label): {column: np.round(curves[column][label], 3).tolist() for column in curves}
+                for label in curves["open"]
+            },
+            "time_to_consensus": {
+                label_text(by, label): counts.tolist() for label, counts in dataset.consensus_distribution(by).items()
+            },
+        }, indent=2))
+        return
+
+    dataset = tile(dataset, args.runs)
+    timings: Dict[str, float] = {}
+
+    def timed(name: str, fn: Any) -> Any:
+        started = time.perf_counter()
+        value = fn()
+        timings[name] = round(time.perf_counter() - started, 3)
+        return value
+
+    scratch = output_dir / f".bench_{CONVERGENCE_FILENAME}"
+    timed("save_s", lambda: dataset.save(scratch))
+    dataset = timed("load_s", lambda: ConvergenceSet.load(scratch))
+    scratch.unlink()
+    timed("time_to_consensus_s", dataset.time_to_consensus)
+    timed("curve_s", lambda: dataset.curve("open", by))
+    timed("distribution_s", lambda: dataset.consensus_distribution(by))
+    groups = timed("aggregate_s", lambda: dataset.aggregate(by))
+    print(json.dumps({"runs": len(dataset), "rows": int(dataset.offsets[-1]), "groups": len(groups), **timings}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
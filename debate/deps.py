@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+from typing import Any, Dict, Iterable, List, Optional
+
+
+DEPS_FILENAME = "dependencies.json"
+_MISSING = object()
+_REF = re.compile(r"^(?P<fact>[A-Za-z_]+)(?:\[(?P<item>.*)\]|(?P<length>#len))?$")
+
+# A run depends on fact *references*, each pinned to a digest of the value it saw:
+#   "snapshot"                  a scalar fact
+#   "evidence[3]"               one list entry that was actually used
+#   "evidence#len"              a list's length (shuffles permute by length only, so every sample depends on it)
+#   "mitigations[Capital gap]"  one dict lookup, including lookups of keys that were absent
+# Editing a list entry the run never sampled, or a mitigation for an issue it never resolved, leaves it valid.
+
+
+def entry_ref(fact: str, item: Any) -> str:
+    return f"{fact}[{item}]"
+
+
+def length_ref(fact: str) -> str:
+    return f"{fact}#len"
+
+
+def resolve(facts: Dict[str, Any], ref: str) -> Any:
+    match = _REF.match(ref)
+    if match is None or match["fact"] not in facts:
+        return _MISSING
+    value = facts[match["fact"]]
+    if match["length"]:
+        return len(value)
+    item = match["item"]
+    if item is None:
+        return value
+    if isinstance(value, list):
+        idx = int(item)
+        return value[idx] if idx < len(value) else _MISSING
+    return value.get(item, _MISSING)
+
+
+def digest(value: Any) -> str:
+    if value is _MISSING:
+        return "-"
+    encoded = json.dumps(value, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=8).hexdigest()
+
+
+def build_manifest(facts: Dict[str, Any], refs: Iterable[str], issue_keys: Iterable[str]) -> Dict[str, Any]:
+    return {
+        "facts": {ref: digest(resolve(facts, ref)) for ref in sorted(refs)},
+        "issue_keys": sorted(set(issue_keys)),
+    }
+
+
+def stale_refs(manifest: Optional[Dict[str, Any]], facts: Dict[str, Any]) -> List[str]:
+    """References whose current value no longer matches what the run consumed (["*"] without a manifest)."""
+    if not manifest:
+        return ["*"]
+    return [ref for ref, recorded in manifest["facts"].items() if digest(resolve(facts, ref)) != recorded]
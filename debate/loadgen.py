@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from debate.stats import percentile
+
+
+@dataclass
+class RequestOutcome:
+    status: int
+    latency: float
+    first_turn: Optional[float]
+    turns: int
+
+
+async def post_debate(host: str, port: int, payload: Dict[str, Any]) -> RequestOutcome:
+    started = time.perf_counter()
+    reader, writer = await asyncio.open_connection(host, port)
+    body = json.dumps(payload).encode("utf-8")
+    writer.write(
+        (
+            "POST /debates HTTP/1.1\r\n"
+            f"Host: {host}:{port}\r\n"
+            "Content-Type: application/json\r\n"
+            "Accept: text/event-stream\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "Connection: close\r\n\r\n"
+        ).encode("latin-1")
+        + body
+    )
+    await writer.drain()
+
+    status_line = (await reader.readline()).decode("latin-1").split()
+    status = int(status_line[1]) if len(status_line) >= 2 else 0
+    first_turn = None
+    turns = 0
+    while True:
+        line = await reader.readline()
+        if not line:
+            break
+        if line.startswith(b"event: turn"):
+            turns += 1
+            if first_turn is None:
+                first_turn = time.perf_counter() - started
+    writer.close()
+    return RequestOutcome(status=status, latency=time.perf_counter() - started, first_turn=first_turn, turns=turns)
+
+
+async def run_load(
+    host: str,
+    port: int,
+    payloads: List[Dict[str, Any]],
+    concurrency: int,
+    total: int,
+) -> Dict[str, Any]:
+    outcomes: List[RequestOutcome] = []
+    counter = iter(range(total))
+
+    async def client() -> None:
+        for idx in counter:
+            outcomes.append(await post_debate(host, port, payloads[idx % len(payloads)]))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    ok = [outcome for outcome in outcomes if outcome.status == 200]
+    latencies = [outcome.latency for outcome in ok]
+    first_turns = [outcome.first_turn for outcome in ok if outcome.first_turn is not None]
+    return {
+        "requests": len(outcomes),
+        "ok": len(ok),
+        "rejected": sum(1 for outcome in outcomes if outcome.status == 503),
+        "errors": sum(1 for outcome in outcomes if outcome.status not in (200, 503)),
+        "concurrency": concurrency,
+        "elapsed_s": round(elapsed, 3),
+        "throughput_per_s": round(len(ok) / elapsed, 2) if elapsed > 0 else 0.0,
+        "latency_ms": {
+            "p50": round(percentile(latencies, 50) * 1000, 2),
+            "p99": round(percentile(latencies, 99) * 1000, 2),
+            "max": round(max(latencies, default=0.0) * 1000, 2),
+        },
+        "first_turn_ms": {
+            "p50": round(percentile(first_turns, 50) * 1000, 2),
+            "p99": round(percentile(first_turns, 99) * 1000, 2),
+        },
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Drive concurrent clients against the debate service.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--concurrency", type=int, default=8, help="Simultaneous client connections.")
+    parser.add_argument("--requests", type=int, default=200, help="Total debate jobs to submit.")
+    parser.add_argument(
+        "--presets",
+        nargs="*",
+        default=["baseline_full_lowtemp", "toggle_two_agent", "toggle_high_temp_devil"],
+        help="Preset keys cycled through by the clients.",
+    )
+    parser.add_argument(
+        "--vary-seed",
+        action="store_true",
+        help="Give every request its own seed (the service still reuses warm graphs per topology).",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    payloads: List[Dict[str, Any]] = [{"preset": preset} for preset in args.presets]
+    if args.vary_seed:
+        payloads = [
+            {"preset": args.presets[idx % len(args.presets)], "seed": idx}
+            for idx in range(args.requests)
+        ]
+    report = asyncio.run(run_load(args.host, args.port, payloads, args.concurrency, args.requests))
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,332 @@
+from __future__ import annotations
+
+import argparse
+import atexit
+import json
+import math
+import multiprocessing.util
+import os
+import socket
+import threading
+import time
+import weakref
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from debate.packs import safe_worker_name
+
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+HELP = {
+    "debate_runs_total": ("counter", "Debates completed."),
+    "debate_consensus_total": ("counter", "Debates whose judge reached consensus."),
+    "debate_run_seconds": ("histogram", "Wall time of a whole debate."),
+    "debate_node_latency_seconds": ("histogram", "Wall time per graph node invocation."),
+    "debate_issues_raised_total": ("counter", "Issues added to open_issues, by node and round."),
+    "debate_issues_resolved_total": ("counter", "Issues marked resolved, by node and round."),
+    "debate_persist_bytes_total": ("counter", "Bytes of run artifacts written."),
+    "debate_persist_pending": ("gauge", "Artifact writes queued for background writers."),
+    "debate_persist_stall_seconds_total": ("counter", "Time the runner blocked on a full write queue."),
+    "debate_queue_depth": ("gauge", "Jobs waiting for a worker."),
+    "debate_in_flight": ("gauge", "Debates accepted and not yet finished."),
+    "debate_backend_call_seconds": ("histogram", "Simulated backend call latency including retries."),
+    "debate_backend_faults_total": ("counter", "Injected backend errors and timeouts."),
+}
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+# Later rounds share one label so long debates cannot blow up series cardinality.
+MAX_ROUND_LABEL = 16
+
+
+def round_label(round_number: int) -> str:
+    if round_number > MAX_ROUND_LABEL:
+        return f"{MAX_ROUND_LABEL + 1}+"
+    return str(round_number)
+
+
+def _label_key(labels: Dict[str, Any]) -> LabelKey:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+class MetricsRegistry:
+    """Process-local counters, gauges and histograms, flushed as one JSON shard per process.
+
+    Updates are plain dict arithmetic under a lock. Cross-process safety comes from every process
+    owning its own shard file; the exporter sums shards at scrape time. A forked child starts from
+    zero with a fresh lock, its own flush thread and its own shard, and flushes once more on exit.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._reset()
+        self.metrics_dir: Optional[Path] = None
+        self.worker = ""
+        self.interval = 5.0
+        self._flusher: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        _REGISTRIES.add(self)
+
+    def _reset(self) -> None:
+        self.pid = os.getpid()
+        self.started = time.time()
+        self.counters: Dict[str, Dict[LabelKey, float]] = {}
+        self.gauges: Dict[str, Dict[LabelKey, float]] = {}
+        self.histograms: Dict[str, Dict[LabelKey, List[float]]] = {}
+
+    def _check_fork(self) -> None:
+        # Fallback for forks the at-fork hook missed; a child must not re-report its parent's counts.
+        if os.getpid() != self.pid:
+            self._after_fork()
+
+    def _after_fork(self) -> None:
+        # The parent's lock may have been held by another thread at fork time, and its flush thread
+        # does not exist here.
+        self._lock = threading.Lock()
+        self._reset()
+        self._stop = threading.Event()
+        self._flusher = None
+        if self.metrics_dir is not None:
+            self._start_flusher()
+
+    def _flush_on_child_exit(self) -> None:
+        # multiprocessing children leave through os._exit, which skips atexit; their finalizers still run.
+        multiprocessing.util.Finalize(self, self.flush, exitpriority=10)
+
+    def inc(self, name: str, amount: float = 1.0, **labels: Any) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            self._check_fork()
+            series = self.counters.setdefault(name, {})
+            series[key] = series.get(key, 0.0) + amount
+
+    def set(self, name: str, value: float, **labels: Any) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            self._check_fork()
+            self.gauges.setdefault(name, {})[key] = value
+
+    def observe(self, name: str, value: float, **labels: Any) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            self._check_fork()
+            series = self.histograms.setdefault(name, {})
+            # Layout: one count per bucket, then +Inf, then sum.
+            state = series.get(key)
+            if state is None:
+                state = series[key] = [0.0] * (len(LATENCY_BUCKETS) + 2)
+            state[bisect_left(LATENCY_BUCKETS, value)] += 1
+            state[-1] += value
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            self._check_fork()
+            return {
+                "worker": self.worker,
+                "pid": self.pid,
+                "started": self.started,
+                "updated": time.time(),
+                "counters": {name: [[list(key), value] for key, value in series.items()] for name, series in self.counters.items()},
+                "gauges": {name: [[list(key), value] for key, value in series.items()] for name, series in self.gauges.items()},
+                "histograms": {
+                    name: [[list(key), list(state)] for key, state in series.items()]
+                    for name, series in self.histograms.items()
+                },
+            }
+
+    def configure(self, metrics_dir: Path, worker: str, interval: float = 5.0) -> None:
+        self.metrics_dir = Path(metrics_dir)
+        self.metrics_dir.mkdir(parents=True, exist_ok=True)
+        self.worker = worker
+        self.interval = interval
+        if self._flusher is None or not self._flusher.is_alive():
+            self._start_flusher()
+            atexit.register(self.flush)
+            multiprocessing.util.register_after_fork(self, MetricsRegistry._flush_on_child_exit)
+
+    def _start_flusher(self) -> None:
+        self._stop.clear()
+        self._flusher = threading.Thread(target=self._flush_loop, name="metrics-flush", daemon=True)
+        self._flusher.start()
+
+    def _flush_loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.flush()
+
+    def flush(self) -> None:
+        if self.metrics_dir is None:
+            return
+        snapshot = self.snapshot()
+        path = self.metrics_dir / shard_name(snapshot["pid"])
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(snapshot), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+
+_REGISTRIES: "weakref.WeakSet[MetricsRegistry]" = weakref.WeakSet()
+
+
+def _after_fork_in_child() -> None:
+    for registry in list(_REGISTRIES):
+        registry._after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+METRICS = MetricsRegistry()
+
+
+def shard_name(pid: int, host: Optional[str] = None) -> str:
+    # Workers on several machines share one directory, so a pid alone is not unique.
+    return f"shard-{safe_worker_name(host or socket.gethostname())}-{pid}.json"
+
+
+def load_shards(metrics_dir: Path) -> List[Dict[str, Any]]:
+    shards = []
+    for path in sorted(Path(metrics_dir).glob("shard-*.json")):
+        try:
+            shards.append(json.loads(path.read_text(encoding="utf-8")))
+        except (OSError, json.JSONDecodeError):
+            continue
+    return shards
+
+
+def _format_labels(labels: List[Tuple[str, str]]) -> str:
+    if not labels:
+        return ""
+    escaped = (f'{name}="{value.replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34))}"' for name, value in labels)
+    return "{" + ",".join(escaped) + "}"
+
+
+def _format_value(value: float) -> str:
+    # Counts stay exact integers however large they grow; other floats keep full precision.
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def render_prometheus(shards: List[Dict[str, Any]], now: Optional[float] = None) -> str:
+    """Merge shards into Prometheus text format: counters and histograms summed, gauges per worker."""
+    now = time.time() if now is None else now
+    counters: Dict[str, Dict[LabelKey, float]] = {}
+    gauges: Dict[str, Dict[LabelKey, float]] = {}
+    histograms: Dict[str, Dict[LabelKey, List[float]]] = {}
+    for shard in shards:
+        for name, series in shard["counters"].items():
+            merged = counters.setdefault(name, {})
+            for key, value in series:
+                label_key = tuple(tuple(pair) for pair in key)
+                merged[label_key] = merged.get(label_key, 0.0) + value
+        for name, series in shard["gauges"].items():
+            merged = gauges.setdefault(name, {})
+            for key, value in series:
+                label_key = tuple(sorted([tuple(pair) for pair in key] + [("worker", shard["worker"] or str(shard["pid"]))]))
+                merged[label_key] = value
+        for name, series in shard["histograms"].items():
+            merged_hist = histograms.setdefault(name, {})
+            for key, state in series:
+                label_key = tuple(tuple(pair) for pair in key)
+                current = merged_hist.setdefault(label_key, [0.0] * len(state))
+                merged_hist[label_key] = [a + b for a, b in zip(current, state)]
+
+    lines: List[str] = []
+
+    def header(name: str) -> None:
+        kind, text = HELP.get(name, ("untyped", name))
+        lines.append(f"# HELP {name} {text}")
+        lines.append(f"# TYPE {name} {kind}")
+
+    for name in sorted(counters):
+        header(name)
+        for key, value in sorted(counters[name].items()):
+            lines.append(f"{name}{_format_labels(list(key))} {_format_value(value)}")
+    for name in sorted(gauges):
+        header(name)
+        for key, value in sorted(gauges[name].items()):
+            lines.append(f"{name}{_format_labels(list(key))} {_format_value(value)}")
+    for name in sorted(histograms):
+        header(name)
+        for key, state in sorted(histograms[name].items()):
+            cumulative = 0.0
+            for bound, count in zip(LATENCY_BUCKETS, state):
+                cumulative += count
+                lines.append(f"{name}_bucket{_format_labels(list(key) + [('le', f'{bound:g}')])} {_format_value(cumulative)}")
+            cumulative += state[len(LATENCY_BUCKETS)]
+            lines.append(f"{name}_bucket{_format_labels(list(key) + [('le', '+Inf')])} {_format_value(cumulative)}")
+            lines.append(f"{name}_sum{_format_labels(list(key))} {_format_value(state[-1])}")
+            lines.append(f"{name}_count{_format_labels(list(key))} {_format_value(cumulative)}")
+
+    runs = sum(counters.get("debate_runs_total", {}).values())
+    consensus = sum(counters.get("debate_consensus_total", {}).values())
+    started = min((shard["started"] for shard in shards), default=now)
+    elapsed = max(now - started, 1e-9)
+    lines.append("# HELP debate_consensus_rate Share of completed debates that reached consensus.")
+    lines.append("# TYPE debate_consensus_rate gauge")
+    lines.append(f"debate_consensus_rate {_format_value(consensus / runs if runs else 0.0)}")
+    lines.append("# HELP debate_runs_per_second Completed debates per second since the first worker started.")
+    lines.append("# TYPE debate_runs_per_second gauge")
+    lines.append(f"debate_runs_per_second {_format_value(runs / elapsed)}")
+    return "\n".join(lines) + "\n"
+
+
+def serve(metrics_dir: Path, host: str, port: int) -> None:
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            if self.path.split("?", 1)[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = render_prometheus(load_shards(metrics_dir)).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: Any) -> None:
+            return
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    print(f"📈 Serving merged metrics from {metrics_dir} on http://{host}:{port}/metrics")
+    server.serve_forever()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Expose metrics shards written by debate workers.")
+    parser.add_argument("metrics_dir", help="Directory given to --metrics-dir on the workers.")
+    parser.add_argument("--serve", action="store_true", help="Serve /metrics over HTTP instead of printing once.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9108)
+    parser.add_argument(
+        "--textfile",
+        default=None,
+        help="Write the merged text here (atomically), e.g. for the node_exporter textfile collector.",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    metrics_dir = Path(args.metrics_dir)
+    if args.serve:
+        serve(metrics_dir, args.host, args.port)
+        return
+    text = render_prometheus(load_shards(metrics_dir))
+    if args.textfile:
+        path = Path(args.textfile)
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_text(text, encoding="utf-8")
+        os.replace(tmp_path, path)
+    else:
+        print(text, end="")
+
+
+if __name__ == "__main__":
+    main()
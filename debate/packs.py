@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import json
+import lzma
+import os
+import re
+import struct
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+
+
+PACK_DIRNAME = "packs"
+CODECS = {"zlib": 1, "lzma": 2}
+RECORD_MAGIC = b"DPK1"
+# magic, codec id, key length, payload length, crc32 of the compressed payload
+RECORD_HEADER = struct.Struct("<4sBHII")
+DEFAULT_SEGMENT_BYTES = 256 << 20
+
+
+def _compress(codec: str, data: bytes, level: int) -> bytes:
+    if codec == "zlib":
+        return zlib.compress(data, level)
+    return lzma.compress(data, preset=level)
+
+
+def _decompress(codec_id: int, data: bytes) -> bytes:
+    if codec_id == CODECS["zlib"]:
+        return zlib.decompress(data)
+    if codec_id == CODECS["lzma"]:
+        return lzma.decompress(data)
+    raise ValueError(f"Unknown pack codec id: {codec_id}")
+
+
+def trim_torn_tail(path: Path, chunk: int = 1 << 16) -> None:
+    """Drop a trailing partial line left by a crash, so the next append starts on a fresh line."""
+    if not path.exists():
+        return
+    with open(path, "rb+") as handle:
+        end = handle.seek(0, os.SEEK_END)
+        if end == 0:
+            return
+        handle.seek(end - 1)
+        if handle.read(1) == b"\n":
+            return
+        pos = end
+        while pos > 0:
+            start = max(0, pos - chunk)
+            handle.seek(start)
+            newline = handle.read(pos - start).rfind(b"\n")
+            if newline != -1:
+                handle.truncate(start + newline + 1)
+                return
+            pos = start
+        handle.truncate(0)
+
+
+def safe_worker_name(worker_id: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]+", "-", worker_id)
+
+
+class PackWriter:
+    """Appends compressed run records to this worker's segment files and logs them in its index.
+
+    Each worker owns its files, so several processes can pack into one directory without locking.
+    A record becomes visible only once its index line is written, so a torn tail after a crash is ignored.
+    Threads may share a writer: records are compressed concurrently and appended one at a time.
+    Each index line carries a ``seq`` one above every ``seq`` visible in the directory when it was
+    appended, so a re-run sorts after the record it replaces even if the hosts' clocks disagree.
+    """
+
+    def __init__(
+        self,
+        pack_dir: Path,
+        worker_id: str,
+        codec: str = "zlib",
+        level: int = 6,
+        max_segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+    ):
+        if codec not in CODECS:
+            raise ValueError(f"Unknown pack codec: {codec}")
+        self.pack_dir = Path(pack_dir)
+        self.pack_dir.mkdir(parents=True, exist_ok=True)
+        self.worker = safe_worker_name(worker_id)
+        self.codec = codec
+        self.level = level
+        self.max_segment_bytes = max_segment_bytes
+        self.bytes_written = 0
+        self.sequence = 0
+        self._index_offsets: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+        existing = sorted(self.pack_dir.glob(f"{self.worker}-*.seg"))
+        self.segment_number = int(existing[-1].stem.rsplit("-", 1)[1]) if existing else 0
+        self._segment = open(self._segment_path(), "ab")
+        index_path = self.pack_dir / f"{self.worker}.idx"
+        # A restarted writer must not glue its first entry onto a torn line from the crashed one.
+        trim_torn_tail(index_path)
+        self._index = open(index_path, "a", encoding="utf-8")
+
+    def _segment_path(self) -> Path:
+        return self.pack_dir / f"{self.worker}-{self.segment_number:05d}.seg"
+
+    def _observe(self) -> None:
+        # Read only the index lines added since the last append, from every worker.
+        for index_path in sorted(self.pack_dir.glob("*.idx")):
+            start = self._index_offsets.get(index_path.name, 0)
+            if start > index_path.stat().st_size:
+                start = 0  # trimmed by a restarted writer
+            with open(index_path, "rb") as handle:
+                handle.seek(start)
+                data = handle.read()
+            end = data.rfind(b"\n") + 1
+            for line in data[:end].splitlines():
+                try:
+                    self.sequence = max(self.sequence, json.loads(line).get("seq", 0))
+                except json.JSONDecodeError:
+                    continue
+            self._index_offsets[index_path.name] = start + end
+
+    def append(self, key: str, payload: bytes) -> Dict[str, Any]:
+        compressed = _compress(self.codec, payload, self.level)
+        key_bytes = key.encode("utf-8")
+        record = (
+            RECORD_HEADER.pack(RECORD_MAGIC, CODECS[self.codec], len(key_bytes), len(compressed), zlib.crc32(compressed))
+            + key_bytes
+            + compressed
+        )
+
+        with self._lock:
+            self._observe()
+            self.sequence += 1
+            offset = self._segment.seek(0, os.SEEK_END)
+            if offset and offset + len(record) > self.max_segment_bytes:
+                self._segment.close()
+                self.segment_number += 1
+                self._segment = open(self._segment_path(), "ab")
+                offset = 0
+            self._segment.write(record)
+            self._segment.flush()
+
+            entry = {
+                "key": key,
+                "segment": self._segment_path().name,
+                "offset": offset,
+                "length": len(record),
+                "raw_bytes": len(payload),
+                "seq": self.sequence,
+                "written": time.time(),
+            }
+            self._index.write(json.dumps(entry) + "\n")
+            self._index.flush()
+            self.bytes_written += len(record)
+        return entry
+
+    def close(self) -> None:
+        self._segment.close()
+        self._index.close()
+
+    def __enter__(self) -> "PackWriter":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def record_order(entry: Dict[str, Any]) -> Tuple[int, float]:
+    # Sequence first; wall-clock time only breaks ties (concurrent writers, or indexes from before seq).
+    return entry.get("seq", 0), entry["written"]
+
+
+class PackReader:
+    """Merged view over every worker's index in a pack directory; the latest record (by ``seq``) wins per key."""
+
+    def __init__(self, pack_dir: Path):
+        self.pack_dir = Path(pack_dir)
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        for index_path in sorted(self.pack_dir.glob("*.idx")):
+            for entry in self._read_index(index_path):
+                current = self.entries.get(entry["key"])
+                if current is None or record_order(entry) >= record_order(current):
+                    self.entries[entry["key"]] = entry
+
+    @staticmethod
+    def _read_index(index_path: Path) -> Iterator[Dict[str, Any]]:
+        with open(index_path, encoding="utf-8") as handle:
+            for line in handle:
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    # Partially written trailing line from a crashed writer.
+                    continue
+
+    def keys(self) -> List[str]:
+        return sorted(self.entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.entries
+
+    def read(self, key: str) -> bytes:
+        entry = self.entries[key]
+        with open(self.pack_dir / entry["segment"], "rb") as handle:
+            handle.seek(entry["offset"])
+            record = handle.read(entry["length"])
+        magic, codec_id, key_len, payload_len, crc = RECORD_HEADER.unpack_from(record)
+        if magic != RECORD_MAGIC:
+            raise ValueError(f"Corrupt pack record for {key} in {entry['segment']}")
+        start = RECORD_HEADER.size + key_len
+        compressed = record[start:start + payload_len]
+        if zlib.crc32(compressed) != crc or record[RECORD_HEADER.size:start].decode("utf-8") != key:
+            raise ValueError(f"Checksum mismatch for {key} in {entry['segment']}")
+        return _decompress(codec_id, compressed)
+
+    def load_json(self, key: str) -> Any:
+        return json.loads(self.read(key))
+
+    def stats(self) -> Tuple[int, int, int]:
+        stored = sum(entry["length"] for entry in self.entries.values())
+        raw = sum(entry.get("raw_bytes", 0) for entry in self.entries.values())
+        return len(self.entries), stored, raw
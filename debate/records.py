@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import sys
+from enum import Enum
+from typing import Any, Dict, Iterable, List, Optional, Type, TypeVar, Union
+
+
+# Opt-in compact representation for holding many transcripts in memory (see debate/bench_records.py).
+# The engine, persistence, load_result and replay keep the TypedDict shapes: graph state, packs and
+# transcript.json are all plain JSON, so nothing converts to these records implicitly.
+
+
+class Stage(str, Enum):
+    ARGUE = "argue"
+    CRITIQUE = "critique"
+    DEVIL = "devil"
+    REVISE = "revise"
+    SYNTHESIZE = "synthesize"
+    VERDICT = "verdict"
+
+
+class Role(str, Enum):
+    RESEARCHER = "Researcher"
+    CRITIC = "Critic"
+    CRITIC_JUDGE = "Critic & Judge"
+    SYNTHESIZER = "Synthesizer"
+    JUDGE = "Judge"
+    DEVIL = "Devil's Advocate"
+
+
+class Status(str, Enum):
+    OPEN = "open"
+    RESOLVED = "resolved"
+
+
+E = TypeVar("E", bound=Enum)
+
+
+def _intern(enum_cls: Type[E], value: str) -> Union[E, str]:
+    # Known labels share one enum member; anything else is kept verbatim (interned) so round trips stay lossless.
+    try:
+        return enum_cls(value)
+    except ValueError:
+        return sys.intern(value)
+
+
+def _label(value: Union[Enum, str]) -> str:
+    return value.value if isinstance(value, Enum) else value
+
+
+class Turn:
+    """Slotted counterpart of ``TranscriptEntry`` with shared stage/role/speaker labels."""
+
+    __slots__ = ("round", "stage", "speaker", "role", "content")
+
+    def __init__(self, round: int, stage: Union[Stage, str], speaker: str, role: Union[Role, str], content: str):
+        self.round = round
+        self.stage = _intern(Stage, _label(stage))
+        self.speaker = sys.intern(speaker)
+        self.role = _intern(Role, _label(role))
+        self.content = content
+
+    @classmethod
+    def from_dict(cls, entry: Dict[str, Any]) -> "Turn":
+        return cls(entry["round"], entry["stage"], entry["speaker"], entry["role"], entry["content"])
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "round": self.round,
+            "stage": _label(self.stage),
+            "speaker": self.speaker,
+            "role": _label(self.role),
+            "content": self.content,
+        }
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Turn):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self) -> str:
+        return f"Turn(round={self.round}, stage={_label(self.stage)!r}, speaker={self.speaker!r})"
+
+
+class Issue:
+    """Slotted counterpart of ``IssueRecord``; key, description and raised_by are interned."""
+
+    __slots__ = ("key", "description", "raised_by", "raised_round", "resolved_round", "status")
+
+    def __init__(
+        self,
+        key: str,
+        description: str,
+        raised_by: Union[Role, str],
+        raised_round: int,
+        resolved_round: Optional[int],
+        status: Union[Status, str],
+    ):
+        self.key = sys.intern(key)
+        self.description = sys.intern(description)
+        self.raised_by = _intern(Role, _label(raised_by))
+        self.raised_round = raised_round
+        self.resolved_round = resolved_round
+        self.status = _intern(Status, _label(status))
+
+    @classmethod
+    def from_dict(cls, record: Dict[str, Any]) -> "Issue":
+        return cls(
+            record["key"],
+            record["description"],
+            record["raised_by"],
+            record["raised_round"],
+            record["resolved_round"],
+            record["status"],
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "key": self.key,
+            "description": self.description,
+            "raised_by": _label(self.raised_by),
+            "raised_round": self.raised_round,
+            "resolved_round": self.resolved_round,
+            "status": _label(self.status),
+        }
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Issue):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self) -> str:
+        return f"Issue(key={self.key!r}, status={_label(self.status)!r})"
+
+
+def turns_from_json(entries: Iterable[Dict[str, Any]]) -> List[Turn]:
+    return [Turn.from_dict(entry) for entry in entries]
+
+
+def turns_to_json(turns: Iterable[Turn]) -> List[Dict[str, Any]]:
+    return [turn.to_dict() for turn in turns]
+
+
+def issues_from_json(records: Iterable[Dict[str, Any]]) -> List[Issue]:
+    return [Issue.from_dict(record) for record in records]
+
+
+def issues_to_json(issues: Iterable[Issue]) -> List[Dict[str, Any]]:
+    return [issue.to_dict() for issue in issues]
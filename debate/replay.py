@@ -0,0 +1,351 @@
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from langgraph.graph import END, StateGraph
+
+from debate.packs import PACK_DIRNAME, PackReader
+from debate.snapshots import SNAPSHOTS_FILENAME, decode_snapshots
+from debate.stepping import graph_tables
+from debate_runner import build_facts, build_graph, result_from_payload
+
+
+STAGE_NODES = {
+    "argue": "researcher",
+    "critique": "critic",
+    "devil": "devil",
+    "revise": "revision",
+    "synthesize": "synthesizer",
+    "verdict": "judge",
+}
+# Stage of the turn whose node adds an issue raised by each agent.
+RAISER_STAGES = {"Critic": "critique", "Devil's Advocate": "devil"}
+FINAL_FIELDS = ("scores", "decision", "consensus_reached", "open_issues")
+
+# (run directory, None) for per-run layouts, (pack directory, key) for packed runs.
+Source = Tuple[str, Optional[str]]
+
+
+@dataclass
+class Divergence:
+    node: str
+    field: str
+    turn: Optional[int]
+    round: Optional[int]
+    expected: Any
+    actual: Any
+
+    def describe(self) -> str:
+        where = f"turn {self.turn} (round {self.round})" if self.turn is not None else "final state"
+        expected, actual = self.expected, self.actual
+        path = ""
+        # Descend to the first differing list item or dict key so the excerpt shows the actual change.
+        while True:
+            if isinstance(expected, list) and isinstance(actual, list):
+                pairs = list(enumerate(zip(expected, actual)))
+                idx = next((idx for idx, (a, b) in pairs if a != b), min(len(expected), len(actual)))
+                if idx >= len(expected) or idx >= len(actual):
+                    expected, actual = len(expected), len(actual)
+                    path += ".length"
+                    break
+                expected, actual = expected[idx], actual[idx]
+                path += f"[{idx}]"
+            elif isinstance(expected, dict) and isinstance(actual, dict):
+                name = first_difference(expected, actual)
+                if name is None:
+                    break
+                expected, actual = expected.get(name), actual.get(name)
+                path += f".{name}"
+            else:
+                break
+        if isinstance(expected, str) and isinstance(actual, str):
+            # Long turn contents: start both excerpts a little before the first differing character.
+            cut = next((idx for idx, (a, b) in enumerate(zip(expected, actual)) if a != b), min(len(expected), len(actual)))
+            start = max(0, cut - 40)
+            expected, actual = expected[start:], actual[start:]
+            where += f", char {cut}"
+        return (
+            f"{self.node} diverged at {where} on {self.field}{path}: "
+            f"expected {json.dumps(expected)[:160]}, got {json.dumps(actual)[:160]}"
+        )
+
+
+@dataclass
+class ReplayReport:
+    key: str
+    turns_checked: int
+    seconds: float
+    divergence: Optional[Divergence] = None
+    error: str = ""
+
+    @property
+    def ok(self) -> bool:
+        return self.divergence is None and not self.error
+
+
+def expected_issues(final_issues: List[Dict[str, Any]], seen: Set[Tuple[int, str]]) -> List[Dict[str, Any]]:
+    """Project the stored final issue list back to the point where the turns in ``seen`` have been emitted."""
+    projected = []
+    for issue in final_issues:
+        if (issue["raised_round"], RAISER_STAGES.get(issue["raised_by"], "critique")) not in seen:
+            continue
+        if issue["resolved_round"] is not None and (issue["resolved_round"], "revise") not in seen:
+            issue = {**issue, "status": "open", "resolved_round": None}
+        projected.append(issue)
+    return projected
+
+
+def first_difference(expected: Dict[str, Any], actual: Dict[str, Any]) -> Optional[str]:
+    for name in sorted(set(expected) | set(actual)):
+        if expected.get(name) != actual.get(name):
+            return name
+    return None
+
+
+def direct_steps(graph: StateGraph, state: Dict[str, Any], limit: int) -> Optional[Iterator[Tuple[str, Dict[str, Any]]]]:
+    """Walk a single-path graph by calling its node and router functions directly, skipping Pregel.
+
+    Returns None when the graph fans out; callers then fall back to compiled streaming.
+    """
+    tables = graph_tables(graph)
+    if tables is None:
+        return None
+
+    def walk() -> Iterator[Tuple[str, Dict[str, Any]]]:
+        current = state
+        yield "input", current
+        node = tables.entry
+        for _ in range(limit):
+            if node == END:
+                return
+            current = {**current, **tables.nodes[node](current)}
+            yield node, current
+            node = tables.next_node(node, current)
+        raise RuntimeError(f"Replay exceeded {limit} steps without reaching the end of the graph.")
+
+    return walk()
+
+
+def compiled_steps(graph: StateGraph, state: Dict[str, Any], limit: int) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    stream = graph.compile(checkpointer=None).stream(state, {"recursion_limit": limit}, stream_mode=["updates", "values"])
+    nodes: List[str] = []
+    try:
+        for mode, chunk in stream:
+            if mode == "updates":
+                nodes = list(chunk)
+                continue
+            yield "/".join(nodes) or "input", chunk
+    finally:
+        stream.close()
+
+
+def replay_payload(data: Dict[str, Any], compiled: bool = False) -> ReplayReport:
+    """Re-execute a stored run through the engine, checking every emitted turn and state transition.
+
+    Stops at the first divergence; nothing is rendered or written. Single-path topologies are stepped
+    directly through the graph's own node and router functions unless ``compiled`` is set.
+    """
+    started = time.perf_counter()
+    result = result_from_payload(data)
+    config = result.config
+    expected_turns = data["transcript"]
+    graph, initial_state, _ = build_graph(config, build_facts())
+    steps = None if compiled else direct_steps(graph, initial_state, config.recursion_limit())
+    if steps is None:
+        steps = compiled_steps(graph, initial_state, config.recursion_limit())
+
+    emitted = 0
+    seen: Set[Tuple[int, str]] = set()
+    completed_round = 0
+    final_state: Dict[str, Any] = initial_state
+
+    def report(divergence: Divergence) -> ReplayReport:
+        return ReplayReport(config.key, emitted, time.perf_counter() - started, divergence)
+
+    try:
+        for node, chunk in steps:
+            final_state = chunk
+            summary = chunk.get("history_summary") or {}
+            history = chunk["history"]
+            offset = summary.get("turns_compacted", 0)
+            for entry in history[max(0, emitted - offset):]:
+                stage_node = STAGE_NODES.get(entry["stage"], node)
+                if emitted >= len(expected_turns):
+                    return report(Divergence(stage_node, "transcript", emitted, entry["round"], None, entry))
+                expected = expected_turns[emitted]
+                field = first_difference(expected, entry)
+                if field is not None:
+                    return report(Divergence(
+                        stage_node, field, emitted, expected["round"], expected.get(field), entry.get(field)
+                    ))
+                seen.add((entry["round"], entry["stage"]))
+                if entry["stage"] == "revise":
+                    completed_round = entry["round"]
+                emitted += 1
+
+            turn = emitted - 1 if emitted else None
+            turn_round = expected_turns[turn]["round"] if turn is not None else None
+            if chunk["round_index"] != completed_round:
+                return report(Divergence(node, "round_index", turn, turn_round, completed_round, chunk["round_index"]))
+            projected = expected_issues(data["open_issues"], seen)
+            if chunk["open_issues"] != projected:
+                return report(Divergence(node, "open_issues", turn, turn_round, projected, chunk["open_issues"]))
+            actions = chunk["resolved_actions"]
+            action_offset = summary.get("resolved_actions_compacted", 0)
+            stored_actions = data["resolved_actions"][action_offset:action_offset + len(actions)]
+            if actions != stored_actions:
+                return report(Divergence(node, "resolved_actions", turn, turn_round, stored_actions, actions))
+    finally:
+        steps.close()
+
+    if emitted < len(expected_turns):
+        missing = expected_turns[emitted]
+        return report(Divergence(STAGE_NODES.get(missing["stage"], "?"), "transcript", emitted, missing["round"], missing, None))
+    actual_final = {
+        "scores": final_state["scores"],
+        "decision": final_state["final_decision"],
+        "consensus_reached": final_state["consensus_reached"],
+        "open_issues": final_state["open_issues"],
+    }
+    for name in FINAL_FIELDS:
+        if actual_final[name] != data[name]:
+            return report(Divergence("judge", name, None, None, data[name], actual_final[name]))
+    # Compacted notes are summarized as counts, so only the retained tail can be compared.
+    notes = final_state["convergence_notes"]
+    if notes != data["convergence_notes"][len(data["convergence_notes"]) - len(notes):]:
+        return report(Divergence("judge", "convergence_notes", None, None, data["convergence_notes"], notes))
+    if "round_snapshots" in data:
+        snapshots = final_state["round_snapshots"]
+        stored = data["round_snapshots"][len(data["round_snapshots"]) - len(snapshots):]
+        if snapshots != stored:
+            return report(Divergence("judge", "round_snapshots", None, None, stored, snapshots))
+    return ReplayReport(config.key, emitted, time.perf_counter() - started)
+
+
+_readers: Dict[str, PackReader] = {}
+
+
+def load_source(source: Source) -> Dict[str, Any]:
+    location, key = source
+    if key is None:
+        data = json.loads((Path(location) / "transcript.json").read_text(encoding="utf-8"))
+        snapshots_path = Path(location) / SNAPSHOTS_FILENAME
+        if snapshots_path.exists():
+            data["round_snapshots"] = decode_snapshots(snapshots_path.read_bytes())
+        return data
+    reader = _readers.get(location)
+    if reader is None:
+        reader = _readers[location] = PackReader(Path(location))
+    return reader.load_json(key)
+
+
+def replay_source(source: Source, compiled: bool = False) -> ReplayReport:
+    key = source[1] or Path(source[0]).name
+    try:
+        return replay_payload(load_source(source), compiled=compiled)
+    except Exception as exc:
+        return ReplayReport(key, 0, 0.0, error=f"{type(exc).__name__}: {exc}")
+
+
+def discover(output_dir: Path, patterns: Optional[List[str]] = None) -> List[Source]:
+    sources: List[Source] = [(str(path.parent), None) for path in sorted(output_dir.glob("*/transcript.json"))]
+    pack_dir = output_dir / PACK_DIRNAME
+    if pack_dir.is_dir():
+        sources.extend((str(pack_dir), key) for key in PackReader(pack_dir).keys())
+    if patterns:
+        sources = [
+            source for source in sources
+            if any(fnmatch.fnmatchcase(source[1] or Path(source[0]).name, pattern) for pattern in patterns)
+        ]
+    return sources
+
+
+def verify(
+    sources: List[Source],
+    workers: int = 1,
+    fail_fast: bool = False,
+    compiled: bool = False,
+) -> List[ReplayReport]:
+    if workers <= 1:
+        reports = []
+        for source in sources:
+            reports.append(replay_source(source, compiled))
+            if fail_fast and not reports[-1].ok:
+                break
+        return reports
+
+    reports = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Keep a bounded window in flight so a fail-fast stop does not leave thousands of queued runs.
+        pending: Set[Future] = set()
+        queued = iter(sources)
+        stop = False
+        while True:
+            while not stop and len(pending) < workers * 4:
+                source = next(queued, None)
+                if source is None:
+                    break
+                pending.add(executor.submit(replay_source, source, compiled))
+            if not pending:
+                break
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                reports.append(future.result())
+                if fail_fast and not reports[-1].ok:
+                    stop = True
+            if stop:
+                for future in pending:
+                    future.cancel()
+                pending = set()
+    return sorted(reports, key=lambda report: report.key)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Replay stored runs through the engine and report the first divergence.")
+    parser.add_argument("output", nargs="?", default="results", help="Output directory with run folders and/or packs/.")
+    parser.add_argument("--keys", nargs="*", default=None, help="Run keys or glob patterns to verify (default: all).")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Processes replaying runs in parallel.")
+    parser.add_argument("--fail-fast", action="store_true", help="Stop the sweep at the first diverging run.")
+    parser.add_argument(
+        "--compiled",
+        action="store_true",
+        help="Execute every run through the compiled LangGraph app instead of stepping nodes directly.",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    sources = discover(Path(args.output), args.keys)
+    if not sources:
+        raise SystemExit(f"No stored runs found under {args.output}")
+
+    started = time.perf_counter()
+    reports = verify(sources, workers=args.workers, fail_fast=args.fail_fast, compiled=args.compiled)
+    elapsed = time.perf_counter() - started
+
+    failed = [report for report in reports if not report.ok]
+    for report in failed:
+        detail = report.divergence.describe() if report.divergence else report.error
+        print(f"❌ {report.key}: {detail}")
+    print(json.dumps({
+        "runs": len(reports),
+        "verified": len(reports) - len(failed),
+        "diverged": len(failed),
+        "turns_checked": sum(report.turns_checked for report in reports),
+        "seconds": round(elapsed, 2),
+    }))
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Counter-based random streams for ``LocalDebateModel``.
+
+Every draw is a pure function of ``(seed, agent, round, call site, draw index)``, so a node's output
+no longer depends on how many draws earlier nodes made. Nodes can be skipped, reordered, cached or
+run concurrently and still produce identical turns.
+
+Migrating existing seeds: ``DebateConfig.rng`` selects the scheme. ``"shared"`` is the default and
+keeps the original single ``random.Random(seed)``, so every existing config, stored run and
+service payload reproduces unchanged; ``load_result`` treats stored configs without an ``rng`` key
+the same way. ``"counter"`` uses these streams and is opt-in: set ``rng="counter"`` on a config, or
+pass ``--rng counter`` to ``debate_runner.py`` for the selected presets. Opting in keeps the seed's
+meaning but changes the sampled turns once, so regenerate that config's results when switching.
+Features that need independent streams (``parallel_review``) refuse to run on ``"shared"``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Any, List
+
+
+RNG_SCHEMES = ("counter", "shared")
+
+
+class CounterStream:
+    """Minimal ``random.Random`` stand-in (``random``/``shuffle``) backed by a keyed hash counter."""
+
+    __slots__ = ("prefix", "counter")
+
+    def __init__(self, seed: int, *labels: Any):
+        self.prefix = "|".join(str(part) for part in (seed,) + labels).encode("utf-8")
+        self.counter = 0
+
+    def random(self) -> float:
+        digest = hashlib.blake2b(b"%s|%d" % (self.prefix, self.counter), digest_size=8).digest()
+        self.counter += 1
+        # Top 53 bits give a uniform float in [0, 1), matching random.random()'s resolution.
+        return (int.from_bytes(digest, "big") >> 11) * (1.0 / (1 << 53))
+
+    def shuffle(self, items: List[Any]) -> None:
+        for idx in range(len(items) - 1, 0, -1):
+            swap = int(self.random() * (idx + 1))
+            items[idx], items[swap] = items[swap], items[idx]
@@ -0,0 +1,414 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import dataclasses
+import json
+import re
+import shutil
+import tempfile
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from debate_runner import (
+    AgentSpec,
+    DebateConfig,
+    DebateResult,
+    LocalDebateModel,
+    attach_spill,
+    build_facts,
+    build_graph,
+    collect_result,
+    dependency_manifest,
+    initial_debate_state,
+    persist_run,
+    prepare_configs,
+    record_run,
+    topology_key,
+)
+from debate.compaction import restore_state
+from debate.metrics import METRICS, render_prometheus
+from debate.stats import percentile
+
+
+MAX_BODY_BYTES = 1 << 20
+# Run keys become directory names under --output, so only plain slugs are accepted from clients.
+SAFE_KEY = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]{0,127}$")
+
+Emit = Callable[[str, Any], None]
+
+
+def parse_config(payload: Any) -> DebateConfig:
+    if not isinstance(payload, dict):
+        raise ValueError("Debate payload must be a JSON object.")
+    data = dict(payload)
+    preset = data.pop("preset", None)
+    if preset is None:
+        return validate_key(DebateConfig(**data))
+    presets = prepare_configs()
+    if preset not in presets:
+        raise ValueError(f"Unknown preset: {preset}")
+    return validate_key(dataclasses.replace(presets[preset], **data))
+
+
+def validate_key(config: DebateConfig) -> DebateConfig:
+    if not isinstance(config.key, str) or not SAFE_KEY.match(config.key) or ".." in config.key:
+        raise ValueError(f"Invalid key {config.key!r}: use letters, digits, '_', '-' or '.' (no path separators or '..').")
+    return config
+
+
+@dataclass
+class WarmGraph:
+    cache_key: str
+    compiled: Any
+    specs: Dict[str, AgentSpec]
+    model: LocalDebateModel
+
+
+class GraphPool:
+    """Keeps compiled graphs per topology so repeat jobs skip graph construction and compile.
+
+    Graphs are shared across keys and seeds: ``acquire`` rebinds the pooled model to the job's config,
+    and each run starts from ``initial_debate_state(config)``.
+    """
+
+    def __init__(self, facts: Dict[str, Any], max_configs: int = 256):
+        self.facts = facts
+        self.max_configs = max_configs
+        self.hits = 0
+        self.misses = 0
+        self._idle: "OrderedDict[str, List[WarmGraph]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def acquire(self, config: DebateConfig) -> WarmGraph:
+        # rng is part of the key so build_graph's parallel_review check still runs for each scheme.
+        cache_key = json.dumps([*topology_key(config), config.rng])
+        with self._lock:
+            idle = self._idle.get(cache_key)
+            if idle:
+                self._idle.move_to_end(cache_key)
+                self.hits += 1
+                warm = idle.pop()
+                warm.model.reset(config)
+                return warm
+            self.misses += 1
+
+        model = LocalDebateModel(config, self.facts)
+        graph, _, specs = build_graph(config, self.facts, model)
+        return WarmGraph(
+            cache_key=cache_key,
+            compiled=graph.compile(checkpointer=None),
+            specs=specs,
+            model=model,
+        )
+
+    def release(self, warm: WarmGraph) -> None:
+        with self._lock:
+            self._idle.setdefault(warm.cache_key, []).append(warm)
+            self._idle.move_to_end(warm.cache_key)
+            while len(self._idle) > self.max_configs:
+                self._idle.popitem(last=False)
+
+
+class ServiceStats:
+    def __init__(self, window: int = 2048):
+        self.started = time.time()
+        self.accepted = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.latencies: Deque[float] = deque(maxlen=window)
+        self.queue_waits: Deque[float] = deque(maxlen=window)
+        self.finished_at: Deque[float] = deque(maxlen=window)
+
+    def record(self, latency: float, queue_wait: float, ok: bool) -> None:
+        if ok:
+            self.completed += 1
+        else:
+            self.failed += 1
+        self.latencies.append(latency)
+        self.queue_waits.append(queue_wait)
+        self.finished_at.append(time.time())
+
+    def snapshot(self, in_flight: int, workers: int, capacity: int) -> Dict[str, Any]:
+        uptime = time.time() - self.started
+        latencies = list(self.latencies)
+        waits = list(self.queue_waits)
+        window_rate = 0.0
+        if len(self.finished_at) >= 2:
+            span = self.finished_at[-1] - self.finished_at[0]
+            if span > 0:
+                window_rate = (len(self.finished_at) - 1) / span
+        return {
+            "uptime_s": round(uptime, 3),
+            "accepted": self.accepted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "in_flight": in_flight,
+            "queue_depth": max(0, in_flight - workers),
+            "capacity": capacity,
+            "throughput_per_s": round(self.completed / uptime, 3) if uptime > 0 else 0.0,
+            "window_throughput_per_s": round(window_rate, 3),
+            "latency_ms": {
+                "p50": round(percentile(latencies, 50) * 1000, 2),
+                "p90": round(percentile(latencies, 90) * 1000, 2),
+                "p99": round(percentile(latencies, 99) * 1000, 2),
+            },
+            "queue_wait_ms": {
+                "p50": round(percentile(waits, 50) * 1000, 2),
+                "p99": round(percentile(waits, 99) * 1000, 2),
+            },
+        }
+
+
+class DebateService:
+    """Serves debate jobs over HTTP on a bounded worker pool, streaming turns as SSE."""
+
+    def __init__(self, workers: int = 4, max_queue: int = 16, output_dir: Optional[Path] = None):
+        self.workers = workers
+        self.capacity = workers + max_queue
+        self.output_dir = output_dir
+        self.pool = GraphPool(build_facts())
+        self.stats = ServiceStats()
+        self.in_flight = 0
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="debate")
+
+    def run_streaming(self, config: DebateConfig, emit: Emit) -> DebateResult:
+        started = time.perf_counter()
+        warm = self.pool.acquire(config)
+        # Compacted turns spill to a per-job scratch file so concurrent jobs with one key never share it.
+        scratch = Path(tempfile.mkdtemp(prefix="debate-spill-")) if config.history_window > 0 else None
+        try:
+            state = initial_debate_state(config)
+            spill_path = attach_spill(config, scratch, state) if scratch is not None else None
+            final_state = state
+            emitted = 0
+            run_config = {"recursion_limit": config.recursion_limit()}
+            for final_state in warm.compiled.stream(state, run_config, stream_mode="values"):
+                # Compaction drops folded turns from the state, so count them back in.
+                history = final_state["history"]
+                offset = (final_state.get("history_summary") or {}).get("turns_compacted", 0)
+                for entry in history[max(0, emitted - offset):]:
+                    emit("turn", entry)
+                emitted = offset + len(history)
+            if spill_path is not None:
+                final_state = restore_state(final_state)
+            result = collect_result(config, final_state)
+            # Read before release: the next acquire resets the pooled model.
+            result.dependencies = dependency_manifest(warm.model, result)
+        finally:
+            self.pool.release(warm)
+            if scratch is not None:
+                shutil.rmtree(scratch, ignore_errors=True)
+
+        if self.output_dir is not None:
+            persist_run(result, warm.specs, self.output_dir)
+        record_run(result, time.perf_counter() - started)
+        return result
+
+    def snapshot(self) -> Dict[str, Any]:
+        data = self.stats.snapshot(self.in_flight, self.workers, self.capacity)
+        data["graph_cache"] = {"hits": self.pool.hits, "misses": self.pool.misses}
+        return data
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            try:
+                method, path, body = await read_request(reader)
+            except (ValueError, asyncio.IncompleteReadError) as exc:
+                await send_json(writer, 400, {"error": str(exc) or "malformed request"})
+                return
+
+            if method == "GET" and path == "/health":
+                await send_json(writer, 200, {"status": "ok"})
+            elif method == "GET" and path == "/stats":
+                await send_json(writer, 200, self.snapshot())
+            elif method == "GET" and path == "/metrics":
+                await send_text(writer, 200, render_prometheus([METRICS.snapshot()]), "text/plain; version=0.0.4")
+            elif method == "POST" and path == "/debates":
+                await self.handle_debate(body, writer)
+            else:
+                await send_json(writer, 404, {"error": f"No route for {method} {path}"})
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+
+    async def handle_debate(self, body: bytes, writer: asyncio.StreamWriter) -> None:
+        try:
+            config = parse_config(json.loads(body or b"{}"))
+        except (ValueError, TypeError) as exc:
+            await send_json(writer, 400, {"error": str(exc)})
+            return
+
+        if self.in_flight >= self.capacity:
+            self.stats.rejected += 1
+            await send_json(writer, 503, {"error": "queue full", "in_flight": self.in_flight}, {"Retry-After": "1"})
+            return
+
+        self.in_flight += 1
+        self.stats.accepted += 1
+        self._publish_load()
+        loop = asyncio.get_running_loop()
+        events: "asyncio.Queue[Optional[Tuple[str, Any]]]" = asyncio.Queue()
+        submitted = time.perf_counter()
+        started: List[float] = []
+
+        def emit(event: str, data: Any) -> None:
+            loop.call_soon_threadsafe(events.put_nowait, (event, data))
+
+        def job() -> None:
+            started.append(time.perf_counter())
+            ok = False
+            try:
+                result = self.run_streaming(config, emit)
+                emit("result", {
+                    "config": result.config.key,
+                    "scores": result.scores,
+                    "decision": result.decision,
+                    "consensus_reached": result.consensus_reached,
+                    "turns": len(result.transcript),
+                })
+                ok = True
+            except Exception as exc:
+                emit("error", {"error": f"{type(exc).__name__}: {exc}"})
+            finally:
+                finished = time.perf_counter()
+                loop.call_soon_threadsafe(self._finish, finished - submitted, started[0] - submitted, ok)
+                loop.call_soon_threadsafe(events.put_nowait, None)
+
+        loop.run_in_executor(self.executor, job)
+
+        connected = True
+        try:
+            writer.write(
+                b"HTTP/1.1 200 OK\r\n"
+                b"Content-Type: text/event-stream\r\n"
+                b"Cache-Control: no-cache\r\n"
+                b"Connection: close\r\n\r\n"
+            )
+            await writer.drain()
+        except ConnectionError:
+            connected = False
+
+        # Keep consuming after a client disconnect so the queue is drained and the job finishes cleanly.
+        while True:
+            item = await events.get()
+            if item is None:
+                break
+            if not connected:
+                continue
+            event, data = item
+            try:
+                writer.write(f"event: {event}\ndata: {json.dumps(data)}\n\n".encode("utf-8"))
+                await writer.drain()
+            except ConnectionError:
+                connected = False
+
+    def _finish(self, latency: float, queue_wait: float, ok: bool) -> None:
+        self.in_flight -= 1
+        self.stats.record(latency, queue_wait, ok)
+        self._publish_load()
+
+    def _publish_load(self) -> None:
+        METRICS.set("debate_in_flight", self.in_flight)
+        METRICS.set("debate_queue_depth", max(0, self.in_flight - self.workers))
+
+    async def serve(self, host: str, port: int) -> None:
+        server = await asyncio.start_server(self.handle, host, port)
+        addresses = ", ".join(str(sock.getsockname()) for sock in server.sockets)
+        print(f"🛰️ Debate service listening on {addresses} (workers={self.workers}, capacity={self.capacity})")
+        async with server:
+            await server.serve_forever()
+
+
+async def read_request(reader: asyncio.StreamReader) -> Tuple[str, str, bytes]:
+    request_line = (await reader.readline()).decode("latin-1").strip()
+    parts = request_line.split()
+    if len(parts) != 3:
+        raise ValueError(f"Bad request line: {request_line!r}")
+    method, path, _ = parts
+
+    headers: Dict[str, str] = {}
+    while True:
+        line = (await reader.readline()).decode("latin-1")
+        if line in ("\r\n", "\n", ""):
+            break
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    length = int(headers.get("content-length", "0") or 0)
+    if length > MAX_BODY_BYTES:
+        raise ValueError("Request body too large.")
+    body = await reader.readexactly(length) if length else b""
+    return method.upper(), path.split("?", 1)[0], body
+
+
+async def send_json(
+    writer: asyncio.StreamWriter,
+    status: int,
+    payload: Dict[str, Any],
+    extra_headers: Optional[Dict[str, str]] = None,
+) -> None:
+    await send_text(writer, status, json.dumps(payload), "application/json", extra_headers)
+
+
+async def send_text(
+    writer: asyncio.StreamWriter,
+    status: int,
+    text: str,
+    content_type: str,
+    extra_headers: Optional[Dict[str, str]] = None,
+) -> None:
+    reasons = {200: "OK", 400: "Bad Request", 404: "Not Found", 503: "Service Unavailable"}
+    body = text.encode("utf-8")
+    head = [
+        f"HTTP/1.1 {status} {reasons.get(status, 'OK')}",
+        f"Content-Type: {content_type}",
+        f"Content-Length: {len(body)}",
+        "Connection: close",
+    ]
+    head.extend(f"{name}: {value}" for name, value in (extra_headers or {}).items())
+    writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body)
+    await writer.drain()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Serve debate jobs over HTTP with server-sent event streaming.")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind.")
+    parser.add_argument("--port", type=int, default=8765, help="Port to bind.")
+    parser.add_argument("--workers", type=int, default=4, help="Debates executed concurrently.")
+    parser.add_argument(
+        "--max-queue",
+        type=int,
+        default=16,
+        help="Accepted jobs allowed to wait for a worker; beyond this the service answers 503.",
+    )
+    parser.add_argument(
+        "--output",
+        default=None,
+        help="Persist each finished run here (default: stream only, write nothing).",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    output_dir = Path(args.output) if args.output else None
+    if output_dir is not None:
+        output_dir.mkdir(parents=True, exist_ok=True)
+    service = DebateService(workers=args.workers, max_queue=args.max_queue, output_dir=output_dir)
+    try:
+        asyncio.run(service.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+import math
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional
+
+from debate.metrics import METRICS
+from debate.stats import percentile
+from debate_runner import DebateConfig, IssueRecord, LocalDebateModel
+
+
+CHARS_PER_TOKEN = 4
+# Fixed per-call prompt: system prompt, persona and scenario text every agent is sent.
+PROMPT_OVERHEAD_TOKENS = 600
+DISTRIBUTIONS = ("constant", "uniform", "exponential", "lognormal")
+
+
+class BackendError(RuntimeError):
+    """A simulated backend call failed on every attempt."""
+
+
+@dataclass
+class LatencyProfile:
+    distribution: str = "lognormal"
+    base_ms: float = 200.0  # constant value, uniform midpoint, exponential mean or lognormal median
+    spread: float = 0.5  # lognormal sigma; uniform half-width as a fraction of base_ms
+    prompt_ms_per_1k_tokens: float = 0.0  # prefill cost
+    output_tokens_per_s: float = 0.0  # decode speed; 0 leaves output free
+    error_rate: float = 0.0
+    timeout_rate: float = 0.0
+    timeout_s: float = 5.0
+    tokens_per_minute: float = 0.0  # shared rate limit on prompt tokens; 0 disables it
+    seed: int = 0
+
+    def __post_init__(self) -> None:
+        if self.distribution not in DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution: {self.distribution}")
+
+    def sample(self, rng: random.Random) -> float:
+        base = self.base_ms / 1000.0
+        if self.distribution == "constant":
+            return base
+        if self.distribution == "uniform":
+            return max(0.0, rng.uniform(base * (1 - self.spread), base * (1 + self.spread)))
+        if self.distribution == "exponential":
+            return rng.expovariate(1.0 / base) if base > 0 else 0.0
+        return base * math.exp(rng.gauss(0.0, self.spread))
+
+    def fault(self, rng: random.Random) -> str:
+        roll = rng.random()
+        if roll < self.timeout_rate:
+            return "timeout"
+        if roll < self.timeout_rate + self.error_rate:
+            return "error"
+        return ""
+
+
+@dataclass
+class RetryPolicy:
+    max_attempts: int = 3
+    backoff_s: float = 0.05
+    multiplier: float = 2.0
+    jitter: float = 0.5
+
+    def delay(self, attempt: int, rng: random.Random) -> float:
+        base = self.backoff_s * self.multiplier ** (attempt - 1)
+        return base * (1 + self.jitter * rng.random())
+
+
+class TokenBucket:
+    """Shared prompt-token budget; callers block until the tokens they spend have refilled.
+
+    A request larger than the burst capacity is still charged in full: the balance goes negative and
+    the caller sleeps until the debt is repaid, so later callers queue behind it.
+    """
+
+    def __init__(
+        self,
+        tokens_per_minute: float,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.rate = tokens_per_minute / 60.0
+        self.capacity = max(self.rate, 1.0)
+        self.clock = clock
+        self.sleep = sleep
+        self.tokens = self.capacity
+        self.updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float) -> float:
+        with self._lock:
+            now = self.clock()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= tokens
+            wait = max(0.0, -self.tokens / self.rate)
+        if wait:
+            self.sleep(wait)
+        return wait
+
+
+@dataclass
+class BackendStats:
+    latencies: Dict[str, List[float]] = field(default_factory=dict)
+    calls: int = 0
+    attempts: int = 0
+    errors: int = 0
+    timeouts: int = 0
+    failed_calls: int = 0
+    throttled_s: float = 0.0
+    prompt_tokens: int = 0
+    output_tokens: int = 0
+
+    def __post_init__(self) -> None:
+        self._lock = threading.Lock()
+
+    def record_attempt(self, agent: str, fault: str, throttled: float) -> None:
+        with self._lock:
+            self.attempts += 1
+            self.throttled_s += throttled
+            if fault == "error":
+                self.errors += 1
+            elif fault == "timeout":
+                self.timeouts += 1
+        if fault:
+            METRICS.inc("debate_backend_faults_total", agent=agent, kind=fault)
+
+    def record_call(self, agent: str, latency: float, prompt_tokens: int, output_tokens: int, ok: bool) -> None:
+        with self._lock:
+            self.calls += 1
+            self.latencies.setdefault(agent, []).append(latency)
+            self.prompt_tokens += prompt_tokens
+            self.output_tokens += output_tokens
+            if not ok:
+                self.failed_calls += 1
+        METRICS.observe("debate_backend_call_seconds", latency, agent=agent)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            every = [value for values in self.latencies.values() for value in values]
+            per_agent = {
+                agent: {
+                    "calls": len(values),
+                    "p50_ms": round(percentile(values, 50) * 1000, 1),
+                    "p99_ms": round(percentile(values, 99) * 1000, 1),
+                }
+                for agent, values in sorted(self.latencies.items())
+            }
+            return {
+                "calls": self.calls,
+                "attempts": self.attempts,
+                "retry_rate": round((self.attempts - self.calls) / self.calls, 4) if self.calls else 0.0,
+                "errors": self.errors,
+                "timeouts": self.timeouts,
+                "failed_calls": self.failed_calls,
+                "throttled_s": round(self.throttled_s, 3),
+                "prompt_tokens": self.prompt_tokens,
+                "output_tokens": self.output_tokens,
+                "call_p50_ms": round(percentile(every, 50) * 1000, 1),
+                "call_p95_ms": round(percentile(every, 95) * 1000, 1),
+                "call_p99_ms": round(percentile(every, 99) * 1000, 1),
+                "agents": per_agent,
+            }
+
+
+def issue_chars(open_issues: List[IssueRecord]) -> int:
+    return sum(len(issue["key"]) + len(issue["description"]) for issue in open_issues)
+
+
+class SimulatedModel(LocalDebateModel):
+    """LocalDebateModel behind a simulated LLM endpoint: sampled latency, prompt/output token costs,
+    a shared rate limit, and injected errors and timeouts retried per ``RetryPolicy``.
+
+    Faults are decided before the turn is generated and each turn is generated once, so the
+    transcript is identical to an undelayed run whatever the injected failures.
+    """
+
+    def __init__(
+        self,
+        config: DebateConfig,
+        facts: Dict[str, Any],
+        profile: LatencyProfile,
+        stats: Optional[BackendStats] = None,
+        retry: Optional[RetryPolicy] = None,
+        bucket: Optional[TokenBucket] = None,
+    ):
+        super().__init__(config, facts)
+        self.profile = profile
+        self.stats = stats if stats is not None else BackendStats()
+        self.retry = retry or RetryPolicy()
+        self.bucket = bucket
+        # Separate from the debate's own streams so simulation draws never change the text.
+        self.sim_random = random.Random(f"{profile.seed}:{config.key}:{config.seed}")
+        self._lock = threading.Lock()
+
+    def _call(self, agent: str, prompt_chars: int, generate: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        prompt_tokens = PROMPT_OVERHEAD_TOKENS + prompt_chars // CHARS_PER_TOKEN
+        started = time.perf_counter()
+        for attempt in range(1, self.retry.max_attempts + 1):
+            with self._lock:
+                latency = self.profile.sample(self.sim_random)
+                fault = self.profile.fault(self.sim_random)
+                backoff = self.retry.delay(attempt, self.sim_random)
+            throttled = self.bucket.acquire(prompt_tokens) if self.bucket is not None else 0.0
+            self.stats.record_attempt(agent, fault, throttled)
+            prefill = prompt_tokens / 1000.0 * self.profile.prompt_ms_per_1k_tokens / 1000.0
+            if fault == "timeout":
+                time.sleep(self.profile.timeout_s)
+            elif fault == "error":
+                # Failures surface after the request is queued and prefilled, before any output.
+                time.sleep(latency + prefill)
+            else:
+                result = generate()
+                output_tokens = len(result["content"]) // CHARS_PER_TOKEN
+                decode = output_tokens / self.profile.output_tokens_per_s if self.profile.output_tokens_per_s else 0.0
+                time.sleep(latency + prefill + decode)
+                self.stats.record_call(agent, time.perf_counter() - started, prompt_tokens, output_tokens, True)
+                return result
+            if attempt < self.retry.max_attempts:
+                time.sleep(backoff)
+        self.stats.record_call(agent, time.perf_counter() - started, prompt_tokens, 0, False)
+        raise BackendError(f"{agent} call failed after {self.retry.max_attempts} attempts")
+
+    def make_researcher(
+        self,
+        round_number: int,
+        open_issues: List[IssueRecord],
+        prior_feedback: List[str],
+    ) -> Dict[str, Any]:
+        prompt = issue_chars(open_issues) + sum(len(text) for text in prior_feedback)
+        return self._call("researcher", prompt, partial(super().make_researcher, round_number, open_issues, prior_feedback))
+
+    def make_critic(self, round_number: int, open_issues: List[IssueRecord]) -> Dict[str, Any]:
+        return self._call("critic", issue_chars(open_issues), partial(super().make_critic, round_number, open_issues))
+
+    def make_devil(self, round_number: int, open_issues: List[IssueRecord]) -> Dict[str, Any]:
+        return self._call("devil", issue_chars(open_issues), partial(super().make_devil, round_number, open_issues))
+
+    def make_revision(self, round_number: int, open_issues: List[IssueRecord]) -> Dict[str, Any]:
+        return self._call("revision", issue_chars(open_issues), partial(super().make_revision, round_number, open_issues))
+
+    def make_synthesizer(
+        self,
+        round_number: int,
+        open_issues: List[IssueRecord],
+        resolved_actions: List[str],
+    ) -> Dict[str, Any]:
+        prompt = issue_chars(open_issues) + sum(len(text) for text in resolved_actions)
+        generate = partial(super().make_synthesizer, round_number, open_issues, resolved_actions)
+        return self._call("synthesizer", prompt, generate)
+
+    def make_judge(
+        self,
+        open_issues: List[IssueRecord],
+        signals: Dict[str, bool],
+        convergence_notes: List[str],
+    ) -> Dict[str, Any]:
+        prompt = issue_chars(open_issues) + sum(len(text) for text in convergence_notes)
+        return self._call("judge", prompt, partial(super().make_judge, open_issues, signals, convergence_notes))
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import sys
+from array import array
+from typing import Dict, List
+
+
+SNAPSHOTS_FILENAME = "convergence.bin"
+# One row per completed round, emitted by the node that closes it (the synthesizer when present,
+# otherwise revision). Stored as little-endian int32, row-major, with no header.
+SNAPSHOT_FIELDS = ("round", "open", "resolved", "signals", "agreement")
+# Agreement for rounds without a synthesizer turn; otherwise 0 or 1 from make_synthesizer.
+NO_SYNTHESIZER = -1
+
+
+def signal_bits(signals: Dict[str, bool], keys: List[str]) -> int:
+    return sum(1 << bit for bit, key in enumerate(keys) if signals.get(key))
+
+
+def encode_snapshots(rows: List[List[int]]) -> bytes:
+    flat = array("i", (value for row in rows for value in row))
+    if sys.byteorder == "big":
+        flat.byteswap()
+    return flat.tobytes()
+
+
+def decode_snapshots(blob: bytes) -> List[List[int]]:
+    flat = array("i")
+    flat.frombytes(blob)
+    if sys.byteorder == "big":
+        flat.byteswap()
+    width = len(SNAPSHOT_FIELDS)
+    return [flat[start:start + width].tolist() for start in range(0, len(flat), width)]
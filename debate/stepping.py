@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from importlib.metadata import PackageNotFoundError, version
+from typing import Annotated, Any, Callable, Dict, List, Optional, Tuple, get_origin, get_type_hints
+
+from langgraph.graph import START, StateGraph
+
+
+# graph_tables reads StateGraph attributes that are not public API; only releases checked against
+# tests/test_stepping.py are trusted, anything else steps through the compiled app.
+SUPPORTED_LANGGRAPH = ("1.2.",)
+
+
+Node = Callable[[Dict[str, Any]], Dict[str, Any]]
+Router = Tuple[Callable[[Dict[str, Any]], str], Optional[Dict[str, str]]]
+
+
+@dataclass
+class GraphTables:
+    """Plain-function view of a single-path StateGraph: node bodies, static edges and routers."""
+
+    entry: str
+    nodes: Dict[str, Node]
+    edges: Dict[str, str]
+    routers: Dict[str, Router]
+
+    def next_node(self, node: str, state: Dict[str, Any]) -> str:
+        if node in self.routers:
+            route, ends = self.routers[node]
+            target = route(state)
+            return ends[target] if ends else target
+        return self.edges[node]
+
+
+def langgraph_supported() -> bool:
+    try:
+        return version("langgraph").startswith(SUPPORTED_LANGGRAPH)
+    except PackageNotFoundError:
+        return False
+
+
+def has_reducers(schema: Any) -> bool:
+    """True if any state key is ``Annotated`` with a reducer, which a plain dict merge would bypass."""
+    hints = get_type_hints(schema, include_extras=True)
+    return any(
+        get_origin(hint) is Annotated and any(callable(meta) for meta in hint.__metadata__) for hint in hints.values()
+    )
+
+
+def graph_tables(graph: StateGraph) -> Optional[GraphTables]:
+    """Read a built (uncompiled) graph's tables, or None if stepping it directly could differ from Pregel.
+
+    Every node must have exactly one successor (a static edge or a single router), so callers can
+    step it without Pregel's superstep scheduling. Node updates are merged by plain assignment, so
+    state schemas with reducers are refused, as are LangGraph releases outside ``SUPPORTED_LANGGRAPH``.
+    """
+    if not langgraph_supported():
+        return None
+    try:
+        if has_reducers(graph.state_schema):
+            return None
+        if getattr(graph, "waiting_edges", None) or any(not isinstance(src, str) for src, _ in graph.edges):
+            return None
+        nodes = {name: spec.runnable.func for name, spec in graph.nodes.items()}
+        targets: Dict[str, List[str]] = {}
+        for src, dst in graph.edges:
+            targets.setdefault(src, []).append(dst)
+        routers: Dict[str, Router] = {}
+        for src, branches in graph.branches.items():
+            if len(branches) != 1 or src in targets:
+                return None
+            (branch,) = branches.values()
+            routers[src] = (branch.path.func, branch.ends)
+    except AttributeError:
+        return None
+    if len(targets.get(START, [])) != 1 or any(len(dsts) != 1 for dsts in targets.values()):
+        return None
+    edges = {src: dsts[0] for src, dsts in targets.items() if src != START}
+    return GraphTables(entry=targets[START][0], nodes=nodes, edges=edges, routers=routers)
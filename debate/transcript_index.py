@@ -0,0 +1,358 @@
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sqlite3
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
+
+
+INDEX_FILENAME = "transcript_index.sqlite3"
+
+SCHEMA = [
+    "CREATE TABLE IF NOT EXISTS runs (run TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, turns INTEGER)",
+    """
+    CREATE TABLE IF NOT EXISTS turns (
+        run TEXT, idx INTEGER, round INTEGER, stage TEXT, speaker TEXT, role TEXT,
+        PRIMARY KEY (run, idx)
+    )
+    """,
+    "CREATE TABLE IF NOT EXISTS postings (term TEXT, run TEXT, idx INTEGER, positions TEXT)",
+    "CREATE INDEX IF NOT EXISTS postings_term ON postings (term)",
+    """
+    CREATE TABLE IF NOT EXISTS issues (
+        run TEXT, key TEXT, raised_by TEXT, raised_round INTEGER, resolved_round INTEGER, status TEXT
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS issues_key ON issues (key)",
+]
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+TURN_FIELDS = {"stage", "speaker", "role", "round"}
+ISSUE_FIELDS = {"issue", "raised", "resolved", "unresolved"}
+
+Hit = Tuple[str, int]
+
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class TranscriptIndex:
+    """Inverted index over turns, speakers, stages, rounds and issue lifecycles of every run directory."""
+
+    def __init__(self, path: Path, timeout: float = 30.0):
+        self.path = Path(path)
+        self.timeout = timeout
+        with self._transaction() as conn:
+            for statement in SCHEMA:
+                conn.execute(statement)
+
+    @classmethod
+    def for_output(cls, output_dir: Path) -> "TranscriptIndex":
+        return cls(output_dir / INDEX_FILENAME)
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(str(self.path), timeout=self.timeout, isolation_level=None)
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+
+    def index_run(self, run: str, data: Dict[str, Any], mtime_ns: int = 0, size: int = 0) -> None:
+        turn_rows = []
+        posting_rows = []
+        for idx, entry in enumerate(data["transcript"]):
+            turn_rows.append((run, idx, entry["round"], entry["stage"], entry["speaker"], entry["role"]))
+            positions: Dict[str, List[int]] = defaultdict(list)
+            for position, term in enumerate(tokenize(entry["content"])):
+                positions[term].append(position)
+            posting_rows.extend(
+                (term, run, idx, ",".join(map(str, offsets)))
+                for term, offsets in positions.items()
+            )
+        issue_rows = [
+            (run, issue["key"], issue["raised_by"], issue["raised_round"], issue["resolved_round"], issue["status"])
+            for issue in data["open_issues"]
+        ]
+
+        with self._transaction() as conn:
+            self._delete(conn, run)
+            conn.execute(
+                "INSERT INTO runs (run, mtime_ns, size, turns) VALUES (?, ?, ?, ?)",
+                (run, mtime_ns, size, len(turn_rows)),
+            )
+            conn.executemany("INSERT INTO turns VALUES (?, ?, ?, ?, ?, ?)", turn_rows)
+            conn.executemany("INSERT INTO postings VALUES (?, ?, ?, ?)", posting_rows)
+            conn.executemany("INSERT INTO issues VALUES (?, ?, ?, ?, ?, ?)", issue_rows)
+
+    def _delete(self, conn: sqlite3.Connection, run: str) -> None:
+        for table in ("runs", "turns", "postings", "issues"):
+            conn.execute(f"DELETE FROM {table} WHERE run = ?", (run,))
+
+    def update(self, output_dir: Path) -> Dict[str, int]:
+        """Re-index run directories whose transcript.json changed and drop runs that disappeared."""
+        with self._transaction() as conn:
+            known = {run: (mtime, size) for run, mtime, size in conn.execute("SELECT run, mtime_ns, size FROM runs")}
+
+        seen: Set[str] = set()
+        indexed = 0
+        for transcript_path in sorted(output_dir.glob("*/transcript.json")):
+            run = transcript_path.parent.name
+            seen.add(run)
+            stat = transcript_path.stat()
+            if known.get(run) == (stat.st_mtime_ns, stat.st_size):
+                continue
+            data = json.loads(transcript_path.read_text(encoding="utf-8"))
+            self.index_run(run, data, stat.st_mtime_ns, stat.st_size)
+            indexed += 1
+
+        removed = sorted(set(known) - seen)
+        if removed:
+            with self._transaction() as conn:
+                for run in removed:
+                    self._delete(conn, run)
+        return {"indexed": indexed, "removed": len(removed), "unchanged": len(seen) - indexed}
+
+    def search(self, query: str, scope: str = "run") -> List[Union[str, Hit]]:
+        node = QueryParser(query).parse()
+        with self._transaction() as conn:
+            hits = Evaluator(conn, scope).evaluate(node)
+        return sorted(hits)
+
+    def describe(self, hits: List[Hit]) -> List[Dict[str, Any]]:
+        rows = []
+        with self._transaction() as conn:
+            for run, idx in hits:
+                row = conn.execute(
+                    "SELECT round, stage, speaker, role FROM turns WHERE run = ? AND idx = ?",
+                    (run, idx),
+                ).fetchone()
+                rows.append({"run": run, "turn": idx, "round": row[0], "stage": row[1], "speaker": row[2], "role": row[3]})
+        return rows
+
+
+Node = Tuple[Any, ...]
+
+
+class QueryParser:
+    """Parses ``a b`` (implicit AND), ``AND``/``OR``/``NOT``, parentheses, ``"phrases"`` and ``field:value``.
+
+    Turn fields: ``stage:``, ``speaker:``, ``role:``, ``round:``. Issue fields: ``issue:KEY`` (ever raised),
+    ``raised:KEY``, ``resolved:KEY`` and ``unresolved:KEY``, each optionally suffixed with ``@ROUND``.
+    """
+
+    TOKEN = re.compile(r'\s*(?:(\()|(\))|([A-Za-z_]+):(?:"([^"]*)"(@\d+)?|([^\s()"]+))|"([^"]*)"|([^\s()"]+))')
+
+    def __init__(self, query: str):
+        self.tokens = self._lex(query)
+        self.pos = 0
+
+    def _lex(self, query: str) -> List[Tuple[str, Any]]:
+        tokens: List[Tuple[str, Any]] = []
+        pos = 0
+        query = query.strip()
+        while pos < len(query):
+            match = self.TOKEN.match(query, pos)
+            if match is None or match.end() == pos:
+                raise ValueError(f"Cannot parse query near: {query[pos:]!r}")
+            pos = match.end()
+            lparen, rparen, field, quoted_value, round_suffix, bare_value, phrase, word = match.groups()
+            if lparen:
+                tokens.append(("(", None))
+            elif rparen:
+                tokens.append((")", None))
+            elif field:
+                value = quoted_value + (round_suffix or "") if quoted_value is not None else bare_value
+                tokens.append(("field", (field.lower(), value)))
+            elif phrase is not None:
+                tokens.append(("phrase", phrase))
+            elif word.upper() in ("AND", "OR", "NOT"):
+                tokens.append((word.upper(), None))
+            else:
+                tokens.append(("phrase", word))
+        return tokens
+
+    def _peek(self) -> Optional[str]:
+        return self.tokens[self.pos][0] if self.pos < len(self.tokens) else None
+
+    def _take(self) -> Tuple[str, Any]:
+        token = self.tokens[self.pos]
+        self.pos += 1
+        return token
+
+    def parse(self) -> Node:
+        if not self.tokens:
+            raise ValueError("Empty query.")
+        node = self._or()
+        if self.pos != len(self.tokens):
+            raise ValueError(f"Unexpected token: {self.tokens[self.pos][0]}")
+        return node
+
+    def _or(self) -> Node:
+        node = self._and()
+        while self._peek() == "OR":
+            self._take()
+            node = ("or", node, self._and())
+        return node
+
+    def _and(self) -> Node:
+        node = self._not()
+        while self._peek() not in (None, "OR", ")"):
+            if self._peek() == "AND":
+                self._take()
+            node = ("and", node, self._not())
+        return node
+
+    def _not(self) -> Node:
+        if self._peek() == "NOT":
+            self._take()
+            return ("not", self._not())
+        return self._primary()
+
+    def _primary(self) -> Node:
+        if self._peek() is None:
+            raise ValueError("Query ended unexpectedly.")
+        kind, value = self._take()
+        if kind == "(":
+            node = self._or()
+            if self._peek() != ")":
+                raise ValueError("Missing closing parenthesis.")
+            self._take()
+            return node
+        if kind == "phrase":
+            return ("phrase", value)
+        if kind == "field":
+            field, field_value = value
+            if field not in TURN_FIELDS | ISSUE_FIELDS:
+                raise ValueError(f"Unknown field: {field}")
+            return ("field", field, field_value)
+        raise ValueError(f"Unexpected token: {kind}")
+
+
+class Evaluator:
+    def __init__(self, conn: sqlite3.Connection, scope: str):
+        if scope not in ("run", "turn"):
+            raise ValueError(f"Unknown scope: {scope}")
+        self.conn = conn
+        self.scope = scope
+
+    def evaluate(self, node: Node) -> Set[Any]:
+        kind = node[0]
+        if kind == "and":
+            return self.evaluate(node[1]) & self.evaluate(node[2])
+        if kind == "or":
+            return self.evaluate(node[1]) | self.evaluate(node[2])
+        if kind == "not":
+            return self._universe() - self.evaluate(node[1])
+        if kind == "phrase":
+            return self._project(self._phrase(node[1]))
+        if node[1] in ISSUE_FIELDS:
+            return self._expand(self._issue(node[1], node[2]))
+        return self._project(self._turn_field(node[1], node[2]))
+
+    def _universe(self) -> Set[Any]:
+        if self.scope == "run":
+            return {row[0] for row in self.conn.execute("SELECT run FROM runs")}
+        return {(run, idx) for run, idx in self.conn.execute("SELECT run, idx FROM turns")}
+
+    def _project(self, hits: Set[Hit]) -> Set[Any]:
+        if self.scope == "run":
+            return {run for run, _ in hits}
+        return hits
+
+    def _expand(self, runs: Set[str]) -> Set[Any]:
+        if self.scope == "run":
+            return runs
+        return {(run, idx) for run, idx in self.conn.execute("SELECT run, idx FROM turns") if run in runs}
+
+    def _phrase(self, text: str) -> Set[Hit]:
+        terms = tokenize(text)
+        if not terms:
+            return set()
+        by_term: Dict[str, Dict[Hit, Set[int]]] = {}
+        for term in dict.fromkeys(terms):
+            rows = self.conn.execute("SELECT run, idx, positions FROM postings WHERE term = ?", (term,))
+            by_term[term] = {(run, idx): {int(p) for p in positions.split(",")} for run, idx, positions in rows}
+        candidates = set.intersection(*(set(posting) for posting in by_term.values()))
+        if len(terms) == 1:
+            return candidates
+        hits = set()
+        for hit in candidates:
+            starts = by_term[terms[0]][hit]
+            if any(all(start + offset in by_term[term][hit] for offset, term in enumerate(terms)) for start in starts):
+                hits.add(hit)
+        return hits
+
+    def _turn_field(self, field: str, value: str) -> Set[Hit]:
+        if field == "round":
+            rows = self.conn.execute("SELECT run, idx FROM turns WHERE round = ?", (int(value),))
+        else:
+            rows = self.conn.execute(f"SELECT run, idx FROM turns WHERE lower({field}) = lower(?)", (value,))
+        return {(run, idx) for run, idx in rows}
+
+    def _issue(self, field: str, value: str) -> Set[str]:
+        key, _, round_text = value.partition("@")
+        clauses = ["lower(key) = lower(?)"]
+        params: List[Any] = [key]
+        if field == "resolved":
+            clauses.append("status = 'resolved'")
+        elif field == "unresolved":
+            clauses.append("status != 'resolved'")
+        if round_text:
+            column = "resolved_round" if field == "resolved" else "raised_round"
+            clauses.append(f"{column} = ?")
+            params.append(int(round_text))
+        sql = "SELECT run FROM issues WHERE " + " AND ".join(clauses)
+        return {row[0] for row in self.conn.execute(sql, params)}
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Build and query the cross-run transcript index.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    update = sub.add_parser("update", help="Index new or changed run directories.")
+    update.add_argument("output", nargs="?", default="results")
+
+    query = sub.add_parser("query", help="Run a boolean/phrase query against the index.")
+    query.add_argument("expression", help='e.g. raised:"Capital gap"@1 AND NOT resolved:"Capital gap"')
+    query.add_argument("--output", default="results")
+    query.add_argument("--scope", choices=["run", "turn"], default="run", help="Match whole runs or single turns.")
+    query.add_argument("--refresh", action="store_true", help="Pick up changed run directories before querying.")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    output_dir = Path(args.output)
+    index = TranscriptIndex.for_output(output_dir)
+    if args.command == "update":
+        print(json.dumps(index.update(output_dir)))
+        return
+
+    if args.refresh:
+        index.update(output_dir)
+    try:
+        hits = index.search(args.expression, scope=args.scope)
+    except ValueError as exc:
+        raise SystemExit(f"Invalid query: {exc}")
+    if args.scope == "run":
+        for run in hits:
+            print(run)
+    else:
+        for row in index.describe(hits):
+            print(f"{row['run']}\tround {row['round']}\t{row['stage']}\t{row['speaker']} ({row['role']})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import json
+import mmap
+import struct
+from array import array
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+OFFSETS_FILENAME = "transcript.offsets"
+OFFSETS_MAGIC = b"DTOFF1\n"
+HEADER = struct.Struct("<I")
+
+# Sidecar layout: magic, u32 header length, JSON header (file size, header-field spans, stage names,
+# turn count), then little-endian int64 arrays of turn starts, ends and rounds and a uint8 stage-id array.
+
+
+def _nest(text: str, level: int) -> str:
+    # JSON strings never contain raw newlines, so shifting every line break re-indents the nested value.
+    return text.replace("\n", "\n" + " " * level)
+
+
+def encode_transcript(data: Dict[str, Any]) -> Tuple[str, bytes]:
+    """Serialize like ``json.dumps(data, indent=2)`` and build the offset sidecar for the result."""
+    parts: List[str] = ["{\n"]
+    offset = 2
+    fields: Dict[str, List[int]] = {}
+    starts = array("q")
+    ends = array("q")
+    rounds = array("q")
+    stage_ids = array("B")
+    stages: List[str] = []
+
+    for position, (name, value) in enumerate(data.items()):
+        if position:
+            parts.append(",\n")
+            offset += 2
+        prefix = f"  {json.dumps(name)}: "
+        parts.append(prefix)
+        offset += len(prefix.encode("utf-8"))
+        start = offset
+
+        if name == "transcript" and value:
+            parts.append("[\n")
+            offset += 2
+            for idx, entry in enumerate(value):
+                if idx:
+                    parts.append(",\n")
+                    offset += 2
+                parts.append("    ")
+                offset += 4
+                text = _nest(json.dumps(entry, indent=2), 4)
+                size = len(text.encode("utf-8"))
+                if entry["stage"] not in stages:
+                    stages.append(entry["stage"])
+                starts.append(offset)
+                ends.append(offset + size)
+                rounds.append(entry["round"])
+                stage_ids.append(stages.index(entry["stage"]))
+                parts.append(text)
+                offset += size
+            parts.append("\n  ]")
+            offset += 4
+        else:
+            text = _nest(json.dumps(value, indent=2), 2)
+            parts.append(text)
+            offset += len(text.encode("utf-8"))
+        fields[name] = [start, offset]
+
+    parts.append("\n}")
+    offset += 2
+    header = json.dumps({
+        "size": offset,
+        "fields": fields,
+        "stages": stages,
+        "turns": len(starts),
+        "sorted_rounds": list(rounds) == sorted(rounds),
+    }).encode("utf-8")
+    columns = [starts, ends, rounds, stage_ids]
+    if struct.pack("=H", 1) != struct.pack("<H", 1):
+        for column in columns:
+            column.byteswap()
+    sidecar = OFFSETS_MAGIC + HEADER.pack(len(header)) + header + b"".join(column.tobytes() for column in columns)
+    return "".join(parts), sidecar
+
+
+def decode_offsets(blob: bytes) -> Dict[str, Any]:
+    if not blob.startswith(OFFSETS_MAGIC):
+        raise ValueError("Not a transcript offsets sidecar.")
+    pos = len(OFFSETS_MAGIC)
+    (header_len,) = HEADER.unpack_from(blob, pos)
+    pos += HEADER.size
+    index = json.loads(blob[pos:pos + header_len])
+    pos += header_len
+    count = index["turns"]
+    for name, typecode in (("starts", "q"), ("ends", "q"), ("rounds", "q"), ("stage_ids", "B")):
+        column = array(typecode)
+        width = column.itemsize * count
+        column.frombytes(blob[pos:pos + width])
+        if struct.pack("=H", 1) != struct.pack("<H", 1):
+            column.byteswap()
+        index[name] = column
+        pos += width
+    return index
+
+
+class TranscriptReader:
+    """Random access to one run's ``transcript.json`` through its offset sidecar.
+
+    Only the requested slices are decoded. Runs without a matching sidecar (older layouts, or a
+    transcript edited after writing) fall back to a single full load.
+    """
+
+    def __init__(self, run_dir: Path):
+        self.path = Path(run_dir) / "transcript.json"
+        self._handle = open(self.path, "rb")
+        self._map: Optional[mmap.mmap] = None
+        self._data: Optional[Dict[str, Any]] = None
+        self.index = self._load_index(Path(run_dir) / OFFSETS_FILENAME)
+        if self.index is None:
+            self._data = json.loads(self._handle.read().decode("utf-8"))
+        elif self.index["size"]:
+            self._map = mmap.mmap(self._handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _load_index(self, offsets_path: Path) -> Optional[Dict[str, Any]]:
+        if not offsets_path.exists():
+            return None
+        try:
+            index = decode_offsets(offsets_path.read_bytes())
+        except ValueError:
+            return None
+        if index["size"] != self.path.stat().st_size:
+            return None
+        return index
+
+    def _decode(self, start: int, end: int) -> Any:
+        assert self._map is not None
+        return json.loads(self._map[start:end])
+
+    @property
+    def indexed(self) -> bool:
+        return self._data is None
+
+    def field(self, name: str) -> Any:
+        if self._data is not None:
+            return self._data[name]
+        start, end = self.index["fields"][name]
+        return self._decode(start, end)
+
+    def __len__(self) -> int:
+        if self._data is not None:
+            return len(self._data["transcript"])
+        return self.index["turns"]
+
+    def turn(self, idx: int) -> Dict[str, Any]:
+        if self._data is not None:
+            return self._data["transcript"][idx]
+        return self._decode(self.index["starts"][idx], self.index["ends"][idx])
+
+    def turns(
+        self,
+        rounds: Optional[Iterable[int]] = None,
+        stages: Optional[Iterable[str]] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Decode turns matching ``rounds``/``stages`` in transcript order, stopping after ``limit``."""
+        round_set = set(rounds) if rounds is not None else None
+        stage_set = set(stages) if stages is not None else None
+        if self._data is not None:
+            entries = self._data["transcript"]
+            round_of: Any = [entry["round"] for entry in entries]
+            stage_of: Any = [entry["stage"] for entry in entries]
+            candidates: Iterable[int] = range(len(entries))
+        else:
+            round_of = self.index["rounds"]
+            stage_of = self.index["stage_ids"]
+            if stage_set is not None:
+                names = self.index["stages"]
+                stage_set = {names.index(stage) for stage in stage_set if stage in names}
+            candidates = range(self.index["turns"])
+            if round_set is not None and self.index["sorted_rounds"]:
+                # Rounds never decrease along the transcript, so each requested round is one contiguous slice.
+                candidates = sorted(
+                    idx
+                    for round_number in round_set
+                    for idx in range(bisect_left(round_of, round_number), bisect_right(round_of, round_number))
+                )
+
+        chosen: List[Dict[str, Any]] = []
+        for idx in candidates:
+            if limit is not None and len(chosen) >= limit:
+                break
+            if round_set is not None and round_of[idx] not in round_set:
+                continue
+            if stage_set is not None and stage_of[idx] not in stage_set:
+                continue
+            chosen.append(self.turn(idx))
+        return chosen
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+        self._handle.close()
+
+    def __enter__(self) -> "TranscriptReader":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import json
+from pathlib import Path
+from typing import List, Optional
+
+from debate.packs import PACK_DIRNAME, PackReader
+from debate_runner import build_agent_specs, load_packed_result, persist_run
+
+
+def extract(pack_dir: Path, dest: Path, patterns: Optional[List[str]] = None) -> List[str]:
+    """Regenerate the classic ``<dest>/<key>/transcript.{md,json}`` + ``scores.json`` layout from packs."""
+    reader = PackReader(pack_dir)
+    keys = reader.keys()
+    if patterns:
+        keys = [key for key in keys if any(fnmatch.fnmatchcase(key, pattern) for pattern in patterns)]
+    dest.mkdir(parents=True, exist_ok=True)
+    for key in keys:
+        result = load_packed_result(reader, key)
+        persist_run(result, build_agent_specs(result.config), dest)
+    return keys
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="List or extract runs stored in compressed output packs.")
+    parser.add_argument("output", nargs="?", default="results", help="Output directory holding packs/.")
+    parser.add_argument("--keys", nargs="*", default=None, help="Run keys or glob patterns to extract (default: all).")
+    parser.add_argument("--dest", default=None, help="Where to write per-run directories (default: the output dir).")
+    parser.add_argument("--list", action="store_true", help="Print stored runs and compression stats only.")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    output_dir = Path(args.output)
+    pack_dir = output_dir / PACK_DIRNAME
+    if not pack_dir.is_dir():
+        raise SystemExit(f"No packs found under {pack_dir}")
+
+    if args.list:
+        reader = PackReader(pack_dir)
+        runs, stored, raw = reader.stats()
+        for key in reader.keys():
+            print(key)
+        ratio = raw / stored if stored else 0.0
+        print(json.dumps({"runs": runs, "stored_bytes": stored, "raw_bytes": raw, "ratio": round(ratio, 2)}))
+        return
+
+    dest = Path(args.dest) if args.dest else output_dir
+    keys = extract(pack_dir, dest, args.keys)
+    print(f"Extracted {len(keys)} run(s) into {dest}")
+
+
+if __name__ == "__main__":
+    main()
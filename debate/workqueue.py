@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+
+QUEUE_FILENAME = "queue.sqlite3"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    key TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    worker TEXT,
+    lease_expires REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    updated REAL NOT NULL
+)
+"""
+
+
+@dataclass
+class Job:
+    key: str
+    payload: Dict[str, Any]
+    attempts: int
+
+
+class LeaseLost(RuntimeError):
+    """The worker's lease expired and the job may now belong to someone else."""
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class WorkQueue:
+    """SQLite-backed job queue with leases, shared by workers over a common directory."""
+
+    def __init__(self, path: Path, max_attempts: int = 3, timeout: float = 30.0):
+        self.path = Path(path)
+        self.max_attempts = max_attempts
+        self.timeout = timeout
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._transaction() as conn:
+            conn.execute(SCHEMA)
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        # A fresh connection per transaction keeps the queue usable from heartbeat threads
+        # and forked worker processes alike.
+        conn = sqlite3.connect(str(self.path), timeout=self.timeout, isolation_level=None)
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+
+    def enqueue(self, jobs: Dict[str, Dict[str, Any]]) -> int:
+        """Add new jobs and refresh the payload of pending ones; returns the number added.
+
+        Raises ValueError (and enqueues nothing) if a leased, done or failed job would change payload:
+        its output was produced, or is being produced, from the old config.
+        """
+        now = time.time()
+        added = 0
+        conflicts = []
+        with self._transaction() as conn:
+            for key, payload in jobs.items():
+                encoded = json.dumps(payload, sort_keys=True)
+                row = conn.execute("SELECT payload, status FROM jobs WHERE key = ?", (key,)).fetchone()
+                if row is None:
+                    conn.execute("INSERT INTO jobs (key, payload, updated) VALUES (?, ?, ?)", (key, encoded, now))
+                    added += 1
+                elif row[0] != encoded:
+                    if row[1] != "pending":
+                        conflicts.append(f"{key} ({row[1]})")
+                        continue
+                    conn.execute("UPDATE jobs SET payload = ?, updated = ? WHERE key = ?", (encoded, now, key))
+            if conflicts:
+                raise ValueError(
+                    "Queue already holds different configs for: " + ", ".join(conflicts)
+                    + "; use a fresh output directory to re-run them."
+                )
+        return added
+
+    def claim(self, worker_id: str, lease_seconds: float) -> Optional[Job]:
+        now = time.time()
+        with self._transaction() as conn:
+            conn.execute(
+                """
+                UPDATE jobs SET status = 'failed', error = COALESCE(error, 'lease expired'), updated = ?
+                WHERE status = 'leased' AND lease_expires < ? AND attempts >= ?
+                """,
+                (now, now, self.max_attempts),
+            )
+            row = conn.execute(
+                """
+                SELECT key, payload, attempts FROM jobs
+                WHERE attempts < ?
+                  AND (status = 'pending' OR (status = 'leased' AND lease_expires < ?))
+                ORDER BY attempts, rowid
+                LIMIT 1
+                """,
+                (self.max_attempts, now),
+            ).fetchone()
+            if row is None:
+                return None
+            key, payload, attempts = row
+            conn.execute(
+                """
+                UPDATE jobs
+                SET status = 'leased', worker = ?, lease_expires = ?, attempts = attempts + 1, updated = ?
+                WHERE key = ?
+                """,
+                (worker_id, now + lease_seconds, now, key),
+            )
+        return Job(key=key, payload=json.loads(payload), attempts=attempts + 1)
+
+    def heartbeat(self, key: str, worker_id: str, lease_seconds: float) -> bool:
+        now = time.time()
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                """
+                UPDATE jobs SET lease_expires = ?, updated = ?
+                WHERE key = ? AND worker = ? AND status = 'leased'
+                """,
+                (now + lease_seconds, now, key, worker_id),
+            )
+            return cursor.rowcount == 1
+
+    def complete(self, key: str, worker_id: str) -> bool:
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                """
+                UPDATE jobs SET status = 'done', lease_expires = NULL, error = NULL, updated = ?
+                WHERE key = ? AND worker = ? AND status = 'leased'
+                """,
+                (time.time(), key, worker_id),
+            )
+            return cursor.rowcount == 1
+
+    def fail(self, key: str, worker_id: str, error: str) -> None:
+        with self._transaction() as conn:
+            conn.execute(
+                """
+                UPDATE jobs
+                SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END,
+                    lease_expires = NULL, error = ?, updated = ?
+                WHERE key = ? AND worker = ? AND status = 'leased'
+                """,
+                (self.max_attempts, error, time.time(), key, worker_id),
+            )
+
+    def counts(self) -> Dict[str, int]:
+        with self._transaction() as conn:
+            rows = conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        return {status: count for status, count in rows}
+
+    def keys(self, status: Optional[str] = None) -> List[str]:
+        with self._transaction() as conn:
+            if status is None:
+                rows = conn.execute("SELECT key FROM jobs ORDER BY rowid").fetchall()
+            else:
+                rows = conn.execute("SELECT key FROM jobs WHERE status = ? ORDER BY rowid", (status,)).fetchall()
+        return [row[0] for row in rows]
+
+    def drained(self) -> bool:
+        counts = self.counts()
+        return counts.get("pending", 0) == 0 and counts.get("leased", 0) == 0
+
+
+class Heartbeat:
+    """Background thread that keeps a job lease alive while the worker computes."""
+
+    def __init__(self, queue: WorkQueue, key: str, worker_id: str, lease_seconds: float):
+        self.queue = queue
+        self.key = key
+        self.worker_id = worker_id
+        self.lease_seconds = lease_seconds
+        self.lost = False
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"heartbeat-{key}", daemon=True)
+
+    def _run(self) -> None:
+        interval = max(self.lease_seconds / 3.0, 0.05)
+        while not self._stop.wait(interval):
+            if not self.queue.heartbeat(self.key, self.worker_id, self.lease_seconds):
+                self.lost = True
+                return
+
+    def check(self) -> None:
+        """Confirm (and renew) the lease right before acting on it; raise LeaseLost if it is gone."""
+        if self.lost or not self.queue.heartbeat(self.key, self.worker_id, self.lease_seconds):
+            self.lost = True
+            raise LeaseLost(f"Lease on {self.key} lost by {self.worker_id}")
+
+    def __enter__(self) -> "Heartbeat":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self._stop.set()
+        self._thread.join()
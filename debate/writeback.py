@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from debate.metrics import METRICS
+
+
+class PersistError(RuntimeError):
+    """Background artifact writes failed: ``failed`` maps keys to their errors, ``skipped`` lists writes never run."""
+
+    def __init__(self, failed: Dict[str, BaseException], skipped: List[str]):
+        self.failed = dict(failed)
+        self.skipped = list(skipped)
+        super().__init__(describe_failures(self.failed, self.skipped))
+
+
+def describe_failures(failed: Dict[str, BaseException], skipped: List[str]) -> str:
+    (first_key, first), *others = failed.items()
+    parts = [f"Writing {first_key} failed: {first}"]
+    if others:
+        parts.append("also failed: " + ", ".join(f"{key} ({exc})" for key, exc in others))
+    if skipped:
+        parts.append(f"{len(skipped)} queued writes skipped: " + ", ".join(skipped))
+    return "; ".join(parts)
+
+
+class WritePipeline:
+    """Runs artifact writes on background threads so the next debate can start while the last one lands.
+
+    ``submit`` blocks while ``max_pending`` writes are queued (backpressure keeps finished results from
+    piling up in memory) and raises once a write has failed so the producer stops early. ``flush`` is
+    a barrier: it returns once everything submitted so far is written, or raises ``PersistError``.
+    After a failure the remaining queued writes are skipped; every failed and skipped key is reported,
+    on ``PersistError`` or as a note on whatever exception is already leaving the ``with`` block.
+    """
+
+    def __init__(self, workers: int = 2, max_pending: int = 8):
+        if workers < 1 or max_pending < 1:
+            raise ValueError("WritePipeline needs at least one worker and one queue slot.")
+        self._queue: "queue.Queue[Optional[Tuple[str, Callable[[], Any]]]]" = queue.Queue(maxsize=max_pending)
+        self._lock = threading.Lock()
+        self.failed: Dict[str, BaseException] = {}
+        self.skipped: List[str] = []
+        self._closed = False
+        self.stalled_s = 0.0
+        self._threads: List[threading.Thread] = [
+            threading.Thread(target=self._work, name=f"persist-{idx}", daemon=True) for idx in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def _work(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                key, task = item
+                if self.failed:
+                    with self._lock:
+                        self.skipped.append(key)
+                else:
+                    task()
+            except BaseException as exc:
+                with self._lock:
+                    self.failed[key] = exc
+            finally:
+                self._queue.task_done()
+                METRICS.set("debate_persist_pending", self._queue.qsize())
+
+    def _raise_pending(self) -> None:
+        with self._lock:
+            if not self.failed:
+                return
+            error = PersistError(self.failed, self.skipped)
+        raise error from next(iter(error.failed.values()))
+
+    def submit(self, key: str, task: Callable[[], Any]) -> None:
+        if self._closed:
+            raise RuntimeError("WritePipeline is closed.")
+        self._raise_pending()
+        started = time.perf_counter()
+        self._queue.put((key, task))
+        stalled = time.perf_counter() - started
+        self.stalled_s += stalled
+        if stalled > 0.001:
+            METRICS.inc("debate_persist_stall_seconds_total", stalled)
+        METRICS.set("debate_persist_pending", self._queue.qsize())
+
+    def flush(self) -> None:
+        self._queue.join()
+        self._raise_pending()
+
+    def close(self, raise_errors: bool = True) -> None:
+        if not self._closed:
+            self._closed = True
+            self._queue.join()
+            for _ in self._threads:
+                self._queue.put(None)
+            for thread in self._threads:
+                thread.join()
+        if raise_errors:
+            self._raise_pending()
+
+    def __enter__(self) -> "WritePipeline":
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Optional[BaseException], tb: Any) -> None:
+        # Let an exception already unwinding the sweep win over a write failure it may have caused,
+        # but say which runs never reached disk (a PersistError from submit may predate later skips).
+        self.close(raise_errors=exc_type is None)
+        if exc is not None and self.failed:
+            exc.add_note("Background writes: " + describe_failures(self.failed, self.skipped))
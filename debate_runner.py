@@ -3,14 +3,30 @@ from __future__ import annotations
 import argparse
 import dataclasses
 import json
+import os
 import random
 import textwrap
-from dataclasses import dataclass
+import threading
+import time
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, TypedDict
+from typing import Annotated, Any, Callable, Dict, List, Optional, Set, Tuple, TypedDict, Union
 
 from langgraph.graph import END, StateGraph
 
+from debate.compaction import compact_state, latest_feedback, restore_state
+from debate.deps import DEPS_FILENAME, build_manifest, entry_ref, length_ref, stale_refs
+from debate.metrics import METRICS, round_label
+from debate.packs import CODECS, PACK_DIRNAME, PackReader, PackWriter
+from debate.rng import RNG_SCHEMES, CounterStream
+from debate.snapshots import NO_SYNTHESIZER, SNAPSHOTS_FILENAME, decode_snapshots, encode_snapshots, signal_bits
+from debate.transcript_index import INDEX_FILENAME, TranscriptIndex
+from debate.transcript_reader import OFFSETS_FILENAME, TranscriptReader, encode_transcript
+from debate.workqueue import QUEUE_FILENAME, Heartbeat, LeaseLost, WorkQueue, default_worker_id
+from debate.writeback import WritePipeline
+
 
 RUBRIC_KEYS = ["evidence", "feasibility", "risks", "clarity"]
 
@@ -32,6 +48,16 @@ class IssueRecord(TypedDict):
     status: str
 
 
+def merge_branch_updates(
+    current: Optional[List[Dict[str, Any]]],
+    update: Optional[List[Dict[str, Any]]],
+) -> List[Dict[str, Any]]:
+    # Parallel review branches append their deltas in the same superstep; the fan-in node resets with None.
+    if update is None:
+        return []
+    return (current or []) + update
+
+
 class DebateState(TypedDict, total=False):
     history: List[TranscriptEntry]
     round_index: int
@@ -45,6 +71,14 @@ class DebateState(TypedDict, total=False):
     final_decision: str
     judge_summary: str
     config: Dict[str, Any]
+    history_summary: Dict[str, Any]
+    spill_path: str
+    round_snapshots: List[List[int]]  # see debate/snapshots.py
+
+
+class ParallelReviewState(DebateState, total=False):
+    # Only fan-out graphs get the reducer; single-path graphs keep a plain schema for direct stepping.
+    branch_updates: Annotated[List[Dict[str, Any]], merge_branch_updates]
 
 
 @dataclass
@@ -68,11 +102,30 @@ class DebateConfig:
     include_devil: bool
     seed: int
     notes: str = ""
+    history_window: int = 0  # turns kept verbatim in state; 0 keeps the full history
+    rng: str = "shared"  # "shared" (one stream per run) or opt-in "counter" (per agent/round/call-site); see debate/rng.py
+    parallel_review: bool = False  # run critic and devil in the same superstep (needs rng="counter")
 
     def as_dict(self) -> Dict[str, Any]:
         data = dataclasses.asdict(self)
         return data
 
+    def recursion_limit(self) -> int:
+        # Upper bound on graph steps: every optional node per round, plus the verdict and slack.
+        return self.rounds * 6 + 10
+
+
+def topology_key(config: DebateConfig) -> Tuple[Any, ...]:
+    # Everything build_graph wires into nodes and edges; key, seed and sampling live in the model and state.
+    return (
+        config.agent_mode,
+        config.include_synthesizer,
+        config.include_devil,
+        config.rounds,
+        config.history_window,
+        config.parallel_review,
+    )
+
 
 @dataclass
 class DebateResult:
@@ -84,29 +137,56 @@ class DebateResult:
     convergence_notes: List[str]
     open_issues: List[IssueRecord]
     resolved_actions: List[str]
+    dependencies: Dict[str, Any] = field(default_factory=dict)  # see debate/deps.py
+    round_snapshots: List[List[int]] = field(default_factory=list)  # see debate/snapshots.py
 
 
 class LocalDebateModel:
     """Rule-guided generator for deterministic, human-readable debate turns."""
 
     def __init__(self, config: DebateConfig, facts: Dict[str, Any]):
+        if config.rng not in RNG_SCHEMES:
+            raise ValueError(f"Unknown rng scheme: {config.rng}")
         self.config = config
         self.random = random.Random(config.seed)
         self.facts = facts
-
-    def _choice(self, options: List[str]) -> str:
+        self.consumed: Set[str] = set()
+
+    def reset(self, config: Optional[DebateConfig] = None) -> None:
+        """Start a fresh run, optionally rebinding to another config with the same ``topology_key``."""
+        if config is not None:
+            if config.rng not in RNG_SCHEMES:
+                raise ValueError(f"Unknown rng scheme: {config.rng}")
+            self.config = config
+        self.random = random.Random(self.config.seed)
+        self.consumed = set()
+
+    def _stream(self, agent: str, round_number: int, site: str) -> Any:
+        if self.config.rng == "shared":
+            return self.random
+        return CounterStream(self.config.seed, agent, round_number, site)
+
+    def _choice(self, options: List[str], rng: Any) -> str:
         if not options:
             return ""
         if self.config.temperature < 0.5:
             return options[0]
-        idx = int(self.random.random() * len(options))
+        idx = int(rng.random() * len(options))
         return options[idx]
 
-    def _shuffle(self, items: List[str]) -> List[str]:
+    def _shuffle(self, items: List[Any], rng: Any) -> List[Any]:
         items_copy = list(items)
-        self.random.shuffle(items_copy)
+        rng.shuffle(items_copy)
         return items_copy
 
+    def _pick(self, fact: str, count: int, rng: Any) -> List[str]:
+        entries = self.facts[fact]
+        # Shuffling indices draws the same permutation as shuffling the entries and shows which were used.
+        chosen = self._shuffle(list(range(len(entries))), rng)[:count]
+        self.consumed.add(length_ref(fact))
+        self.consumed.update(entry_ref(fact, idx) for idx in chosen)
+        return [entries[idx] for idx in chosen]
+
     def make_researcher(
         self,
         round_number: int,
@@ -118,17 +198,18 @@ class LocalDebateModel:
             "Pair MassCEC grant with performance-based EPC contract to land <10 year payback.",
             "Stage microgrid commissioning so that tenant benefits show up in billing by month six.",
         ]
-        headline = self._choice(headline_options)
+        headline = self._choice(headline_options, self._stream("researcher", round_number, "headline"))
 
-        evidence_points = self._shuffle(self.facts["evidence"])[:3]
-        impl_steps = self._shuffle(self.facts["implementation"])[:3]
+        evidence_points = self._pick("evidence", 3, self._stream("researcher", round_number, "evidence"))
+        impl_steps = self._pick("implementation", 3, self._stream("researcher", round_number, "implementation"))
         risk_watch = []
         outstanding_keys = sorted({issue["key"] for issue in open_issues if issue["status"] == "open"})
         if outstanding_keys:
             outstanding = ", ".join(outstanding_keys)
             risk_watch.append(f"Outstanding review items: {outstanding}")
-        risk_watch.extend(self._shuffle(self.facts["baseline_risks"])[:2])
+        risk_watch.extend(self._pick("baseline_risks", 2, self._stream("researcher", round_number, "risks")))
 
+        self.consumed.add("snapshot")
         feedback_note = ""
         if prior_feedback:
             feedback_note = "Feedback last round: " + prior_feedback[-1]
@@ -160,7 +241,8 @@ class LocalDebateModel:
         existing_keys = {issue["key"] for issue in open_issues}
         new_issues: List[IssueRecord] = []
 
-        for issue in candidate_issues:
+        for idx, issue in enumerate(candidate_issues):
+            self.consumed.add(entry_ref("issue_bank", idx))
             if issue["key"] in existing_keys:
                 continue
             if len(new_issues) >= 2:
@@ -175,6 +257,9 @@ class LocalDebateModel:
             }
             new_issues.append(record)
             existing_keys.add(issue["key"])
+        else:
+            # Walked the whole bank, so an appended entry would have been considered too.
+            self.consumed.add(length_ref("issue_bank"))
 
         major_concerns = open_issues + new_issues
         major_txt = "\n".join(
@@ -182,13 +267,14 @@ class LocalDebateModel:
             for issue in major_concerns
         )
 
-        clarifying = self._shuffle(self.facts["clarifying_questions"])[:2]
+        clarifying = self._pick("clarifying_questions", 2, self._stream("critic", round_number, "clarifying"))
         risk_rating = self._choice(
             [
                 "Residual risk currently sits at medium-high because monetized resilience value is still assumptive.",
                 "Residual risk sits at medium thanks to solid grant backing but tenant protections need proof.",
                 "Residual risk is high; storage sizing assumptions have not been validated under winter load.",
-            ]
+            ],
+            self._stream("critic", round_number, "risk_rating"),
         )
 
         content = "\n\n".join(
@@ -224,10 +310,11 @@ class LocalDebateModel:
             "resolved_round": None,
             "status": "open",
         }
+        contrarian = self._shuffle(contrarian_points, self._stream("devil", round_number, "contrarian"))[:2]
         content = "\n\n".join(
             [
                 f"**Devil's Advocate (Round {round_number}):** Stress-testing optimism.",
-                "**Contrarian evidence:**\n" + "\n".join(f"- {point}" for point in self._shuffle(contrarian_points)[:2]),
+                "**Contrarian evidence:**\n" + "\n".join(f"- {point}" for point in contrarian),
                 "**Worst-case storyline:** In a downside market, the co-op could face a $220k funding hole.",
                 "Let's force the team to show contingency math before we pretend consensus exists.",
             ]
@@ -250,6 +337,7 @@ class LocalDebateModel:
 
         for issue in open_now[:2]:
             resolved_keys.append(issue["key"])
+            self.consumed.add(entry_ref("mitigations", issue["key"]))
             if issue["key"] in mitigations:
                 adjustments.append(mitigations[issue["key"]])
             else:
@@ -263,7 +351,8 @@ class LocalDebateModel:
                 "Uploaded utility interval data (Jan-Dec 2023) to shared drive for transparency.",
                 "Secured EPC letter committing to $1.92/W turnkey cap backed by performance guarantees.",
                 "Validated storage dispatch model against ISO-NE winter peaks; 90% of outage use case holds.",
-            ]
+            ],
+            self._stream("revision", round_number, "evidence_refresh"),
         )
 
         content = "\n\n".join(
@@ -298,7 +387,8 @@ class LocalDebateModel:
                 "Revision landed real movement on tenant protections.",
                 "Financial engineering is sharper; still need better downside math.",
                 "Stakeholder alignment reads solid, but regulatory volatility remains the swing factor.",
-            ]
+            ],
+            self._stream("synthesizer", round_number, "highlight"),
         )
 
         content = "\n\n".join(
@@ -502,17 +592,56 @@ def update_signals(state: DebateState, signals: Dict[str, bool]) -> Dict[str, bo
     return updated
 
 
-def build_graph(config: DebateConfig, facts: Dict[str, Any]) -> Tuple[StateGraph, DebateState, Dict[str, AgentSpec]]:
+def merge_issues(existing: List[IssueRecord], raised: List[IssueRecord]) -> List[IssueRecord]:
+    keys = {issue["key"] for issue in existing}
+    merged = list(existing)
+    for issue in raised:
+        if issue["key"] not in keys:
+            merged.append(issue)
+            keys.add(issue["key"])
+    return merged
+
+
+Review = Tuple[TranscriptEntry, List[IssueRecord], Dict[str, bool]]
+
+
+def timed_node(name: str, node: Callable[[DebateState], DebateState]) -> Callable[[DebateState], DebateState]:
+    def wrapper(state: DebateState) -> DebateState:
+        started = time.perf_counter()
+        try:
+            return node(state)
+        finally:
+            METRICS.observe("debate_node_latency_seconds", time.perf_counter() - started, node=name)
+
+    return wrapper
+
+
+def round_snapshot(round_number: int, issues: List[IssueRecord], signals: Dict[str, bool], agreement: int) -> List[int]:
+    open_count = sum(1 for issue in issues if issue["status"] == "open")
+    return [round_number, open_count, len(issues) - open_count, signal_bits(signals, RUBRIC_KEYS), agreement]
+
+
+def record_raised(node: str, round_number: int, before: List[IssueRecord], after: List[IssueRecord]) -> None:
+    if len(after) > len(before):
+        METRICS.inc("debate_issues_raised_total", len(after) - len(before), node=node, round=round_label(round_number))
+
+
+def build_graph(
+    config: DebateConfig,
+    facts: Dict[str, Any],
+    model: Optional[LocalDebateModel] = None,
+) -> Tuple[StateGraph, DebateState, Dict[str, AgentSpec]]:
     specs = build_agent_specs(config)
-    model = LocalDebateModel(config, facts)
+    if model is None:
+        model = LocalDebateModel(config, facts)
+    parallel_review = config.parallel_review and config.include_devil
+    if parallel_review and config.rng != "counter":
+        raise ValueError("parallel_review requires rng='counter' so concurrent nodes draw independent streams.")
 
     def researcher_node(state: DebateState) -> DebateState:
         round_number = state["round_index"] + 1
-        prior_feedback = [
-            entry["content"]
-            for entry in state["history"]
-            if entry["stage"] in ("critique", "devil")
-        ]
+        feedback = latest_feedback(state)
+        prior_feedback = [feedback] if feedback else []
         result = model.make_researcher(round_number, state["open_issues"], prior_feedback)
         message: TranscriptEntry = {
             "round": round_number,
@@ -527,10 +656,9 @@ def build_graph(config: DebateConfig, facts: Dict[str, Any]) -> Tuple[StateGraph
             "resolved_actions": state["resolved_actions"] + result["proposed_actions"],
         }
 
-    def critic_node(state: DebateState) -> DebateState:
+    def critic_review(state: DebateState) -> Review:
         round_number = state["round_index"] + 1
         result = model.make_critic(round_number, state["open_issues"])
-        new_issues = state["open_issues"] + result["raised_issues"]
         message: TranscriptEntry = {
             "round": round_number,
             "stage": "critique",
@@ -538,22 +666,11 @@ def build_graph(config: DebateConfig, facts: Dict[str, Any]) -> Tuple[StateGraph
             "role": specs["critic"].role,
             "content": result["content"],
         }
-        return {
-            "history": state["history"] + [message],
-            "open_issues": new_issues,
-            "signals": update_signals(state, result["signals"]),
-        }
+        return message, result["raised_issues"], result["signals"]
 
-    def devil_node(state: DebateState) -> DebateState:
+    def devil_review(state: DebateState) -> Review:
         round_number = state["round_index"] + 1
         result = model.make_devil(round_number, state["open_issues"])
-        new_issue = result["raised_issue"]
-
-        existing_keys = {issue["key"] for issue in state["open_issues"]}
-        updated_issues = list(state["open_issues"])
-        if new_issue["key"] not in existing_keys:
-            updated_issues.append(new_issue)
-
         message: TranscriptEntry = {
             "round": round_number,
             "stage": "devil",
@@ -561,23 +678,62 @@ def build_graph(config: DebateConfig, facts: Dict[str, Any]) -> Tuple[StateGraph
             "role": specs["devil"].role,
             "content": result["content"],
         }
+        return message, [result["raised_issue"]], result["signals"]
+
+    def review_node(name: str, review: Callable[[DebateState], Review]) -> Callable[[DebateState], DebateState]:
+        def node(state: DebateState) -> DebateState:
+            message, raised, signals = review(state)
+            open_issues = merge_issues(state["open_issues"], raised)
+            record_raised(name, message["round"], state["open_issues"], open_issues)
+            return {
+                "history": state["history"] + [message],
+                "open_issues": open_issues,
+                "signals": update_signals(state, signals),
+            }
 
+        return node
+
+    def review_branch(
+        order: int, name: str, review: Callable[[DebateState], Review]
+    ) -> Callable[[DebateState], DebateState]:
+        def node(state: DebateState) -> DebateState:
+            message, raised, signals = review(state)
+            update = {"order": order, "node": name, "message": message, "raised_issues": raised, "signals": signals}
+            return {"branch_updates": [update]}
+
+        return node
+
+    def fanin_node(state: DebateState) -> DebateState:
+        # Apply branch deltas in sequential-topology order (critic, then devil) regardless of finish order.
+        updates = sorted(state["branch_updates"], key=lambda update: update["order"])
+        open_issues = state["open_issues"]
+        signals = dict(state["signals"])
+        for update in updates:
+            merged = merge_issues(open_issues, update["raised_issues"])
+            record_raised(update["node"], update["message"]["round"], open_issues, merged)
+            open_issues = merged
+            signals = update_signals({"signals": signals}, update["signals"])
         return {
-            "history": state["history"] + [message],
-            "open_issues": updated_issues,
-            "signals": update_signals(state, result["signals"]),
+            "history": state["history"] + [update["message"] for update in updates],
+            "open_issues": open_issues,
+            "signals": signals,
+            "branch_updates": None,
         }
 
     def revision_node(state: DebateState) -> DebateState:
         round_number = state["round_index"] + 1
         result = model.make_revision(round_number, state["open_issues"])
         updated_issues = []
+        resolved = 0
         for issue in state["open_issues"]:
             if issue["key"] in result["resolved_keys"]:
                 issue = issue.copy()
                 issue["status"] = "resolved"
                 issue["resolved_round"] = round_number
+                resolved += 1
             updated_issues.append(issue)
+        if resolved:
+            METRICS.inc("debate_issues_resolved_total", resolved, node="revision", round=round_label(round_number))
         message: TranscriptEntry = {
             "round": round_number,
             "stage": "revise",
@@ -585,12 +741,15 @@ def build_graph(config: DebateConfig, facts: Dict[str, Any]) -> Tuple[StateGraph
             "role": specs["researcher"].role,
             "content": result["content"],
         }
+        signals = update_signals(state, result["signals"])
+        snapshot = round_snapshot(round_number, updated_issues, signals, NO_SYNTHESIZER)
         return {
             "history": state["history"] + [message],
             "open_issues": updated_issues,
-            "signals": update_signals(state, result["signals"]),
+            "signals": signals,
             "resolved_actions": state["resolved_actions"] + result["new_actions"],
             "round_index": state["round_index"] + 1,
+            "round_snapshots": state["round_snapshots"] + [snapshot],
         }
 
     def synthesizer_node(state: DebateState) -> DebateState:
@@ -603,13 +762,20 @@ def build_graph(config: DebateConfig, facts: Dict[str, Any]) -> Tuple[StateGraph
             "role": specs["synthesizer"].role,
             "content": result["content"],
         }
+        signals = update_signals(state, result["signals"])
+        # Revision already opened this round's row; close it with the synthesizer's signals and agreement.
+        snapshot = round_snapshot(round_number, state["open_issues"], signals, int(result["agreement"]))
         return {
             "history": state["history"] + [message],
-            "signals": update_signals(state, result["signals"]),
+            "signals": signals,
             "convergence_notes": state["convergence_notes"] + [result["note"]],
             "consensus_reached": result["agreement"],
+            "round_snapshots": state["round_snapshots"][:-1] + [snapshot],
         }
 
+    def compact_node(state: DebateState) -> DebateState:
+        return compact_state(state, config.history_window)
+
     def judge_node(state: DebateState) -> DebateState:
         result = model.make_judge(state["open_issues"], state["signals"], state["convergence_notes"])
         message: TranscriptEntry = {
@@ -628,19 +794,42 @@ def build_graph(config: DebateConfig, facts: Dict[str, Any]) -> Tuple[StateGraph
             "judge_summary": result["content"],
         }
 
-    graph: StateGraph = StateGraph(DebateState)
-    graph.add_node("researcher", researcher_node)
-    if "critic" in specs:
-        graph.add_node("critic", critic_node)
-    if config.include_devil:
-        graph.add_node("devil", devil_node)
-    graph.add_node("revision", revision_node)
+    schema = ParallelReviewState if parallel_review else DebateState
+    graph: StateGraph = StateGraph(schema)
+
+    def add_node(name: str, node: Callable[[DebateState], DebateState]) -> None:
+        # Nodes are annotated with DebateState; without input_schema LangGraph would hide branch_updates from them.
+        graph.add_node(name, timed_node(name, node), input_schema=schema)
+
+    add_node("researcher", researcher_node)
+    if parallel_review:
+        add_node("critic", review_branch(0, "critic", critic_review))
+        add_node("devil", review_branch(1, "devil", devil_review))
+        add_node("fanin", fanin_node)
+    else:
+        if "critic" in specs:
+            add_node("critic", review_node("critic", critic_review))
+        if config.include_devil:
+            add_node("devil", review_node("devil", devil_review))
+    add_node("revision", revision_node)
     if config.include_synthesizer:
-        graph.add_node("synthesizer", synthesizer_node)
-    graph.add_node("judge", judge_node)
+        add_node("synthesizer", synthesizer_node)
+    if config.history_window > 0:
+        add_node("compact", compact_node)
+    add_node("judge", judge_node)
 
     graph.set_entry_point("researcher")
 
+    def next_round(state: DebateState) -> str:
+        if state["round_index"] < state["total_rounds"]:
+            return "researcher"
+        return "judge"
+
+    def end_of_round(state: DebateState) -> str:
+        if config.history_window > 0:
+            return "compact"
+        return next_round(state)
+
     def post_researcher(state: DebateState) -> str:
         return "critic" if "critic" in specs else "revision"
 
@@ -650,35 +839,46 @@ def build_graph(config: DebateConfig, facts: Dict[str, Any]) -> Tuple[StateGraph
     def post_revision(state: DebateState) -> str:
         if config.include_synthesizer:
             return "synthesizer"
-        if state["round_index"] < state["total_rounds"]:
-            return "researcher"
-        return "judge"
+        return end_of_round(state)
 
     def post_synth(state: DebateState) -> str:
-        if state["round_index"] < state["total_rounds"]:
-            return "researcher"
-        return "judge"
+        return end_of_round(state)
+
+    if parallel_review:
+        graph.add_edge("researcher", "critic")
+        graph.add_edge("researcher", "devil")
+        graph.add_edge(["critic", "devil"], "fanin")
+        graph.add_edge("fanin", "revision")
+    else:
+        graph.add_conditional_edges("researcher", post_researcher, {"critic": "critic", "revision": "revision"})
 
-    graph.add_conditional_edges("researcher", post_researcher, {"critic": "critic", "revision": "revision"})
+        if "critic" in specs:
+            next_map = {"revision": "revision"}
+            if config.include_devil:
+                next_map["devil"] = "devil"
+            graph.add_conditional_edges("critic", post_critic, next_map)
 
-    if "critic" in specs:
-        next_map = {"revision": "revision"}
         if config.include_devil:
-            next_map["devil"] = "devil"
-        graph.add_conditional_edges("critic", post_critic, next_map)
+            graph.add_edge("devil", "revision")
 
-    if config.include_devil:
-        graph.add_edge("devil", "revision")
+    round_map = {"researcher": "researcher", "judge": "judge"}
+    if config.history_window > 0:
+        round_map = {"compact": "compact"}
+        graph.add_conditional_edges("compact", next_round, {"researcher": "researcher", "judge": "judge"})
 
     if config.include_synthesizer:
-        graph.add_conditional_edges("revision", post_revision, {"synthesizer": "synthesizer", "researcher": "researcher", "judge": "judge"})
-        graph.add_conditional_edges("synthesizer", post_synth, {"researcher": "researcher", "judge": "judge"})
+        graph.add_conditional_edges("revision", post_revision, {"synthesizer": "synthesizer"})
+        graph.add_conditional_edges("synthesizer", post_synth, round_map)
     else:
-        graph.add_conditional_edges("revision", post_revision, {"researcher": "researcher", "judge": "judge"})
+        graph.add_conditional_edges("revision", post_revision, round_map)
 
     graph.add_edge("judge", END)
 
-    initial_state: DebateState = {
+    return graph, initial_debate_state(config), specs
+
+
+def initial_debate_state(config: DebateConfig) -> DebateState:
+    return {
         "history": [],
         "round_index": 0,
         "total_rounds": config.rounds,
@@ -691,17 +891,87 @@ def build_graph(config: DebateConfig, facts: Dict[str, Any]) -> Tuple[StateGraph
         "final_decision": "",
         "judge_summary": "",
         "config": config.as_dict(),
+        "history_summary": {},
+        "round_snapshots": [],
     }
 
-    return graph, initial_state, specs
-
 
-def run_debate(config: DebateConfig, output_dir: Path) -> DebateResult:
+def run_debate(
+    config: DebateConfig,
+    output_dir: Path,
+    pack: Optional[PackWriter] = None,
+    writer: Optional[WritePipeline] = None,
+    before_persist: Optional[Callable[[], None]] = None,
+) -> DebateResult:
+    started = time.perf_counter()
     facts = build_facts()
-    graph, initial_state, specs = build_graph(config, facts)
+    model = LocalDebateModel(config, facts)
+    graph, initial_state, specs = build_graph(config, facts, model)
     compiled = graph.compile(checkpointer=None)
-    final_state: DebateState = compiled.invoke(initial_state)
+    spill_path = attach_spill(config, output_dir, initial_state)
+
+    final_state: DebateState = compiled.invoke(initial_state, {"recursion_limit": config.recursion_limit()})
+    result = finish_run(config, final_state, specs, output_dir, pack, spill_path, model, writer, before_persist)
+    record_run(result, time.perf_counter() - started)
+    return result
+
+
+def attach_spill(config: DebateConfig, output_dir: Path, initial_state: DebateState) -> Optional[Path]:
+    if config.history_window <= 0:
+        return None
+    # Compacted turns are offloaded next to the run's transcript while the debate is in flight.
+    spill_path = output_dir / config.key / "history.jsonl"
+    spill_path.parent.mkdir(parents=True, exist_ok=True)
+    spill_path.unlink(missing_ok=True)
+    initial_state["spill_path"] = str(spill_path)
+    return spill_path
+
+
+def finish_run(
+    config: DebateConfig,
+    final_state: DebateState,
+    specs: Dict[str, AgentSpec],
+    output_dir: Path,
+    pack: Optional[PackWriter],
+    spill_path: Optional[Path],
+    model: Optional[LocalDebateModel] = None,
+    writer: Optional[WritePipeline] = None,
+    before_persist: Optional[Callable[[], None]] = None,
+) -> DebateResult:
+    if spill_path is not None:
+        final_state = restore_state(final_state)
+
+    result = collect_result(config, final_state)
+    if model is not None:
+        result.dependencies = dependency_manifest(model, result)
+    persist = partial(pack_run, result, pack) if pack is not None else partial(persist_run, result, specs, output_dir)
+    if before_persist is not None:
+        # May raise (e.g. LeaseLost) to abandon the write.
+        before_persist()
+    if writer is not None:
+        # Rendering and writing happen on the pipeline's threads; the caller flushes before summarizing.
+        writer.submit(config.key, persist)
+    else:
+        persist()
+    if spill_path is not None:
+        spill_path.unlink()
+        if pack is not None and not any(spill_path.parent.iterdir()):
+            spill_path.parent.rmdir()
+    return result
 
+
+def dependency_manifest(model: LocalDebateModel, result: DebateResult) -> Dict[str, Any]:
+    return build_manifest(model.facts, model.consumed, [issue["key"] for issue in result.open_issues])
+
+
+def record_run(result: DebateResult, elapsed: float) -> None:
+    METRICS.inc("debate_runs_total")
+    if result.consensus_reached:
+        METRICS.inc("debate_consensus_total")
+    METRICS.observe("debate_run_seconds", elapsed)
+
+
+def collect_result(config: DebateConfig, final_state: DebateState) -> DebateResult:
     transcript = final_state["history"]
     scores = final_state["scores"]
     decision = final_state["final_decision"]
@@ -709,6 +979,7 @@ def run_debate(config: DebateConfig, output_dir: Path) -> DebateResult:
     convergence_notes = final_state["convergence_notes"]
     open_issues = final_state["open_issues"]
     resolved_actions = final_state["resolved_actions"]
+    round_snapshots = final_state.get("round_snapshots", [])
 
     result = DebateResult(
         config=config,
@@ -719,20 +990,64 @@ def run_debate(config: DebateConfig, output_dir: Path) -> DebateResult:
         convergence_notes=convergence_notes,
         open_issues=open_issues,
         resolved_actions=resolved_actions,
+        round_snapshots=round_snapshots,
     )
-
-    persist_run(result, specs, output_dir)
     return result
 
 
+def write_atomic(path: Path, content: Union[str, bytes]) -> int:
+    # Write-then-rename so a crashed or duplicated worker never leaves a torn file behind.
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    if isinstance(content, bytes):
+        written = tmp_path.write_bytes(content)
+    else:
+        written = len(content.encode("utf-8"))
+        tmp_path.write_text(content, encoding="utf-8")
+    os.replace(tmp_path, path)
+    return written
+
+
+# Write-pipeline threads persist runs concurrently; index updates go through one writer at a time
+# instead of contending for SQLite's write lock.
+INDEX_WRITE_LOCK = threading.Lock()
+
+
 def persist_run(result: DebateResult, specs: Dict[str, AgentSpec], base_dir: Path) -> None:
     run_dir = base_dir / result.config.key
     run_dir.mkdir(parents=True, exist_ok=True)
 
     transcript_md = render_transcript_markdown(result, specs)
-    (run_dir / "transcript.md").write_text(transcript_md, encoding="utf-8")
+    written = write_atomic(run_dir / "transcript.md", transcript_md)
+
+    transcript_json = transcript_payload(result)
+    transcript_text, offsets = encode_transcript(transcript_json)
+    written += write_atomic(run_dir / "transcript.json", transcript_text)
+    written += write_atomic(run_dir / OFFSETS_FILENAME, offsets)
+
+    index_path = base_dir / INDEX_FILENAME
+    if index_path.exists():
+        # Once an index has been built for this output directory, keep it current as runs land.
+        stat = (run_dir / "transcript.json").stat()
+        with INDEX_WRITE_LOCK:
+            TranscriptIndex(index_path).index_run(result.config.key, transcript_json, stat.st_mtime_ns, stat.st_size)
+
+    summary_lines = [
+        {
+            "metric": key,
+            "score": value,
+        }
+        for key, value in result.scores.items()
+    ]
+    written += write_atomic(run_dir / "scores.json", json.dumps(summary_lines, indent=2))
+    if result.dependencies:
+        written += write_atomic(run_dir / DEPS_FILENAME, json.dumps(result.dependencies, indent=2))
+    if result.round_snapshots:
+        written += write_atomic(run_dir / SNAPSHOTS_FILENAME, encode_snapshots(result.round_snapshots))
+    METRICS.inc("debate_persist_bytes_total", written, sink="files")
+
 
-    transcript_json = {
+def transcript_payload(result: DebateResult) -> Dict[str, Any]:
+    return {
         "config": result.config.as_dict(),
         "scores": result.scores,
         "decision": result.decision,
@@ -742,16 +1057,94 @@ def persist_run(result: DebateResult, specs: Dict[str, AgentSpec], base_dir: Pat
         "resolved_actions": result.resolved_actions,
         "transcript": result.transcript,
     }
-    (run_dir / "transcript.json").write_text(json.dumps(transcript_json, indent=2), encoding="utf-8")
 
-    summary_lines = [
-        {
-            "metric": key,
-            "score": value,
-        }
-        for key, value in result.scores.items()
-    ]
-    (run_dir / "scores.json").write_text(json.dumps(summary_lines, indent=2), encoding="utf-8")
+
+def pack_run(result: DebateResult, pack: PackWriter) -> None:
+    # Specs are not stored: extraction rebuilds them from the config with build_agent_specs.
+    data = transcript_payload(result)
+    if result.dependencies:
+        data["dependencies"] = result.dependencies
+    if result.round_snapshots:
+        data["round_snapshots"] = result.round_snapshots
+    payload = json.dumps(data, separators=(",", ":")).encode("utf-8")
+    entry = pack.append(result.config.key, payload)
+    METRICS.inc("debate_persist_bytes_total", entry["length"], sink="pack")
+
+
+def load_result(run_dir: Path) -> DebateResult:
+    data = json.loads((run_dir / "transcript.json").read_text(encoding="utf-8"))
+    deps_path = run_dir / DEPS_FILENAME
+    if deps_path.exists():
+        data["dependencies"] = json.loads(deps_path.read_text(encoding="utf-8"))
+    snapshots_path = run_dir / SNAPSHOTS_FILENAME
+    if snapshots_path.exists():
+        data["round_snapshots"] = decode_snapshots(snapshots_path.read_bytes())
+    return result_from_payload(data)
+
+
+def load_packed_result(reader: PackReader, key: str) -> DebateResult:
+    return result_from_payload(reader.load_json(key))
+
+
+def stored_location(output_dir: Path, key: str, reader: Optional[PackReader]) -> Optional[str]:
+    """Where the stored run for ``key`` lives: ``"dir"``, ``"pack"`` or None.
+
+    Run directories and pack records share no ordering, so a key stored in both is refused rather
+    than resolved by guessing which one is newer.
+    """
+    in_dir = (output_dir / key / "transcript.json").exists()
+    in_pack = reader is not None and key in reader
+    if in_dir and in_pack:
+        raise ValueError(
+            f"{key} is stored both in {output_dir / key} and in {output_dir / PACK_DIRNAME}; remove the stale copy."
+        )
+    if in_dir:
+        return "dir"
+    return "pack" if in_pack else None
+
+
+def check_sink(keys: List[str], output_dir: Path, packed: bool) -> None:
+    """Refuse a sweep that would store a key in a run directory and in the pack at the same time."""
+    if packed:
+        clash = [key for key in keys if (output_dir / key / "transcript.json").exists()]
+        where = "run directories"
+    else:
+        pack_dir = output_dir / PACK_DIRNAME
+        reader = PackReader(pack_dir) if pack_dir.is_dir() else None
+        clash = [key for key in keys if reader is not None and key in reader]
+        where = "pack records"
+    if clash:
+        raise ValueError(
+            f"Already stored as {where} under {output_dir}: {', '.join(clash)}. "
+            "Remove them or choose another --output before switching storage."
+        )
+
+
+def load_stored_result(output_dir: Path, key: str) -> DebateResult:
+    pack_dir = output_dir / PACK_DIRNAME
+    reader = PackReader(pack_dir) if pack_dir.is_dir() else None
+    if stored_location(output_dir, key, reader) == "dir":
+        return load_result(output_dir / key)
+    if reader is None:
+        raise FileNotFoundError(f"No stored run for {key} under {output_dir}")
+    return load_packed_result(reader, key)
+
+
+def result_from_payload(data: Dict[str, Any]) -> DebateResult:
+    # Runs recorded before DebateConfig.rng existed used the shared stream.
+    config_data = {"rng": "shared", **data["config"]}
+    return DebateResult(
+        config=DebateConfig(**config_data),
+        transcript=data["transcript"],
+        scores=data["scores"],
+        decision=data["decision"],
+        consensus_reached=data["consensus_reached"],
+        convergence_notes=data["convergence_notes"],
+        open_issues=data["open_issues"],
+        resolved_actions=data["resolved_actions"],
+        dependencies=data.get("dependencies", {}),
+        round_snapshots=data.get("round_snapshots", []),
+    )
 
 
 def render_transcript_markdown(result: DebateResult, specs: Dict[str, AgentSpec]) -> str:
@@ -815,6 +1208,7 @@ def prepare_configs() -> Dict[str, DebateConfig]:
         include_devil=False,
         seed=21,
         notes="Baseline run with 4 agents, low temperature.",
+        rng="shared",  # presets keep the legacy stream so published results reproduce
     )
 
     two_agent = DebateConfig(
@@ -829,6 +1223,7 @@ def prepare_configs() -> Dict[str, DebateConfig]:
         include_devil=False,
         seed=22,
         notes="Toggle 1 — reduce to two agents (Researcher + Critic-Judge).",
+        rng="shared",
     )
 
     high_temp = DebateConfig(
@@ -843,6 +1238,7 @@ def prepare_configs() -> Dict[str, DebateConfig]:
         include_devil=True,
         seed=69,
         notes="Toggle 2 — raise temperature and add devil's advocate for stress test.",
+        rng="shared",
     )
 
     return {
@@ -852,7 +1248,7 @@ def prepare_configs() -> Dict[str, DebateConfig]:
     }
 
 
-def run_all(config_names: Optional[List[str]], output_dir: Path) -> List[DebateResult]:
+def select_configs(config_names: Optional[List[str]], rng: Optional[str] = None) -> List[DebateConfig]:
     configs = prepare_configs()
     if config_names:
         missing = [name for name in config_names if name not in configs]
@@ -861,36 +1257,207 @@ def run_all(config_names: Optional[List[str]], output_dir: Path) -> List[DebateR
         selected = [configs[name] for name in config_names]
     else:
         selected = list(configs.values())
+    if rng is not None:
+        selected = [dataclasses.replace(config, rng=rng) for config in selected]
+    return selected
+
+
+def run_worker(
+    queue: WorkQueue,
+    output_dir: Path,
+    worker_id: str,
+    lease_seconds: float = 60.0,
+    poll_interval: float = 1.0,
+    pack: Optional[PackWriter] = None,
+) -> List[str]:
+    completed = []
+    while True:
+        job = queue.claim(worker_id, lease_seconds)
+        METRICS.set("debate_queue_depth", queue.counts().get("pending", 0))
+        if job is None:
+            if queue.drained():
+                return completed
+            # Other workers hold live leases; wait in case one of them dies and its lease expires.
+            time.sleep(poll_interval)
+            continue
+
+        config = DebateConfig(**job.payload)
+        print(f"🔁 [{worker_id}] Running debate: {config.key} (attempt {job.attempts})")
+        try:
+            with Heartbeat(queue, job.key, worker_id, lease_seconds) as heartbeat:
+                # Re-confirm the lease right before writing so a reclaimed job is written by its new holder only.
+                run_debate(config, output_dir=output_dir, pack=pack, before_persist=heartbeat.check)
+        except LeaseLost:
+            print(f"⚠️ [{worker_id}] Lease lost for {config.key}; result left to current holder.\n")
+            continue
+        except Exception as exc:
+            queue.fail(job.key, worker_id, f"{type(exc).__name__}: {exc}")
+            print(f"❌ [{worker_id}] Failed: {config.key} — {exc}\n")
+            continue
+
+        if not heartbeat.lost and queue.complete(job.key, worker_id):
+            completed.append(job.key)
+            print(f"✅ [{worker_id}] Completed: {config.key}\n")
+        else:
+            print(f"⚠️ [{worker_id}] Lease lost for {config.key}; result left to current holder.\n")
+
+
+def merge_queue_results(queue: WorkQueue, output_dir: Path, packed: bool = False) -> List[DebateResult]:
+    if packed:
+        reader = PackReader(output_dir / PACK_DIRNAME)
+        results = [load_packed_result(reader, key) for key in queue.keys(status="done")]
+    else:
+        results = [load_result(output_dir / key) for key in queue.keys(status="done")]
+    compile_summary(results, output_dir)
+    failed = queue.keys(status="failed")
+    if failed:
+        raise RuntimeError(f"Jobs failed after {queue.max_attempts} attempts: {', '.join(failed)}")
+    return results
 
-    results = []
-    for config in selected:
-        print(f"🔁 Running debate: {config.key} — {config.title}")
-        results.append(run_debate(config, output_dir=output_dir))
-        print(f"✅ Completed: {config.key}\n")
 
-    compile_summary(results, output_dir)
+def run_queue(
+    config_names: Optional[List[str]],
+    output_dir: Path,
+    worker_id: Optional[str] = None,
+    lease_seconds: float = 60.0,
+    poll_interval: float = 1.0,
+    pack_codec: Optional[str] = None,
+    rng: Optional[str] = None,
+) -> List[DebateResult]:
+    selected = select_configs(config_names, rng)
+    check_sink([config.key for config in selected], output_dir, packed=pack_codec is not None)
+    queue = WorkQueue(output_dir / QUEUE_FILENAME)
+    queue.enqueue({config.key: config.as_dict() for config in selected})
+    worker_id = worker_id or default_worker_id()
+    pack = PackWriter(output_dir / PACK_DIRNAME, worker_id, codec=pack_codec) if pack_codec else None
+    try:
+        run_worker(
+            queue,
+            output_dir,
+            worker_id=worker_id,
+            lease_seconds=lease_seconds,
+            poll_interval=poll_interval,
+            pack=pack,
+        )
+    finally:
+        if pack is not None:
+            pack.close()
+    return merge_queue_results(queue, output_dir, packed=pack is not None)
+
+
+def invalidation_reason(
+    config: DebateConfig,
+    output_dir: Path,
+    facts: Dict[str, Any],
+    reader: Optional[PackReader] = None,
+) -> Optional[str]:
+    """Why the stored run for ``config`` must be re-executed, or None if it is still current."""
+    run_dir = output_dir / config.key
+    location = stored_location(output_dir, config.key, reader)
+    if location == "dir":
+        with TranscriptReader(run_dir) as transcript:
+            stored_config = transcript.field("config")
+        deps_path = run_dir / DEPS_FILENAME
+        manifest = json.loads(deps_path.read_text(encoding="utf-8")) if deps_path.exists() else None
+    elif location == "pack":
+        data = reader.load_json(config.key)
+        stored_config, manifest = data["config"], data.get("dependencies")
+    else:
+        return "no stored run"
+    if stored_config != config.as_dict():
+        return "config changed"
+    changed = stale_refs(manifest, facts)
+    if changed == ["*"]:
+        return "no dependency record"
+    if changed:
+        return "facts changed: " + ", ".join(changed)
+    return None
+
+
+def run_all(
+    config_names: Optional[List[str]],
+    output_dir: Path,
+    pack_codec: Optional[str] = None,
+    incremental: bool = False,
+    io_workers: int = 0,
+    io_queue: int = 8,
+    rng: Optional[str] = None,
+) -> List[DebateResult]:
+    selected = select_configs(config_names, rng)
+    pending = selected
+    if incremental:
+        facts = build_facts()
+        pack_dir = output_dir / PACK_DIRNAME
+        reader = PackReader(pack_dir) if pack_dir.is_dir() else None
+        pending = []
+        for config in selected:
+            reason = invalidation_reason(config, output_dir, facts, reader)
+            if reason is None:
+                print(f"⏭️ Up to date: {config.key}")
+            else:
+                print(f"♻️ Stale: {config.key} ({reason})")
+                pending.append(config)
+    check_sink([config.key for config in pending], output_dir, packed=pack_codec is not None)
+    pack = PackWriter(output_dir / PACK_DIRNAME, default_worker_id(), codec=pack_codec) if pack_codec else None
+
+    results = []
+    try:
+        # Leaving the block is the write barrier: every artifact is on disk (or the sweep has failed).
+        with WritePipeline(io_workers, io_queue) if io_workers > 0 else nullcontext() as writer:
+            for config in pending:
+                print(f"🔁 Running debate: {config.key} — {config.title}")
+                results.append(run_debate(config, output_dir=output_dir, pack=pack, writer=writer))
+                print(f"✅ Completed: {config.key}\n")
+    finally:
+        if pack is not None:
+            pack.close()
+
+    if incremental:
+        update_summary(results, output_dir, [config.key for config in selected])
+    else:
+        compile_summary(results, output_dir)
     return results
 
 
+def summary_row(result: DebateResult) -> Dict[str, Any]:
+    avg_score = sum(result.scores.values()) / len(RUBRIC_KEYS)
+    return {
+        "config": result.config.key,
+        "rounds": result.config.rounds,
+        "agents": result.config.agent_mode,
+        "temperature": result.config.temperature,
+        "decision": result.decision,
+        "consensus": result.consensus_reached,
+        "avg_score": round(avg_score, 2),
+        **{f"score_{k}": v for k, v in result.scores.items()},
+        "unresolved_issues": [issue["key"] for issue in result.open_issues if issue["status"] == "open"],
+    }
+
+
 def compile_summary(results: List[DebateResult], output_dir: Path) -> None:
-    summary_rows = []
-    for result in results:
-        avg_score = sum(result.scores.values()) / len(RUBRIC_KEYS)
-        summary_rows.append(
-            {
-                "config": result.config.key,
-                "rounds": result.config.rounds,
-                "agents": result.config.agent_mode,
-                "temperature": result.config.temperature,
-                "decision": result.decision,
-                "consensus": result.consensus_reached,
-                "avg_score": round(avg_score, 2),
-                **{f"score_{k}": v for k, v in result.scores.items()},
-                "unresolved_issues": [issue["key"] for issue in result.open_issues if issue["status"] == "open"],
-            }
-        )
+    write_summary([summary_row(result) for result in results], output_dir)
 
-    (output_dir / "summary.json").write_text(json.dumps(summary_rows, indent=2), encoding="utf-8")
+
+def update_summary(results: List[DebateResult], output_dir: Path, keys: List[str]) -> None:
+    """Rewrite the summary for ``keys`` (in order), replacing rows for ``results`` and keeping the rest.
+
+    Rows for untouched runs come from the existing summary.json; only runs missing there are loaded.
+    """
+    existing: Dict[str, Dict[str, Any]] = {}
+    summary_path = output_dir / "summary.json"
+    if summary_path.exists():
+        existing = {row["config"]: row for row in json.loads(summary_path.read_text(encoding="utf-8"))}
+    existing.update((result.config.key, summary_row(result)) for result in results)
+    rows = []
+    for key in keys:
+        if key not in existing:
+            existing[key] = summary_row(load_stored_result(output_dir, key))
+        rows.append(existing[key])
+    write_summary(rows, output_dir)
+
+
+def write_summary(summary_rows: List[Dict[str, Any]], output_dir: Path) -> None:
+    write_atomic(output_dir / "summary.json", json.dumps(summary_rows, indent=2))
 
     header = ["config", "rounds", "agents", "temperature", "decision", "consensus", "avg_score"] + [
         f"score_{k}" for k in RUBRIC_KEYS
@@ -912,7 +1479,7 @@ def compile_summary(results: List[DebateResult], output_dir: Path) -> None:
         values.append(unresolved)
         lines.append(",".join(values))
 
-    (output_dir / "summary.csv").write_text("\n".join(lines), encoding="utf-8")
+    write_atomic(output_dir / "summary.csv", "\n".join(lines))
 
 
 def parse_args() -> argparse.Namespace:
@@ -923,19 +1490,94 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Subset of config keys to run (default: run all presets).",
     )
+    parser.add_argument(
+        "--rng",
+        choices=RNG_SCHEMES,
+        default=None,
+        help="Random stream scheme for the selected presets (default: each preset's own, 'shared').",
+    )
     parser.add_argument(
         "--output",
         default="results",
         help="Directory to store transcripts and metrics.",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--work-queue",
+        action="store_true",
+        help="Pull jobs from a shared SQLite queue in the output directory (run on several machines at once).",
+    )
+    parser.add_argument(
+        "--worker-id",
+        default=None,
+        help="Identifier recorded on leased jobs (default: hostname:pid).",
+    )
+    parser.add_argument(
+        "--lease-seconds",
+        type=float,
+        default=60.0,
+        help="Job lease length; crashed workers' jobs are re-claimed once it expires.",
+    )
+    parser.add_argument(
+        "--pack",
+        choices=sorted(CODECS),
+        default=None,
+        help="Append compressed runs to per-worker segments under <output>/packs instead of per-run directories.",
+    )
+    parser.add_argument(
+        "--metrics-dir",
+        default=None,
+        help="Flush live counters here every few seconds; read them with `python -m debate.metrics <dir>`.",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Re-run only debates whose config or consumed scenario facts changed; update the summary in place.",
+    )
+    parser.add_argument(
+        "--io-workers",
+        type=int,
+        default=0,
+        help="Render and write artifacts on this many background threads (0 writes inline).",
+    )
+    parser.add_argument(
+        "--io-queue",
+        type=int,
+        default=8,
+        help="Finished runs allowed to wait for a writer before the sweep blocks.",
+    )
+    args = parser.parse_args()
+    if args.incremental and args.work_queue:
+        parser.error("--incremental cannot be combined with --work-queue.")
+    if args.io_workers and args.work_queue:
+        parser.error("--io-workers cannot be combined with --work-queue (jobs are acknowledged once written).")
+    return args
 
 
 def main() -> None:
     args = parse_args()
     output_dir = Path(args.output)
     output_dir.mkdir(parents=True, exist_ok=True)
-    run_all(args.configs, output_dir=output_dir)
+    if args.metrics_dir:
+        METRICS.configure(Path(args.metrics_dir), args.worker_id or default_worker_id())
+    if args.work_queue:
+        run_queue(
+            args.configs,
+            output_dir=output_dir,
+            worker_id=args.worker_id,
+            lease_seconds=args.lease_seconds,
+            pack_codec=args.pack,
+            rng=args.rng,
+        )
+    else:
+        run_all(
+            args.configs,
+            output_dir=output_dir,
+            pack_codec=args.pack,
+            incremental=args.incremental,
+            io_workers=args.io_workers,
+            io_queue=args.io_queue,
+            rng=args.rng,
+        )
 
 
 if __name__ == "__main__":
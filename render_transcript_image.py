@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-import json
 import textwrap
 from pathlib import Path
 from typing import Iterable, List
 
 from PIL import Image, ImageDraw, ImageFont
 
+from debate.transcript_reader import TranscriptReader
+
 
 def _wrap_content(lines: Iterable[str], width: int) -> List[str]:
     wrapped: List[str] = []
@@ -19,25 +20,19 @@ def _wrap_content(lines: Iterable[str], width: int) -> List[str]:
 
 
 def build_excerpt(transcript_json: Path, label: str, max_width: int = 88) -> List[str]:
-    data = json.loads(transcript_json.read_text(encoding="utf-8"))
-    transcript = data["transcript"]
-    scores = data["scores"]
+    # Decode only the turns and header fields we need via the offset sidecar written by persist_run.
+    with TranscriptReader(transcript_json.parent) as reader:
+        scores = reader.field("scores")
+        decision = reader.field("decision")
+        # Capture two early stages and the final verdict.
+        chosen = reader.turns(rounds=[1], stages=["argue", "critique"], limit=4)
+        chosen += reader.turns(rounds=[2], stages=["revise", "verdict"], limit=4 - len(chosen))
 
     lines: List[str] = [
         label,
         "",
     ]
 
-    # Capture two early stages and the final verdict.
-    chosen = []
-    for message in transcript:
-        if message["round"] == 1 and message["stage"] in {"argue", "critique"}:
-            chosen.append(message)
-        elif message["round"] == 2 and message["stage"] in {"revise", "verdict"}:
-            chosen.append(message)
-        if len(chosen) >= 4:
-            break
-
     for message in chosen:
         heading = f"Round {message['round']} · {message['stage'].upper()} · {message['speaker']}"
         lines.append(heading)
@@ -48,7 +43,7 @@ def build_excerpt(transcript_json: Path, label: str, max_width: int = 88) -> Lis
 
     rubric_line = "Scores → " + ", ".join(f"{key.title()}: {value}" for key, value in scores.items())
     lines.append(rubric_line)
-    decision_line = f"Decision → {data['decision']}"
+    decision_line = f"Decision → {decision}"
     lines.append(decision_line)
 
     return lines
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import dataclasses
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from debate.batch import run_batched
+from debate.writeback import WritePipeline
+from debate_runner import DebateConfig, prepare_configs, run_debate, transcript_payload
+
+
+def lane_configs(rng: str) -> List[DebateConfig]:
+    configs = [
+        dataclasses.replace(base, key=f"{base.key}_seed{seed}", seed=base.seed + seed, rounds=3, rng=rng)
+        for seed in range(5)
+        for base in prepare_configs().values()
+    ]
+    if rng == "counter":
+        # Fan-out topologies cannot run in lockstep and fall back to solo runs inside the sweep.
+        devil = prepare_configs()["toggle_high_temp_devil"]
+        configs += [
+            dataclasses.replace(devil, key=f"parallel_seed{seed}", seed=seed, rounds=2, rng=rng, parallel_review=True)
+            for seed in range(2)
+        ]
+    return configs
+
+
+def tree(root: Path) -> dict:
+    return {str(path.relative_to(root)): path.read_bytes() for path in sorted(root.rglob("*")) if path.is_file()}
+
+
+@pytest.mark.parametrize("rng", ["shared", "counter"])
+def test_batched_lanes_match_sequential_runs(tmp_path: Path, rng: str) -> None:
+    configs = lane_configs(rng)
+    sequential = [run_debate(config, output_dir=tmp_path / "solo") for config in configs]
+    batched = run_batched(configs, tmp_path / "batched", lanes=4)
+
+    assert [result.config.key for result in batched] == [config.key for config in configs]
+    assert [transcript_payload(result) for result in batched] == [transcript_payload(result) for result in sequential]
+    assert [result.dependencies for result in batched] == [result.dependencies for result in sequential]
+    assert tree(tmp_path / "batched") == tree(tmp_path / "solo")
+
+
+def test_batched_sweep_writes_through_the_pipeline(tmp_path: Path) -> None:
+    configs = lane_configs("counter")
+    for config in configs:
+        run_debate(config, output_dir=tmp_path / "solo")
+    with WritePipeline(workers=3, max_pending=2) as writer:
+        run_batched(configs, tmp_path / "piped", lanes=3, writer=writer)
+
+    assert tree(tmp_path / "piped") == tree(tmp_path / "solo")
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import copy
+import re
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+import pytest
+
+import debate_runner
+from debate_runner import load_stored_result, prepare_configs, run_all
+
+ORIGINAL_FACTS = debate_runner.build_facts
+
+
+def edit_evidence(facts: Dict[str, Any]) -> None:
+    facts["evidence"][1] = "MassCEC Gap Fund commitment now covers 40% of capital spend."
+
+
+def edit_mitigation(facts: Dict[str, Any]) -> None:
+    facts["mitigations"]["Regulatory whiplash"] = "Pre-file a tariff waiver with DPU before construction."
+
+
+@pytest.mark.parametrize("pack_codec", [None, "zlib"])
+@pytest.mark.parametrize(
+    "edit,stale",
+    [
+        # evidence[1] is only sampled by the low-temperature baseline.
+        (edit_evidence, {"baseline_full_lowtemp": "evidence[1]"}),
+        # Only the devil run resolves the regulatory issue.
+        (edit_mitigation, {"toggle_high_temp_devil": "mitigations[Regulatory whiplash]"}),
+    ],
+)
+def test_fact_edit_reruns_only_dependent_configs(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+    edit: Callable[[Dict[str, Any]], None],
+    stale: Dict[str, str],
+    pack_codec: Optional[str],
+) -> None:
+    run_all(None, tmp_path, pack_codec=pack_codec)
+    before = {key: load_stored_result(tmp_path, key) for key in prepare_configs()}
+    capsys.readouterr()
+
+    def edited_facts() -> Dict[str, Any]:
+        facts = copy.deepcopy(ORIGINAL_FACTS())
+        edit(facts)
+        return facts
+
+    monkeypatch.setattr(debate_runner, "build_facts", edited_facts)
+    rerun = run_all(None, tmp_path, pack_codec=pack_codec, incremental=True)
+    out = capsys.readouterr().out
+
+    assert sorted(result.config.key for result in rerun) == sorted(stale)
+    for key in prepare_configs():
+        if key in stale:
+            assert f"Stale: {key} (facts changed: {stale[key]})" in out
+        else:
+            assert f"Up to date: {key}" in out
+            assert load_stored_result(tmp_path, key) == before[key]
+    assert len(re.findall("Running debate", out)) == len(stale)
+
+    run_all(None, tmp_path, pack_codec=pack_codec, incremental=True)
+    assert "Stale" not in capsys.readouterr().out
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from debate.metrics import METRICS, MetricsRegistry, load_shards, render_prometheus, shard_name
+
+
+def test_large_counters_and_float_sums_render_exactly() -> None:
+    registry = MetricsRegistry()
+    registry.inc("debate_bytes_written_total", 123456789)
+    registry.inc("debate_bytes_written_total", 1)
+    registry.observe("debate_node_seconds", 0.1234567891, node="critic")
+    for _ in range(1_000_001):
+        registry.inc("debate_runs_total")
+
+    text = render_prometheus([registry.snapshot()], now=registry.started + 1.0)
+    assert "debate_bytes_written_total 123456790\n" in text
+    assert "debate_runs_total 1000001\n" in text
+    assert 'debate_node_seconds_sum{node="critic"} 0.1234567891\n' in text
+    assert 'debate_node_seconds_count{node="critic"} 1\n' in text
+    assert 'debate_node_seconds_bucket{node="critic",le="+Inf"} 1\n' in text
+    assert "e+" not in text
+
+
+def test_shards_from_hosts_with_the_same_pid_are_all_merged(tmp_path: Path) -> None:
+    assert shard_name(4242, "node-a") != shard_name(4242, "node-b")
+    for host, runs in (("node-a", 3), ("node b/2", 4)):
+        registry = MetricsRegistry()
+        registry.inc("debate_runs_total", runs)
+        snapshot = dict(registry.snapshot(), pid=4242, worker=f"{host}:4242")
+        (tmp_path / shard_name(4242, host)).write_text(json.dumps(snapshot), encoding="utf-8")
+
+    shards = load_shards(tmp_path)
+    assert len(shards) == 2
+    assert "debate_runs_total 7\n" in render_prometheus(shards)
+
+
+def count_runs(runs: int) -> int:
+    METRICS.inc("debate_runs_total", runs)
+    return os.getpid()
+
+
+def test_forked_workers_write_their_own_shards(tmp_path: Path) -> None:
+    METRICS.configure(tmp_path, "parent", interval=0.05)
+    try:
+        context = multiprocessing.get_context("fork")
+        child = context.Process(target=count_runs, args=(5,))
+        child.start()
+        child.join()
+        with ProcessPoolExecutor(max_workers=2, mp_context=context) as executor:
+            pool_pids = set(executor.map(count_runs, [1] * 4))
+        METRICS.flush()
+    finally:
+        METRICS._stop.set()
+        METRICS.metrics_dir = None
+
+    shards = load_shards(tmp_path)
+    # Every process that counted has a shard (an idle pool worker may add an empty one).
+    assert {os.getpid(), child.pid, *pool_pids} <= {shard["pid"] for shard in shards}
+    # Children start from zero; the parent's shard also holds counts from earlier tests in this process.
+    children = [shard for shard in shards if shard["pid"] != os.getpid()]
+    assert "debate_runs_total 9\n" in render_prometheus(children)
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import dataclasses
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+import debate.packs
+from debate.packs import PackReader, PackWriter, trim_torn_tail
+from debate_runner import (
+    PACK_DIRNAME,
+    build_facts,
+    invalidation_reason,
+    load_stored_result,
+    pack_run,
+    prepare_configs,
+    run_all,
+    run_debate,
+)
+
+
+def test_restarted_writer_does_not_merge_into_torn_index_line(tmp_path: Path) -> None:
+    with PackWriter(tmp_path, "worker-1") as pack:
+        pack.append("a", b'{"n": 1}')
+    index_path = tmp_path / "worker-1.idx"
+    with open(index_path, "a", encoding="utf-8") as handle:
+        handle.write('{"key": "b", "segment": "worker-1-0')  # crash mid-line
+
+    with PackWriter(tmp_path, "worker-1") as pack:
+        pack.append("c", b'{"n": 3}')
+
+    reader = PackReader(tmp_path)
+    assert reader.keys() == ["a", "c"]
+    assert reader.load_json("c") == {"n": 3}
+
+
+def test_trim_torn_tail(tmp_path: Path) -> None:
+    path = tmp_path / "index"
+    path.write_bytes(b"one\ntwo\nthr")
+    trim_torn_tail(path, chunk=2)
+    assert path.read_bytes() == b"one\ntwo\n"
+    trim_torn_tail(path)
+    assert path.read_bytes() == b"one\ntwo\n"
+    path.write_bytes(b"no newline at all")
+    trim_torn_tail(path, chunk=4)
+    assert path.read_bytes() == b""
+
+
+def test_rerun_on_a_host_with_a_slower_clock_still_wins(tmp_path: Path, monkeypatch) -> None:
+    clock = iter([2000.0, 1000.0])  # the second host's clock is far behind the first's
+    monkeypatch.setattr(debate.packs, "time", SimpleNamespace(time=lambda: next(clock)))
+    with PackWriter(tmp_path, "host-a") as pack:
+        pack.append("a", b'{"run": 1}')
+    with PackWriter(tmp_path, "host-b") as pack:
+        entry = pack.append("a", b'{"run": 2}')
+
+    assert entry["seq"] == 2
+    assert PackReader(tmp_path).load_json("a") == {"run": 2}
+
+
+def test_key_stored_in_a_run_directory_and_the_pack_is_refused(tmp_path: Path) -> None:
+    config = dataclasses.replace(prepare_configs()["toggle_two_agent"], rounds=1)
+    run_debate(config, output_dir=tmp_path)
+    with pytest.raises(ValueError, match="Already stored as run directories"):
+        run_all([config.key], tmp_path, pack_codec="zlib")
+
+    with PackWriter(tmp_path / PACK_DIRNAME, "other") as pack:
+        pack_run(run_debate(config, output_dir=tmp_path / "scratch"), pack)
+    reader = PackReader(tmp_path / PACK_DIRNAME)
+    with pytest.raises(ValueError, match="stored both"):
+        invalidation_reason(config, tmp_path, build_facts(), reader)
+    with pytest.raises(ValueError, match="stored both"):
+        load_stored_result(tmp_path, config.key)
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from debate_runner import DebateConfig, prepare_configs, run_debate, select_configs
+
+RESULTS = Path(__file__).resolve().parent.parent / "results"
+
+
+@pytest.mark.parametrize("key", sorted(prepare_configs()))
+def test_config_without_rng_reproduces_committed_results(tmp_path: Path, key: str) -> None:
+    # A config written before DebateConfig.rng existed: no rng key at all.
+    legacy = {name: value for name, value in prepare_configs()[key].as_dict().items() if name != "rng"}
+    config = DebateConfig(**legacy)
+    assert config.rng == "shared"
+
+    run_debate(config, output_dir=tmp_path)
+    expected = sorted(path.relative_to(RESULTS / key) for path in (RESULTS / key).rglob("*") if path.is_file())
+    produced = sorted(path.relative_to(tmp_path / key) for path in (tmp_path / key).rglob("*") if path.is_file())
+    assert produced == expected
+    for name in expected:
+        assert (tmp_path / key / name).read_bytes() == (RESULTS / key / name).read_bytes(), name
+
+
+def test_counter_streams_are_opt_in() -> None:
+    assert {config.rng for config in select_configs(None)} == {"shared"}
+    assert {config.rng for config in select_configs(None, rng="counter")} == {"counter"}
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import dataclasses
+
+import pytest
+
+from debate.service import DebateService, parse_config
+from debate_runner import load_result, prepare_configs, run_debate, transcript_payload
+
+
+@pytest.mark.parametrize("key", ["../escaped", "a/b", "..", ".hidden", "a..b", "x\\y", "", "/abs"])
+def test_parse_config_rejects_unsafe_keys(key: str) -> None:
+    with pytest.raises(ValueError, match="Invalid key"):
+        parse_config({"preset": "toggle_two_agent", "key": key})
+
+
+def test_parse_config_accepts_slug_keys() -> None:
+    assert parse_config({"preset": "toggle_two_agent", "key": "sweep_7-b.v2"}).key == "sweep_7-b.v2"
+    assert parse_config({"preset": "toggle_two_agent"}).key == "toggle_two_agent"
+
+
+def test_streamed_compacted_run_persists_full_history(tmp_path) -> None:
+    config = dataclasses.replace(
+        prepare_configs()["toggle_high_temp_devil"], rounds=6, history_window=2, rng="counter"
+    )
+    service = DebateService(workers=1, output_dir=tmp_path / "service")
+    streamed = []
+    service.run_streaming(config, lambda event, data: streamed.append(data))
+    solo = run_debate(config, output_dir=tmp_path / "solo")
+
+    served = load_result(tmp_path / "service" / config.key)
+    assert len(streamed) == len(solo.transcript)
+    assert transcript_payload(served) == transcript_payload(solo)
+    assert served.round_snapshots == solo.round_snapshots
+    assert not (tmp_path / "service" / config.key / "history.jsonl").exists()
+
+
+def test_warm_graphs_are_shared_across_keys_and_seeds(tmp_path) -> None:
+    base = prepare_configs()["toggle_high_temp_devil"]
+    configs = [dataclasses.replace(base, key=f"job{seed}", seed=seed) for seed in range(4)]
+    service = DebateService(workers=1, output_dir=tmp_path / "service")
+    for config in configs:
+        service.run_streaming(config, lambda event, data: None)
+
+    assert (service.pool.misses, service.pool.hits) == (1, 3)
+    for config in configs:
+        solo = run_debate(config, output_dir=tmp_path / "solo")
+        served = load_result(tmp_path / "service" / config.key)
+        assert transcript_payload(served) == transcript_payload(solo)
+        assert served.config == solo.config
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from typing import List
+
+import pytest
+
+from debate.simbackend import TokenBucket
+from debate.stats import percentile
+
+
+class FakeClock:
+    """Manual clock: sleeps are recorded, time only moves when the test advances it."""
+
+    def __init__(self) -> None:
+        self.now = 100.0
+        self.sleeps: List[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+
+
+def bucket(tokens_per_minute: float, clock: FakeClock) -> TokenBucket:
+    return TokenBucket(tokens_per_minute, clock=clock, sleep=clock.sleep)
+
+
+def test_requests_larger_than_the_burst_are_charged_in_full() -> None:
+    # 6000 tpm refills 100 tokens/s with a 100-token burst: five 650-token requests arriving together
+    # need 3250 tokens, so the last one waits (3250 - 100) / 100 = 31.5s.
+    clock = FakeClock()
+    limiter = bucket(6000, clock)
+    waits = [limiter.acquire(650) for _ in range(5)]
+    assert waits == pytest.approx([5.5, 12.0, 18.5, 25.0, 31.5])
+    assert clock.sleeps == pytest.approx(waits)
+
+
+def test_debt_is_repaid_by_refill_before_the_next_request() -> None:
+    clock = FakeClock()
+    limiter = bucket(60000, clock)
+    assert limiter.acquire(1500) == pytest.approx(0.5)
+    clock.now += 0.5
+    assert limiter.acquire(1000) == pytest.approx(1.0)
+    clock.now += 60.0  # a long idle spell refills only up to the burst capacity
+    assert limiter.acquire(1000) == 0.0
+    assert limiter.acquire(500) == pytest.approx(0.5)
+
+
+def test_percentile_is_nearest_rank() -> None:
+    assert percentile([], 50) == 0.0
+    assert percentile([3.0, 1.0, 2.0, 4.0], 50) == 2.0
+    assert percentile([3.0, 1.0, 2.0, 4.0], 99) == 4.0
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import dataclasses
+import operator
+from typing import Annotated, Any, Dict, List, Tuple, TypedDict
+
+import pytest
+from langgraph.graph import END, StateGraph
+
+import debate.stepping
+from debate.replay import compiled_steps, direct_steps
+from debate.stepping import graph_tables
+from debate_runner import build_facts, build_graph, prepare_configs
+
+
+def steps(graph: StateGraph, state: Dict[str, Any], limit: int, compiled: bool) -> List[Tuple[str, Dict[str, Any]]]:
+    walked = None if compiled else direct_steps(graph, state, limit)
+    return list(walked if walked is not None else compiled_steps(graph, state, limit))
+
+
+def preset_variants():
+    for name, base in prepare_configs().items():
+        yield name, base
+        yield f"{name}_counter_compacted", dataclasses.replace(base, rng="counter", history_window=2, rounds=4)
+    yield "parallel_review", dataclasses.replace(
+        prepare_configs()["toggle_high_temp_devil"], rng="counter", parallel_review=True
+    )
+
+
+@pytest.mark.parametrize("name,config", list(preset_variants()))
+def test_direct_and_compiled_stepping_emit_identical_snapshots(name: str, config) -> None:
+    facts = build_facts()
+    graph, state, _ = build_graph(config, facts)
+    direct = steps(graph, state, config.recursion_limit(), compiled=False)
+    graph, state, _ = build_graph(config, facts)
+    compiled = steps(graph, state, config.recursion_limit(), compiled=True)
+    assert direct == compiled
+
+
+class TallyState(TypedDict, total=False):
+    count: int
+    log: Annotated[List[str], operator.add]
+
+
+def tally_graph() -> StateGraph:
+    graph = StateGraph(TallyState)
+    graph.add_node("step", lambda state: {"count": state["count"] + 1, "log": [f"step{state['count']}"]})
+    graph.set_entry_point("step")
+    graph.add_conditional_edges("step", lambda state: END if state["count"] >= 3 else "step")
+    return graph
+
+
+def test_reducer_state_falls_back_to_compiled_stepping() -> None:
+    graph = tally_graph()
+    assert graph_tables(graph) is None
+    assert direct_steps(graph, {"count": 0, "log": []}, 10) is None
+
+    expected = steps(graph, {"count": 0, "log": []}, 10, compiled=True)
+    assert steps(graph, {"count": 0, "log": []}, 10, compiled=False) == expected
+    assert expected[-1][1] == {"count": 3, "log": ["step0", "step1", "step2"]}
+
+
+def test_parallel_review_schema_keeps_its_reducer() -> None:
+    config = dataclasses.replace(prepare_configs()["toggle_high_temp_devil"], rng="counter", parallel_review=True)
+    graph, _, _ = build_graph(config, build_facts())
+    assert debate.stepping.has_reducers(graph.state_schema)
+
+
+def test_untested_langgraph_release_uses_compiled_stepping(monkeypatch) -> None:
+    graph, _, _ = build_graph(prepare_configs()["toggle_two_agent"], build_facts())
+    assert graph_tables(graph) is not None
+    monkeypatch.setattr(debate.stepping, "version", lambda name: "9.0.0")
+    assert graph_tables(graph) is None
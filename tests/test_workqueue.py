@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import dataclasses
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from debate.workqueue import QUEUE_FILENAME, Heartbeat, LeaseLost, WorkQueue
+from debate_runner import prepare_configs, run_debate, run_worker
+
+
+def sweep_payloads(seeds: int):
+    return {
+        f"{base.key}_seed{seed}": dataclasses.replace(base, key=f"{base.key}_seed{seed}", seed=base.seed + seed, rounds=1).as_dict()
+        for seed in range(seeds)
+        for base in prepare_configs().values()
+    }
+
+
+def work(output_dir: str, worker_id: str) -> List[str]:
+    queue = WorkQueue(Path(output_dir) / QUEUE_FILENAME)
+    return run_worker(queue, Path(output_dir), worker_id, lease_seconds=5.0, poll_interval=0.05)
+
+
+def test_each_job_completes_exactly_once_across_worker_processes(tmp_path: Path) -> None:
+    payloads = sweep_payloads(seeds=6)
+    WorkQueue(tmp_path / QUEUE_FILENAME).enqueue(payloads)
+
+    with ProcessPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(work, str(tmp_path), f"worker-{idx}") for idx in range(4)]
+        completed = [key for future in futures for key in future.result(timeout=120)]
+
+    assert sorted(completed) == sorted(payloads)
+    assert WorkQueue(tmp_path / QUEUE_FILENAME).counts() == {"done": len(payloads)}
+    for key in payloads:
+        assert (tmp_path / key / "transcript.json").exists()
+
+
+def test_lost_lease_abandons_write_and_completion(tmp_path: Path) -> None:
+    config = dataclasses.replace(prepare_configs()["toggle_two_agent"], rounds=1)
+    queue = WorkQueue(tmp_path / QUEUE_FILENAME)
+    queue.enqueue({config.key: config.as_dict()})
+
+    assert queue.claim("slow", lease_seconds=0.05) is not None
+    time.sleep(0.1)
+    reclaimed = queue.claim("fast", lease_seconds=60.0)
+    assert reclaimed is not None and reclaimed.key == config.key
+
+    heartbeat = Heartbeat(queue, config.key, "slow", lease_seconds=0.05)
+    with pytest.raises(LeaseLost):
+        run_debate(config, output_dir=tmp_path, before_persist=heartbeat.check)
+    assert not (tmp_path / config.key / "transcript.json").exists()
+    assert not queue.complete(config.key, "slow")
+    assert queue.complete(config.key, "fast")
+
+
+def test_enqueue_refreshes_pending_and_rejects_changed_finished_jobs(tmp_path: Path) -> None:
+    queue = WorkQueue(tmp_path / QUEUE_FILENAME)
+    assert queue.enqueue({"a": {"rounds": 1}, "b": {"rounds": 1}}) == 2
+
+    assert queue.enqueue({"a": {"rounds": 2}}) == 0
+    job = queue.claim("w", lease_seconds=60.0)
+    assert job is not None and job.key == "a" and job.payload == {"rounds": 2}
+    queue.complete("a", "w")
+
+    with pytest.raises(ValueError, match="a \\(done\\)"):
+        queue.enqueue({"a": {"rounds": 3}, "c": {"rounds": 1}})
+    assert queue.keys() == ["a", "b"]
+    assert queue.enqueue({"a": {"rounds": 2}}) == 0  # unchanged payloads are fine in any state
+
+
+def test_enqueue_payload_is_canonical(tmp_path: Path) -> None:
+    queue = WorkQueue(tmp_path / QUEUE_FILENAME)
+    queue.enqueue({"a": {"x": 1, "y": 2}})
+    queue.claim("w", lease_seconds=60.0)
+    # Key order differs but the payload is the same, so a leased job is not a conflict.
+    assert queue.enqueue({"a": json.loads('{"y": 2, "x": 1}')}) == 0
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import dataclasses
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from debate.transcript_index import TranscriptIndex
+from debate.writeback import PersistError, WritePipeline
+from debate_runner import prepare_configs, run_debate
+
+
+def test_failure_reports_every_failed_and_skipped_key() -> None:
+    release = threading.Event()
+    written = []
+
+    def fail() -> None:
+        release.wait()
+        raise OSError("disk full")
+
+    pipeline = WritePipeline(workers=1, max_pending=8)
+    pipeline.submit("a", lambda: written.append("a"))
+    pipeline.submit("b", fail)
+    for key in ("c", "d"):
+        pipeline.submit(key, lambda key=key: written.append(key))
+    release.set()
+
+    with pytest.raises(PersistError) as caught:
+        pipeline.close()
+    assert written == ["a"]
+    assert list(caught.value.failed) == ["b"]
+    assert caught.value.skipped == ["c", "d"]
+    assert "2 queued writes skipped: c, d" in str(caught.value)
+    assert isinstance(caught.value.__cause__, OSError)
+
+
+def test_exception_in_the_sweep_carries_the_lost_writes() -> None:
+    def fail() -> None:
+        raise OSError("disk full")
+
+    with pytest.raises(KeyError) as caught:
+        with WritePipeline(workers=1, max_pending=8) as pipeline:
+            pipeline.submit("a", fail)
+            time.sleep(0.05)  # the write fails while the sweep is still running
+            raise KeyError("sweep bug")
+    assert any("Writing a failed: disk full" in note for note in caught.value.__notes__)
+
+
+def test_four_io_workers_keep_an_existing_index_current(tmp_path: Path, monkeypatch) -> None:
+    TranscriptIndex.for_output(tmp_path)
+    active, peak = [0], [0]
+    lock = threading.Lock()
+    index_run = TranscriptIndex.index_run
+
+    def tracked(self, *args, **kwargs) -> None:
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        try:
+            time.sleep(0.005)
+            index_run(self, *args, **kwargs)
+        finally:
+            with lock:
+                active[0] -= 1
+
+    monkeypatch.setattr(TranscriptIndex, "index_run", tracked)
+    configs = [
+        dataclasses.replace(base, key=f"{base.key}_seed{seed}", seed=base.seed + seed, rounds=2)
+        for seed in range(8)
+        for base in prepare_configs().values()
+    ]
+    with WritePipeline(workers=4, max_pending=4) as writer:
+        for config in configs:
+            run_debate(config, output_dir=tmp_path, writer=writer)
+
+    assert peak[0] == 1
+    monkeypatch.undo()
+    assert TranscriptIndex.for_output(tmp_path).update(tmp_path) == {
+        "indexed": 0,
+        "removed": 0,
+        "unchanged": len(configs),
+    }